@@ -0,0 +1,83 @@
+"""
+Check that the quantized ONNX backend picks the same questionsToActions entry
+as the float sentence-transformers model on real Workday question texts.
+
+Usage (from the repository root):
+    python -m benchmarks.backend_parity [--fixture FILE] [--backend onnx-int8]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from config import Config
+from processing.question_matcher import QuestionMatcher
+from workday import questions_to_actions
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "workday_questions.txt")
+
+
+def load_questions(fixture_file):
+    with open(fixture_file, "r") as f:
+        return [
+            line.strip() for line in f if line.strip() and not line.startswith("#")
+        ]
+
+
+def timed_match(matcher, questions):
+    # Warm up first so model loading is not counted as match time
+    matcher.match(questions[:1])
+    start_time = time.time()
+    matches = matcher.match(questions)
+    return matches, time.time() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--reference", default="sentence-transformers")
+    parser.add_argument("--backend", default="onnx-int8")
+    args = parser.parse_args()
+
+    questions = load_questions(args.fixture)
+    bank = questions_to_actions(Config("./config/profile.yaml").profile)
+
+    reference = QuestionMatcher(backend=args.reference)
+    candidate = QuestionMatcher(backend=args.backend)
+    if reference.backend.name == candidate.backend.name:
+        print(f"Backend '{args.backend}' is not available, nothing to compare")
+        return 2
+    reference.load_questions(bank)
+    candidate.load_questions(bank)
+
+    reference_matches, reference_time = timed_match(reference, questions)
+    candidate_matches, candidate_time = timed_match(candidate, questions)
+
+    mismatches = 0
+    max_delta = 0.0
+    for question, (ref_match,), (cand_match,) in zip(
+        questions, reference_matches, candidate_matches
+    ):
+        ref_score, ref_index = ref_match
+        cand_score, cand_index = cand_match
+        max_delta = max(max_delta, abs(ref_score - cand_score))
+        if ref_index != cand_index:
+            mismatches += 1
+            print(
+                f"MISMATCH | Q: '{question}' | {reference.backend.name}: "
+                f"{bank[ref_index][0]} ({ref_score:.3f}) | {candidate.backend.name}: "
+                f"{bank[cand_index][0]} ({cand_score:.3f})"
+            )
+
+    print(f"\n{len(questions)} questions, {mismatches} mismatches")
+    print(f"Max score difference: {max_delta:.4f}")
+    print(
+        f"Match time: {reference.backend.name} {reference_time * 1000:.1f} ms, "
+        f"{candidate.backend.name} {candidate_time * 1000:.1f} ms"
+    )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Shared helpers for benchmarks that need a real (headless) Chrome session."""
+
+import functools
+import os
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from selenium import webdriver
+
+# Bound at import, so a benchmark timing time.sleep doesn't count the
+# server's simulated delays
+_server_sleep = time.sleep
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def headless_chrome():
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--window-size=1920,1080")
+    return webdriver.Chrome(options=options)
+
+
+def fixture_url(name):
+    return "file://" + os.path.join(FIXTURES_DIR, name)
+
+
+class CommandCounter:
+    """Counts WebDriver commands (round trips) sent through a driver"""
+
+    def __init__(self, driver):
+        self.count = 0
+        self._execute = driver.execute
+
+        def execute(command, params=None):
+            self.count += 1
+            return self._execute(command, params)
+
+        driver.execute = execute
+
+
+class FixtureServer:
+    """
+    Serves a fixtures directory over HTTP on a free local port, so pages can
+    load their scripts and data with XHR (which file:// URLs don't allow)
+    """
+
+    def __init__(self, directory=FIXTURES_DIR):
+        handler = functools.partial(_QuietHandler, directory=directory)
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def url(self, name):
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/{name}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def do_GET(self):
+        # ?delay=<ms> simulates a slow server (the query is otherwise ignored)
+        delay = parse_qs(urlparse(self.path).query).get("delay")
+        if delay:
+            _server_sleep(int(delay[0]) / 1000)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
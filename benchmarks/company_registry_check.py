@@ -0,0 +1,111 @@
+"""
+Check which CompanyRegistry updates append a line to companies.txt.
+
+Each case starts from a fresh temporary companies.txt, records a first
+sign-in and then one more update. The line count after it must match the
+expectation, and so must CompanyRegistry._is_redundant for that update.
+
+Usage (from the repository root):
+    python -m benchmarks.company_registry_check
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+from config import SIGNIN_RECORD_INTERVAL, CompanyRegistry
+
+FIRST_SIGNIN = datetime(2026, 1, 5, 9, 0, 0)
+
+
+def signin(offset, account_state="active"):
+    return {
+        "last_signin": (FIRST_SIGNIN + offset).isoformat(timespec="seconds"),
+        "account_state": account_state,
+    }
+
+
+# (name, company, metadata of the second update, whether it appends a line)
+CASES = [
+    ("same values", "acme", signin(timedelta(0)), False),
+    ("sign-in 1 hour later", "acme", signin(timedelta(hours=1)), False),
+    (
+        "sign-in just under the interval",
+        "acme",
+        signin(SIGNIN_RECORD_INTERVAL - timedelta(seconds=1)),
+        False,
+    ),
+    (
+        "sign-in exactly the interval later",
+        "acme",
+        signin(SIGNIN_RECORD_INTERVAL),
+        True,
+    ),
+    ("sign-in 25 hours later", "acme", signin(timedelta(hours=25)), True),
+    (
+        "account_state change 1 hour later",
+        "acme",
+        signin(timedelta(hours=1), account_state="locked"),
+        True,
+    ),
+    ("account_state change alone", "acme", {"account_state": "created"}, True),
+    ("subset of recorded values", "acme", {"account_state": "active"}, False),
+    ("new key", "acme", {"note": "referral"}, True),
+    ("unreadable last_signin", "acme", {"last_signin": "yesterday"}, True),
+    ("other company", "globex", signin(timedelta(0)), True),
+    ("company without metadata", "globex", {}, True),
+]
+
+
+def count_lines(path):
+    with open(path, "r") as f:
+        return sum(1 for line in f if line.strip())
+
+
+def run_case(company, metadata):
+    """Returns (whether _is_redundant said so, whether a line was appended)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        companies_file = os.path.join(tmp_dir, "companies.txt")
+        CompanyRegistry(companies_file).update("acme", **signin(timedelta(0)))
+
+        # A second registry, like another process, must see the first line
+        registry = CompanyRegistry(companies_file)
+        lines_before = count_lines(companies_file)
+        redundant = registry._is_redundant(company, metadata)
+        registry.update(company, **metadata)
+        return redundant, count_lines(companies_file) > lines_before
+
+
+def main():
+    failures = 0
+    for name, company, metadata, appends in CASES:
+        redundant, appended = run_case(company, metadata)
+        ok = appended == appends and redundant == (not appends)
+        if not ok:
+            failures += 1
+        print(
+            f"{'OK ' if ok else 'FAIL'} | {name}: expected "
+            f"{'a new line' if appends else 'no new line'}, "
+            f"appended={appended} redundant={redundant}"
+        )
+
+    # Signing in for every application must not grow the file
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        companies_file = os.path.join(tmp_dir, "companies.txt")
+        registry = CompanyRegistry(companies_file)
+        for hour in range(0, 72, 2):
+            registry.update("acme", **signin(timedelta(hours=hour)))
+        lines = count_lines(companies_file)
+    ok = lines == 3
+    failures += not ok
+    print(
+        f"{'OK ' if ok else 'FAIL'} | 36 sign-ins over 3 days: {lines} lines (expected 3)"
+    )
+
+    print(f"\n{len(CASES) + 1} cases, {failures} failures")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Compare the option-list snapshot and the type-ahead search used by
+Workday.answer_dropdown with the per-option .text reads they replaced, in
+selected option, WebDriver round trips and time per selection, on a
+190-country listbox fixture.
+
+Usage (from the repository root):
+    python -m benchmarks.dropdown_selection [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.browser import CommandCounter, fixture_url, headless_chrome
+from browser.dropdown import (
+    PROMPT_OPTION_SELECTORS,
+    click_option,
+    match_option,
+    search_prefix,
+    snapshot_options,
+)
+from browser.quiescence import wait_for_quiescence
+
+FIXTURE = "country_dropdown.html"
+
+# (values, option that should be selected)
+CASES = [
+    ("Afghanistan", "Afghanistan"),
+    (["United States", "USA"], "United States of America"),
+    ("Zimbabwe", "Zimbabwe"),
+    ("Kingdom", "United Kingdom"),
+    ("Swizterland", "Switzerland"),
+]
+
+
+def legacy_select(driver, values):
+    """The option scan answer_dropdown did before: .text per option per value"""
+    options = driver.find_elements(
+        By.CSS_SELECTOR, "ul[role='listbox'] li[role='option'] div"
+    )
+    value_list = values if isinstance(values, list) else [values]
+    best_match, best_score = None, 0
+    for option in options:
+        for value in value_list:
+            if option.text.strip().lower() == value.lower():
+                best_match, best_score = option, 1.0
+                break
+            if option.text.strip().lower().startswith(value.lower()):
+                if 0.9 > best_score:
+                    best_match, best_score = option, 0.9
+            if value.lower() in option.text.strip().lower():
+                if 0.7 > best_score:
+                    best_match, best_score = option, 0.7
+        if best_score == 1.0:
+            break
+    if best_match:
+        driver.execute_script("arguments[0].click();", best_match)
+
+
+def snapshot_select(driver, values):
+    snapshot = snapshot_options(driver)
+    index, _, _ = match_option(snapshot["labels"], values)
+    if index is not None:
+        click_option(driver, snapshot, index)
+
+
+def search_select(driver, values):
+    snapshot = snapshot_options(driver)
+    value = values[0] if isinstance(values, list) else values
+    snapshot["search_box"].send_keys(search_prefix(value, snapshot["labels"]))
+    wait_for_quiescence(driver, quiet_ms=300, timeout=5)
+    results = snapshot_options(driver, PROMPT_OPTION_SELECTORS)
+    # An unfiltered list means the prefix went into another prompt's search
+    # box; that counts as a failed selection
+    if len(results["labels"]) >= len(snapshot["labels"]):
+        return
+    index, _, _ = match_option(results["labels"], values)
+    if index is not None:
+        click_option(driver, results, index)
+
+
+def measure(driver, counter, select, values, repeat):
+    elapsed = 0
+    for _ in range(repeat):
+        driver.get(fixture_url(FIXTURE))
+        counter.count = 0
+        start_time = time.perf_counter()
+        select(driver, values)
+        elapsed += time.perf_counter() - start_time
+    trips = counter.count
+    selected = driver.find_element(By.ID, "country").text
+    return selected, trips, elapsed / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    driver = headless_chrome()
+    counter = CommandCounter(driver)
+    failures = 0
+    try:
+        print(
+            f"{'values':<30}{'legacy trips':>13}{'ms':>9}"
+            f"{'snapshot trips':>16}{'ms':>9}{'search trips':>14}{'ms':>9}  selected"
+        )
+        for values, expected in CASES:
+            legacy, legacy_trips, legacy_time = measure(
+                driver, counter, legacy_select, values, args.repeat
+            )
+            selected, snapshot_trips, snapshot_time = measure(
+                driver, counter, snapshot_select, values, args.repeat
+            )
+            searched, search_trips, search_time = measure(
+                driver, counter, search_select, values, args.repeat
+            )
+            failures += (selected != expected) + (searched != expected)
+            print(
+                f"{str(values):<30}{legacy_trips:>13}{legacy_time * 1000:>9.1f}"
+                f"{snapshot_trips:>16}{snapshot_time * 1000:>9.1f}"
+                f"{search_trips:>14}{search_time * 1000:>9.1f}  {selected}"
+                f" (legacy: {legacy}, search: {searched})"
+            )
+    finally:
+        driver.quit()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""
+Regression check that the in-page element classifier returns the same types
+as Workday._detect_element_type, and how many round trips each one needs.
+
+Cases with a data-expected attribute must also classify as that type.
+
+Usage (from the repository root):
+    python -m benchmarks.element_type_parity [--fixture FILE]
+"""
+
+import argparse
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.browser import fixture_url, headless_chrome
+from browser.dom_extraction import ElementTypeCache
+from workday import Workday
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixture", default="element_types.html")
+    args = parser.parse_args()
+
+    driver = headless_chrome()
+    try:
+        driver.get(fixture_url(args.fixture))
+        cases = driver.find_elements(By.CSS_SELECTOR, ".case")
+        names = [case.get_attribute("data-case") for case in cases]
+        expected_types = [case.get_attribute("data-expected") for case in cases]
+        targets = [case.find_element(By.CSS_SELECTOR, "[data-target]") for case in cases]
+
+        # _detect_element_type only looks at the element, so no browser/profile setup is needed
+        workday = Workday.__new__(Workday)
+        start_time = time.time()
+        python_types = [workday._detect_element_type(target) for target in targets]
+        python_time = time.time() - start_time
+
+        cache = ElementTypeCache(driver)
+        start_time = time.time()
+        script_types = cache.classify(targets)
+        script_time = time.time() - start_time
+
+        # A second lookup must come from the memo without touching the browser
+        start_time = time.time()
+        cache.classify(targets)
+        memo_time = time.time() - start_time
+    finally:
+        driver.quit()
+
+    mismatches = 0
+    wrong = 0
+    for name, expected, python_type, script_type in zip(
+        names, expected_types, python_types, script_types
+    ):
+        status = "OK " if python_type == script_type else "MISMATCH"
+        if python_type != script_type:
+            mismatches += 1
+        elif expected and python_type != expected:
+            status = "WRONG"
+            wrong += 1
+        print(f"{status} | {name}: python={python_type} script={script_type}")
+
+    print(
+        f"\n{len(targets)} elements, {mismatches} mismatches, "
+        f"{wrong} not of their expected type"
+    )
+    print(
+        f"Python classifier: {python_time * 1000:.0f} ms, in-page classifier: "
+        f"{script_time * 1000:.0f} ms (1 round trip), memoized: {memo_time * 1000:.2f} ms"
+    )
+    return 1 if mismatches or wrong else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
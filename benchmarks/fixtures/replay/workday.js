@@ -0,0 +1,135 @@
+// Stand-in for the Workday widgets on the replay pages. The markup of each
+// page is what Workday renders; this script only reproduces the behaviour
+// the automation interacts with. Option lists are loaded over XHR from the
+// data-replay-options URL, like Workday loads them from its API.
+//
+// Optional attributes on <body> slow the page down like a busy tenant:
+// data-replay-xhr-ms delays every option list response, and
+// data-replay-rerender-ms re-renders a field that long after it is answered
+// (Workday validates answers with a request and then redraws the field).
+
+const xhrDelay = Number(document.body.dataset.replayXhrMs || 0);
+const rerenderDelay = Number(document.body.dataset.replayRerenderMs || 0);
+
+function rerender(widget) {
+  if (!rerenderDelay) {
+    return;
+  }
+  const field = widget.closest("[data-automation-id^='formField-']") || widget;
+  setTimeout(() => {
+    const status = document.createElement("div");
+    status.setAttribute("data-automation-id", "fieldValidation");
+    field.appendChild(status);
+    field.setAttribute("data-replay-rendered", String(Date.now()));
+    status.remove();
+  }, rerenderDelay);
+}
+
+function closePopups() {
+  document.querySelectorAll("[data-automation-id='activeListContainer']").forEach((popup) => popup.remove());
+}
+
+function loadOptions(widget) {
+  const source = widget.getAttribute("data-replay-options");
+  if (!source.endsWith(".json")) {
+    return Promise.resolve(source.split("|"));
+  }
+  return new Promise((resolve) => {
+    const request = new XMLHttpRequest();
+    // The fixture server holds the response for ?delay= milliseconds
+    request.open("GET", xhrDelay ? `${source}?delay=${xhrDelay}` : source);
+    request.addEventListener("load", () => resolve(JSON.parse(request.responseText)));
+    request.send();
+  });
+}
+
+function openPopup(anchor) {
+  closePopups();
+  const popup = document.createElement("div");
+  popup.setAttribute("data-automation-id", "activeListContainer");
+  anchor.insertAdjacentElement("afterend", popup);
+  return popup;
+}
+
+// Single-select dropdowns: a button that opens a listbox of every option
+document.querySelectorAll("button[aria-haspopup='listbox']").forEach((button) => {
+  button.addEventListener("click", () => {
+    loadOptions(button).then((options) => {
+      const popup = openPopup(button);
+      const listbox = document.createElement("ul");
+      listbox.setAttribute("role", "listbox");
+      for (const label of options) {
+        const option = document.createElement("li");
+        option.setAttribute("role", "option");
+        const text = document.createElement("div");
+        text.textContent = label;
+        option.appendChild(text);
+        option.addEventListener("click", () => {
+          button.textContent = label;
+          button.value = label;
+          closePopups();
+          rerender(button);
+        });
+        listbox.appendChild(option);
+      }
+      popup.appendChild(listbox);
+    });
+  });
+});
+
+// Prompts: a search box whose results are fetched as you type, and pills
+// for the selected items
+document.querySelectorAll("[data-automation-id^='multiselectInputContainer']").forEach((container) => {
+  const input = container.querySelector("input[data-automation-id='searchBox']");
+  let pending = null;
+
+  const select = (label) => {
+    const pill = document.createElement("div");
+    pill.className = "selectedItem pill";
+    pill.setAttribute("data-automation-id", "selectedItem");
+    pill.textContent = label;
+    container.insertBefore(pill, input);
+    input.value = "";
+    closePopups();
+    rerender(container);
+  };
+
+  const search = () => {
+    const query = input.value.trim().toLowerCase();
+    loadOptions(container).then((options) => {
+      const popup = openPopup(container);
+      for (const label of options.filter((label) => label.toLowerCase().includes(query))) {
+        const option = document.createElement("div");
+        option.setAttribute("role", "option");
+        option.setAttribute("data-automation-id", "promptOption");
+        option.textContent = label;
+        option.addEventListener("click", () => select(label));
+        popup.appendChild(option);
+      }
+    });
+  };
+
+  input.addEventListener("input", () => {
+    clearTimeout(pending);
+    pending = setTimeout(search, 150);
+  });
+  input.addEventListener("keydown", (event) => {
+    if (event.key !== "Enter") {
+      return;
+    }
+    // Enter searches right away, or picks the first result once shown
+    const first = document.querySelector("[data-automation-id='promptOption']");
+    if (first) {
+      first.click();
+    } else {
+      clearTimeout(pending);
+      search();
+    }
+  });
+});
+
+// Text inputs, radios, checkboxes and date parts are native; only the
+// re-render after an answer needs adding
+document.querySelectorAll("form input:not([data-automation-id='searchBox'])").forEach((input) => {
+  input.addEventListener("change", () => rerender(input));
+});
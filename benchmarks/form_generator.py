@@ -0,0 +1,265 @@
+"""
+Generator of synthetic Workday-shaped application pages for scaling
+benchmarks.
+
+Pages have any number of required fields (the abbr "*" markers
+handle_questions looks for), mixed from text inputs, listbox dropdowns,
+radio groups, multiselect prompts and date widgets, with dropdowns and
+prompts of any size. The body can ask the widget script for slow option
+lists and delayed re-renders after each answer. The output directory is a
+replay fixtures directory, so the pages run with benchmarks.form_replay.
+
+Question texts are keywords from the question bank, so every question is
+answered by the exact tier and the timings don't depend on the model.
+
+Usage (from the repository root):
+    python -m benchmarks.form_generator --out DIR [--fields 20] [--options 100]
+        [--answer-position last] [--xhr-ms 0] [--rerender-ms 0]
+    python -m benchmarks.form_replay --pages DIR
+"""
+
+import argparse
+import html
+import itertools
+import json
+import os
+import shutil
+
+import yaml
+
+REPLAY_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures", "replay"
+)
+
+# Fields are added in this order, over and over, until the page has enough
+KIND_CYCLE = ("text", "dropdown", "radio", "multiselect", "dropdown", "text", "date")
+
+# (question, profile key the answer comes from)
+TEXT_QUESTIONS = [
+    ("First Name", "first_name"),
+    ("Last Name", "family_name"),
+    ("Email", "email"),
+    ("Address Line 1", "address_line_1"),
+    ("City", "address_city"),
+    ("Postal Code", "address_postal_code"),
+    ("Phone Number", "phone_number"),
+]
+
+# (question, the bank's answer, the option that answer should select)
+DROPDOWN_QUESTIONS = [
+    ("Gender", "Male", "Male"),
+    ("Veteran Status", "I am not", "I am not a protected veteran"),
+    ("Hispanic or Latino", "No", "No"),
+    ("Phone Device Type", "Mobile", "Mobile"),
+    ("Are you legally eligible to work", "Yes", "Yes"),
+    ("Do you require sponsorship", "No", "No"),
+]
+
+RADIO_QUESTIONS = [
+    ("Are you at least 18 years of age?", "Yes"),
+    ("Have you previously been employed", "No"),
+]
+
+MULTISELECT_QUESTIONS = [("How did you hear about us", "LinkedIn", "LinkedIn")]
+
+DATE_QUESTIONS = ["Date"]
+
+
+def _options(correct, size, position):
+    """size option labels with correct at the first, middle or last position"""
+    # Filler labels share no words with any answer, so only correct matches
+    fillers = [f"Choice {number:04d}" for number in range(1, max(size, 1))]
+    index = {"first": 0, "middle": len(fillers) // 2, "last": len(fillers)}[position]
+    return fillers[:index] + [correct] + fillers[index:]
+
+
+def _field(automation_id, question, body):
+    return f"""
+    <div data-automation-id="formField-{automation_id}">
+      <label id="label-{automation_id}">{html.escape(question)}<abbr title="required">*</abbr></label>
+      <div>
+        {body}
+      </div>
+    </div>
+"""
+
+
+def generate_page(
+    name,
+    fields=20,
+    options=100,
+    answer_position="last",
+    xhr_ms=0,
+    rerender_ms=0,
+    step=2,
+    profile=None,
+):
+    """
+    Build one synthetic page
+
+    Args:
+        name: str - File name stem, also used to name the option list files
+        fields: int - Number of required fields
+        options: int - Number of options in each dropdown and prompt
+        answer_position: str - Where the right option is: first, middle or last
+        xhr_ms: int - Delay of every option list response
+        rerender_ms: int - Delay before a field re-renders after it is answered
+        step: int - The application step handle_questions is told it is on
+        profile: dict - Profile the text answers come from
+
+    Returns:
+        tuple: (page HTML, pages.json entry, {file name: option list})
+    """
+    profile = profile or {}
+    counters = {kind: itertools.count() for kind in set(KIND_CYCLE)}
+    markup, expected, option_files = [], {}, {}
+
+    for index, kind in zip(range(fields), itertools.cycle(KIND_CYCLE)):
+        number = next(counters[kind])
+        if kind == "text":
+            question, key = TEXT_QUESTIONS[number % len(TEXT_QUESTIONS)]
+            automation_id = f"textField-{index}"
+            answer = str(profile.get(key) or "")
+            body = (
+                f'<input type="text" id="input-{index}" '
+                f'data-automation-id="{automation_id}" aria-required="true">'
+            )
+            expected[automation_id] = {"answer": answer, "filled": answer}
+        elif kind in ("dropdown", "multiselect"):
+            questions = (
+                DROPDOWN_QUESTIONS if kind == "dropdown" else MULTISELECT_QUESTIONS
+            )
+            question, answer, correct = questions[number % len(questions)]
+            option_file = f"{name}_options_{index}.json"
+            option_files[option_file] = _options(correct, options, answer_position)
+            if kind == "dropdown":
+                automation_id = f"dropdown-{index}"
+                body = (
+                    f'<button type="button" aria-haspopup="listbox" '
+                    f'aria-labelledby="label-{automation_id}" '
+                    f'data-automation-id="{automation_id}" '
+                    f'data-replay-options="{option_file}" value="">Select One</button>'
+                )
+            else:
+                automation_id = f"multiselectInputContainer-{index}"
+                body = (
+                    f'<div data-automation-id="{automation_id}" '
+                    f'data-replay-options="{option_file}">'
+                    f'<input type="text" data-automation-id="searchBox" '
+                    f'placeholder="Search"></div>'
+                )
+            expected[automation_id] = {"answer": answer, "filled": correct}
+        elif kind == "radio":
+            question, answer = RADIO_QUESTIONS[number % len(RADIO_QUESTIONS)]
+            automation_id = f"radioGroup-{index}"
+            radios = "".join(
+                f'<div class="css-1utp272">'
+                f'<input type="radio" id="radio-{index}-{label}" '
+                f'name="radio-{index}" value="{label.lower()}">'
+                f'<label for="radio-{index}-{label}">{label}</label></div>'
+                for label in ("Yes", "No")
+            )
+            body = (
+                f'<div role="radiogroup" data-automation-id="{automation_id}">'
+                f"{radios}</div>"
+            )
+            expected[automation_id] = {"answer": answer, "filled": answer}
+        else:
+            question = DATE_QUESTIONS[number % len(DATE_QUESTIONS)]
+            automation_id = f"dateInputWrapper-{index}"
+            body = (
+                f'<div data-automation-id="{automation_id}">'
+                + "".join(
+                    f'<input type="text" placeholder="{part}">'
+                    for part in ("MM", "DD", "YYYY")
+                )
+                + "</div>"
+            )
+            # Filled with today's date; any date counts
+            expected[automation_id] = {"answer": None, "filled": None}
+        markup.append(_field(automation_id, question, body))
+
+    page = f"""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>{html.escape(name)}</title></head>
+<body data-replay-xhr-ms="{xhr_ms}" data-replay-rerender-ms="{rerender_ms}">
+<div data-automation-id="applyFlowPage">
+  <h2 data-automation-id="pageHeader">Synthetic page: {fields} fields, {options} options</h2>
+  <div data-automation-id="requiredFieldsLegend"><abbr title="required">*</abbr> Indicates a required field</div>
+  <form>{"".join(markup)}  </form>
+  <button type="button" data-automation-id="bottom-navigation-next-button">Save and Continue</button>
+</div>
+<script src="workday.js"></script>
+</body>
+</html>
+"""
+    entry = {"file": f"{name}.html", "step": step, "fields": expected}
+    return page, entry, option_files
+
+
+def write_pages(out_dir, page_specs):
+    """
+    Write synthetic pages as a replay fixtures directory
+
+    Args:
+        out_dir: str - Directory to write to, created if needed
+        page_specs: list[dict] - generate_page keyword arguments, one per page
+
+    Returns:
+        dict: The pages.json manifest that was written
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    for shared in ("workday.js", "profile.yaml"):
+        shutil.copy(os.path.join(REPLAY_DIR, shared), os.path.join(out_dir, shared))
+    with open(os.path.join(REPLAY_DIR, "profile.yaml"), "r") as f:
+        profile = yaml.safe_load(f)
+
+    manifest = {"profile": "profile.yaml", "pages": []}
+    for spec in page_specs:
+        page, entry, option_files = generate_page(profile=profile, **spec)
+        with open(os.path.join(out_dir, entry["file"]), "w") as f:
+            f.write(page)
+        for file_name, labels in option_files.items():
+            with open(os.path.join(out_dir, file_name), "w") as f:
+                json.dump(labels, f)
+        manifest["pages"].append(entry)
+
+    with open(os.path.join(out_dir, "pages.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--out", required=True, help="Directory to write the page to")
+    parser.add_argument("--name", default="synthetic")
+    parser.add_argument("--fields", type=int, default=20)
+    parser.add_argument("--options", type=int, default=100)
+    parser.add_argument(
+        "--answer-position", choices=("first", "middle", "last"), default="last"
+    )
+    parser.add_argument("--xhr-ms", type=int, default=0)
+    parser.add_argument("--rerender-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    manifest = write_pages(
+        args.out,
+        [
+            {
+                "name": args.name,
+                "fields": args.fields,
+                "options": args.options,
+                "answer_position": args.answer_position,
+                "xhr_ms": args.xhr_ms,
+                "rerender_ms": args.rerender_ms,
+            }
+        ],
+    )
+    print(
+        f"Wrote {manifest['pages'][0]['file']} to {args.out}; replay it with "
+        f"python -m benchmarks.form_replay --pages {args.out}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,323 @@
+"""
+Offline replay benchmark of Workday application pages.
+
+Drives Workday.handle_questions (and through it answer_dropdown,
+select_radio, handle_multiselect, ...) against captured pages served from a
+local HTTP server, in headless Chrome.
+
+Per page it reports wall time, WebDriver round trips, time spent in
+time.sleep, in condition waits and in _wait_for_element_stability, how
+many questions resolved to the expected answer and how many fields ended up
+with the expected value.
+Results can be saved as JSON and compared with a run from another commit.
+
+Each run starts from an empty temporary working directory, so learned wait
+timings, embedding caches and learned answers from earlier runs (or from
+real applications) don't affect the numbers.
+
+Usage (from the repository root):
+    python -m benchmarks.form_replay [--repeat 3] [--output results.json]
+        [--baseline results.json] [--pages DIR]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPLAY_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures", "replay")
+# The run happens in a temporary directory; keep the repository importable
+# for the modules Workday imports lazily
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.browser import CommandCounter, FixtureServer, headless_chrome
+from browser.dom_extraction import extract_questions
+from browser.session_pool import BrowserSession
+from processing.job_runner import ManualInputRequired
+from workday import Workday
+
+# What each field on the page ended up with: the value of text inputs, the
+# text of dropdown buttons, the label of the checked radio, the selected
+# pills of prompts, MM/DD/YYYY of date widgets and checked/unchecked for
+# checkboxes
+FIELD_STATE_JS = """
+const state = {};
+for (const automationId of arguments[0]) {
+    const field = document.querySelector(`[data-automation-id="${automationId}"]`);
+    if (!field) {
+        state[automationId] = null;
+    } else if (field.matches('input[type="checkbox"]')) {
+        state[automationId] = field.checked ? 'checked' : 'unchecked';
+    } else if (field.matches('input')) {
+        state[automationId] = field.value;
+    } else if (field.matches('button')) {
+        state[automationId] = field.textContent.trim();
+    } else if (field.querySelector('input[placeholder="MM"]')) {
+        state[automationId] = Array.from(field.querySelectorAll('input'))
+            .map((input) => input.value)
+            .join('/');
+    } else if (field.querySelector('input[type="radio"]')) {
+        const checked = field.querySelector('input[type="radio"]:checked');
+        const label = checked && document.querySelector(`label[for="${checked.id}"]`);
+        state[automationId] = label ? label.textContent.trim() : null;
+    } else {
+        state[automationId] = Array.from(field.querySelectorAll('.pill'))
+            .map((pill) => pill.textContent.trim())
+            .join(', ');
+    }
+}
+return state;
+"""
+
+
+class SleepMeter:
+    """Adds up the time spent in time.sleep while installed"""
+
+    def __init__(self):
+        self.seconds = 0.0
+        self._sleep = time.sleep
+
+        def sleep(seconds):
+            self.seconds += seconds
+            self._sleep(seconds)
+
+        time.sleep = sleep
+
+    def uninstall(self):
+        time.sleep = self._sleep
+
+
+def is_filled(value, expected):
+    """Whether a field's value is the expected one (None: anything non-empty)"""
+    if expected is None:
+        return bool((value or "").strip("/ "))
+    return (value or "").lower() == expected.lower()
+
+
+class Replay:
+    """
+    One Workday, in headless Chrome, answering pages from a replay fixtures
+    directory (pages.json plus the pages it lists)
+    """
+
+    def __init__(self, pages_dir):
+        self.pages_dir = os.path.abspath(pages_dir)
+        with open(os.path.join(self.pages_dir, "pages.json"), "r") as f:
+            self.manifest = json.load(f)
+
+    def __enter__(self):
+        self._cwd = os.getcwd()
+        workdir = tempfile.mkdtemp(prefix="workday-replay-")
+        os.makedirs(os.path.join(workdir, "config"))
+        os.chdir(workdir)
+
+        self.sleeps = SleepMeter()
+        self.session = BrowserSession(headless_chrome(), "replay", 0)
+        self.counter = CommandCounter(self.session.driver)
+        self.server = FixtureServer(self.pages_dir).__enter__()
+        self.workday = Workday(
+            self.server.url(self.manifest["pages"][0]["file"]),
+            interactive=False,
+            session=self.session,
+            profile_file=os.path.join(self.pages_dir, self.manifest["profile"]),
+        )
+        self.workday.waits.tenant = "replay"
+
+        # Time every _wait_for_element_stability call
+        self.stability = {"calls": 0, "seconds": 0.0}
+        wait_for_element_stability = self.workday._wait_for_element_stability
+
+        def timed_wait_for_element_stability(*args, **kwargs):
+            start_time = time.perf_counter()
+            try:
+                return wait_for_element_stability(*args, **kwargs)
+            finally:
+                self.stability["calls"] += 1
+                self.stability["seconds"] += time.perf_counter() - start_time
+
+        self.workday._wait_for_element_stability = timed_wait_for_element_stability
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            self.session.quit()
+            self.server.__exit__(*exc_info)
+        finally:
+            self.sleeps.uninstall()
+            os.chdir(self._cwd)
+
+    def _waited(self):
+        return sum(
+            stats["waited"] for stats in self.workday.waits.stats.session.values()
+        )
+
+    def _resolution_accuracy(self, fields):
+        """Questions on the current page whose resolved answer is the expected one"""
+        extracted = extract_questions(self.workday.driver)
+        resolutions = self.workday._question_resolver().resolve(
+            [item["question"] for item in extracted]
+        )
+        correct = 0
+        for item, resolution in zip(extracted, resolutions):
+            expected = fields.get(item["automation_id"])
+            if expected is not None and resolution is not None:
+                correct += resolution.value == expected["answer"]
+        return correct, len(extracted)
+
+    def run(self, page, repeat=1):
+        """
+        Answer a page repeat times
+
+        Args:
+            page: dict - The page's pages.json entry
+            repeat: int - Number of runs; timings are the median over them
+
+        Returns:
+            dict: The page's results
+        """
+        driver = self.workday.driver
+        fields = page["fields"]
+        runs = []
+        for run in range(repeat):
+            driver.get(self.server.url(page["file"]))
+            if run == 0:
+                # Also loads the matcher, so that isn't part of the timed run
+                resolved, questions = self._resolution_accuracy(fields)
+                driver.get(self.server.url(page["file"]))
+
+            self.counter.count = 0
+            self.sleeps.seconds = 0.0
+            self.stability.update(calls=0, seconds=0.0)
+            waited_before = self._waited()
+            aborted = None
+            start_time = time.perf_counter()
+            try:
+                self.workday.handle_questions(page["step"])
+            except ManualInputRequired as e:
+                aborted = str(e)
+            wall = time.perf_counter() - start_time
+            trips = self.counter.count
+            waited = self._waited() - waited_before
+
+            state = driver.execute_script(FIELD_STATE_JS, list(fields))
+            filled = sum(
+                is_filled(state.get(automation_id), expected["filled"])
+                for automation_id, expected in fields.items()
+            )
+            runs.append(
+                {
+                    "wall": wall,
+                    "trips": trips,
+                    "sleep": self.sleeps.seconds,
+                    "waited": waited,
+                    "stability_calls": self.stability["calls"],
+                    "stability": self.stability["seconds"],
+                    "filled": filled,
+                    "aborted": aborted,
+                    "state": state,
+                }
+            )
+
+        result = {
+            key: statistics.median(run[key] for run in runs)
+            for key in (
+                "wall",
+                "trips",
+                "sleep",
+                "waited",
+                "stability_calls",
+                "stability",
+            )
+        }
+        result.update(
+            questions=questions,
+            resolved=resolved,
+            fields=len(fields),
+            # Accuracy is taken from the worst run
+            filled=min(run["filled"] for run in runs),
+            aborted=next((run["aborted"] for run in runs if run["aborted"]), None),
+            state=runs[-1]["state"],
+        )
+        return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results, baseline=None):
+    print(
+        f"\n{'page':<30}{'wall s':>8}{'trips':>7}{'sleep s':>9}{'waits s':>9}"
+        f"{'stable s':>10}{'resolved':>10}{'filled':>8}"
+    )
+    for name, page in results["pages"].items():
+        print(
+            f"{name:<30}{page['wall']:>8.2f}{page['trips']:>7.0f}{page['sleep']:>9.2f}"
+            f"{page['waited']:>9.2f}{page['stability']:>10.2f}"
+            f"{page['resolved']:>6}/{page['questions']:<3}"
+            f"{page['filled']:>4}/{page['fields']:<3}"
+        )
+        if page["aborted"]:
+            print(f"    aborted, needed manual input: {page['aborted']}")
+        before = (baseline or {}).get("pages", {}).get(name)
+        if before:
+            print(
+                f"    vs {baseline.get('commit')}: "
+                f"wall {page['wall'] - before['wall']:+.2f}s, "
+                f"trips {page['trips'] - before['trips']:+.0f}, "
+                f"filled {page['filled'] - before['filled']:+d}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--pages", default=REPLAY_DIR, help="Replay fixtures directory")
+    parser.add_argument("--output", help="Save the results as JSON")
+    parser.add_argument(
+        "--baseline", help="Results JSON of an earlier run to compare with"
+    )
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.output) if args.output else None
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+
+    results = {
+        "commit": git_commit(),
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "repeat": args.repeat,
+        "pages": {},
+    }
+    with Replay(args.pages) as replay:
+        for page in replay.manifest["pages"]:
+            print(f"\n===== Replaying {page['file']} =====")
+            results["pages"][page["file"]] = replay.run(page, args.repeat)
+
+    print_results(results, baseline)
+    if output:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults saved to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
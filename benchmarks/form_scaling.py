@@ -0,0 +1,110 @@
+"""
+How handle_questions and _wait_for_element_stability scale with the number
+of fields on a page and the number of options per dropdown.
+
+Generates a synthetic page for every (fields, options) combination, replays
+them all in one browser and prints one row per page. Save the rows as CSV
+to plot them; round trips growing with options (not just fields) is the
+O(fields x options) behaviour this is meant to catch.
+
+Usage (from the repository root):
+    python -m benchmarks.form_scaling [--fields 5,10,20,40] [--options 10,100,500]
+        [--xhr-ms 0] [--rerender-ms 0] [--answer-position last] [--repeat 1]
+        [--csv scaling.csv]
+"""
+
+import argparse
+import csv
+import os
+import sys
+import tempfile
+
+from benchmarks.form_generator import write_pages
+from benchmarks.form_replay import Replay, git_commit
+
+COLUMNS = [
+    "fields",
+    "options",
+    "wall",
+    "trips",
+    "trips_per_field",
+    "sleep",
+    "waited",
+    "stability_calls",
+    "stability",
+    "resolved",
+    "filled",
+]
+
+
+def int_list(value):
+    return [int(item) for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fields", type=int_list, default=[5, 10, 20, 40])
+    parser.add_argument("--options", type=int_list, default=[10, 100, 500])
+    parser.add_argument("--xhr-ms", type=int, default=0)
+    parser.add_argument("--rerender-ms", type=int, default=0)
+    parser.add_argument(
+        "--answer-position", choices=("first", "middle", "last"), default="last"
+    )
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--csv", help="Save the rows as CSV")
+    args = parser.parse_args()
+
+    output = os.path.abspath(args.csv) if args.csv else None
+    pages_dir = tempfile.mkdtemp(prefix="workday-synthetic-")
+    specs = [
+        {
+            "name": f"fields{fields}_options{options}",
+            "fields": fields,
+            "options": options,
+            "answer_position": args.answer_position,
+            "xhr_ms": args.xhr_ms,
+            "rerender_ms": args.rerender_ms,
+        }
+        for fields in args.fields
+        for options in args.options
+    ]
+    manifest = write_pages(pages_dir, specs)
+    print(f"Generated {len(specs)} pages in {pages_dir}")
+
+    rows = []
+    with Replay(pages_dir) as replay:
+        for spec, page in zip(specs, manifest["pages"]):
+            print(f"\n===== Replaying {page['file']} =====")
+            result = replay.run(page, args.repeat)
+            rows.append(
+                {
+                    "fields": spec["fields"],
+                    "options": spec["options"],
+                    "wall": round(result["wall"], 3),
+                    "trips": result["trips"],
+                    "trips_per_field": round(result["trips"] / spec["fields"], 1),
+                    "sleep": round(result["sleep"], 3),
+                    "waited": round(result["waited"], 3),
+                    "stability_calls": result["stability_calls"],
+                    "stability": round(result["stability"], 3),
+                    "resolved": f"{result['resolved']}/{result['questions']}",
+                    "filled": f"{result['filled']}/{result['fields']}",
+                }
+            )
+
+    print(f"\nCommit {git_commit()}, answer position {args.answer_position}")
+    print("".join(f"{column:>17}" for column in COLUMNS))
+    for row in rows:
+        print("".join(f"{str(row[column]):>17}" for column in COLUMNS))
+
+    if output:
+        with open(output, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"\nRows saved to {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
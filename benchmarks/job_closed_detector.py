@@ -0,0 +1,97 @@
+"""
+Compare the single-script job-closed detector with the per-marker
+find_elements checks it replaced, in verdicts, WebDriver round trips and
+time per check, on saved page fixtures.
+
+Usage (from the repository root):
+    python -m benchmarks.job_closed_detector [--repeat 20]
+"""
+
+import argparse
+import sys
+import time
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.browser import CommandCounter, fixture_url, headless_chrome
+from browser.job_status import detect_job_closed
+
+FIXTURES = {
+    "job_open.html": False,
+    "job_closed_message.html": True,
+    "job_closed_phrase.html": True,
+}
+
+# What Workday._check_if_job_closed_or_error looked for before
+LEGACY_MESSAGES = [
+    "//div[contains(text(), 'no longer accepting applications')]",
+    "//div[contains(text(), 'position has been filled')]",
+    "//div[contains(text(), 'job posting has closed')]",
+    "//div[contains(text(), 'position is no longer available')]",
+    "//p[contains(text(), 'no longer accepting')]",
+    "//div[contains(text(), 'has been removed')]",
+]
+LEGACY_PHRASES = [
+    "no longer accepting",
+    "position filled",
+    "job closed",
+    "posting closed",
+    "position unavailable",
+    "job has been removed",
+    "requisition closed",
+]
+
+
+def legacy_detect_job_closed(driver):
+    for message_xpath in LEGACY_MESSAGES:
+        if driver.find_elements(By.XPATH, message_xpath):
+            return True
+    page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
+    return any(phrase in page_text for phrase in LEGACY_PHRASES)
+
+
+def measure(driver, counter, check, repeat):
+    counter.count = 0
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        closed = check(driver)
+    elapsed = (time.perf_counter() - start_time) / repeat
+    return closed, counter.count / repeat, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    driver = headless_chrome()
+    counter = CommandCounter(driver)
+    failures = 0
+    try:
+        print(
+            f"{'fixture':<26}{'expected':>9}{'legacy':>8}{'trips':>7}{'ms':>8}"
+            f"{'script':>8}{'trips':>7}{'ms':>8}  match"
+        )
+        for fixture, expected in FIXTURES.items():
+            driver.get(fixture_url(fixture))
+            legacy, legacy_trips, legacy_time = measure(
+                driver, counter, legacy_detect_job_closed, args.repeat
+            )
+            verdict, script_trips, script_time = measure(
+                driver, counter, detect_job_closed, args.repeat
+            )
+            if verdict["closed"] != expected:
+                failures += 1
+            print(
+                f"{fixture:<26}{str(expected):>9}{str(legacy):>8}{legacy_trips:>7.0f}"
+                f"{legacy_time * 1000:>8.1f}{str(verdict['closed']):>8}"
+                f"{script_trips:>7.0f}{script_time * 1000:>8.1f}  {verdict['match']}"
+            )
+    finally:
+        driver.quit()
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,64 @@
+"""
+WebDriver round trips spent on log output, per replayed page.
+
+Replays every page at each log level and prints the round trips per level.
+Element details (tag names, texts, attributes) are only read from the
+browser when debug is enabled, so the difference between the debug and the
+quiet columns is what the debug output costs.
+
+Usage (from the repository root):
+    python -m benchmarks.logging_overhead [--pages DIR] [--repeat 1]
+        [--levels debug,info,warning]
+"""
+
+import argparse
+import sys
+
+from benchmarks.form_replay import REPLAY_DIR, Replay, git_commit
+from processing import structured_log
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--pages", default=REPLAY_DIR, help="Replay fixtures directory")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument(
+        "--levels",
+        type=lambda value: [level for level in value.split(",") if level],
+        default=["debug", "info", "warning"],
+        help="Log levels to compare, most verbose first",
+    )
+    args = parser.parse_args()
+
+    rows = {}
+    with Replay(args.pages) as replay:
+        for page in replay.manifest["pages"]:
+            rows[page["file"]] = {}
+            for level in args.levels:
+                print(f"\n===== Replaying {page['file']} at {level} =====")
+                structured_log.set_level(level)
+                result = replay.run(page, args.repeat)
+                rows[page["file"]][level] = (result["trips"], result["wall"])
+    structured_log.set_level("info")
+
+    verbose, quiet = args.levels[0], args.levels[-1]
+    print(f"\nCommit {git_commit()}, round trips (wall s) per page")
+    print(
+        f"{'page':<30}"
+        + "".join(f"{level:>16}" for level in args.levels)
+        + f"{'removed':>10}"
+    )
+    for name, levels in rows.items():
+        print(
+            f"{name:<30}"
+            + "".join(
+                f"{levels[level][0]:>8.0f} ({levels[level][1]:>5.2f})"
+                for level in args.levels
+            )
+            + f"{levels[verbose][0] - levels[quiet][0]:>10.0f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Micro-benchmark of the regex negation matcher against the previous
+nltk-based Workday.detect_negation, plus where the two disagree.
+
+The old implementation needs nltk (and its punkt tokenizer), which the
+application itself no longer depends on.
+
+Usage (from the repository root):
+    python -m benchmarks.negation_benchmark [--fixture FILE] [--repeat 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from processing.negation import NEGATIVE_PHRASES, NEGATIVE_WORDS, is_negative
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "dropdown_options.txt")
+
+
+def load_options(fixture_file):
+    with open(fixture_file, "r") as f:
+        return [
+            line.strip() for line in f if line.strip() and not line.startswith("#")
+        ]
+
+
+def nltk_detect_negation():
+    """The detect_negation implementation the regex matcher replaced"""
+    import nltk
+    from nltk.tokenize import NLTKWordTokenizer, word_tokenize
+
+    # nltk >= 3.8.2 loads punkt_tab instead of punkt
+    for resource in ("punkt", "punkt_tab"):
+        try:
+            nltk.data.find(f"tokenizers/{resource}")
+        except LookupError:
+            nltk.download(resource, quiet=True)
+    try:
+        word_tokenize("No")
+    except LookupError:
+        # Options are single sentences, so skipping punkt's sentence split
+        # gives the same tokens
+        print("punkt data unavailable, using nltk's word tokenizer without it")
+        word_tokenize = NLTKWordTokenizer().tokenize
+
+    negative_words = set(NEGATIVE_WORDS)
+
+    def detect_negation(text):
+        tokens = word_tokenize(text.lower())
+        has_negative = any(word in negative_words for word in tokens)
+        has_negative_phrase = any(phrase in text.lower() for phrase in NEGATIVE_PHRASES)
+        return has_negative or has_negative_phrase
+
+    return detect_negation
+
+
+def timed(classify, options, repeat):
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        results = [classify(option) for option in options]
+    return results, (time.perf_counter() - start_time) / (repeat * len(options))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--fixture", default=FIXTURE)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    options = load_options(args.fixture)
+    try:
+        old_classify = nltk_detect_negation()
+    except ImportError:
+        print("nltk is not installed; pip install nltk to compare against it")
+        return 1
+
+    old_results, old_time = timed(old_classify, options, args.repeat)
+    is_negative.cache_clear()
+    start_time = time.perf_counter()
+    for option in options:
+        is_negative(option)
+    cold_time = (time.perf_counter() - start_time) / len(options)
+    new_results, memo_time = timed(is_negative, options, args.repeat)
+
+    disagreements = 0
+    for option, old, new in zip(options, old_results, new_results):
+        if old != new:
+            disagreements += 1
+            print(f"DIFF | {option!r}: nltk={old} regex={new}")
+
+    print(f"\n{len(options)} options, {disagreements} disagreements")
+    print(
+        f"nltk tokenize + scans: {old_time * 1e6:.1f} us/option, regex: "
+        f"{cold_time * 1e6:.1f} us/option, memoized: {memo_time * 1e6:.2f} us/option"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+"""
+Check that LearnedQuestionIndex.find picks the same learned question as the
+linear scan InteractionLearner.find_similar_question used before, and how
+long a lookup takes with each.
+
+Random mappings are drawn from a small vocabulary so that many questions
+overlap and tie. Queries are stored questions with their case changed,
+random word sets, and edits of stored questions that land exactly on, just
+above and just below the threshold. The index keeps only the latest mapping
+per question, so results are compared by question rather than by mapping.
+
+Usage (from the repository root):
+    python -m benchmarks.question_index_parity [--mappings 300] [--queries 2000]
+        [--seed 0]
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from processing.question_index import (
+    KEY_TERMS,
+    LearnedQuestionIndex,
+    normalize_question,
+)
+
+# Includes words that contain key terms ("username", "emails") and words that
+# only look like them, so the substring boost is exercised both ways
+VOCABULARY = (
+    "what is your name username email emails address phone number years of "
+    "experience education skills salary expectation sponsor sponsorship "
+    "eligible authorized to work in the country are you legally require "
+    "visa start date current employer how did hear about us"
+).split()
+
+
+def linear_find(mappings, question_text, threshold=0.7):
+    """The find_similar_question implementation the index replaced"""
+    # First try exact match
+    for mapping in mappings:
+        if mapping["question"].lower() == question_text.lower():
+            return mapping
+
+    # Then try partial matches
+    best_match = None
+    best_score = 0
+
+    for mapping in mappings:
+        # Basic word overlap scoring
+        stored_q = mapping["question"].lower()
+        current_q = question_text.lower()
+
+        words1 = set(stored_q.split())
+        words2 = set(current_q.split())
+
+        if not words1 or not words2:
+            continue
+
+        # Calculate Jaccard similarity
+        intersection = words1.intersection(words2)
+        union = words1.union(words2)
+
+        score = len(intersection) / len(union)
+
+        # Boost score if key terms match exactly
+        key_terms = [
+            "name",
+            "email",
+            "address",
+            "phone",
+            "experience",
+            "education",
+            "skills",
+            "salary",
+            "sponsor",
+            "eligible",
+            "authorized",
+        ]
+
+        for term in key_terms:
+            if term in stored_q and term in current_q:
+                score += 0.1  # Boost for matching important terms
+
+        if score > best_score and score >= threshold:
+            best_score = score
+            best_match = mapping
+
+    return best_match
+
+
+def random_question(rng, min_words=1, max_words=7):
+    words = rng.sample(VOCABULARY, rng.randint(min_words, max_words))
+    return " ".join(words)
+
+
+def random_case(rng, text):
+    return "".join(c.upper() if rng.random() < 0.3 else c for c in text)
+
+
+def near_threshold(rng, question):
+    """
+    An edit of question that shares 7 of its words and whose plain Jaccard
+    score against it is 7/10, 7/9 or 7/11
+    """
+    words = question.split()
+    if not 7 <= len(words) <= 10:
+        return random_question(rng)
+    others = [word for word in VOCABULARY if word not in words]
+    added = max(0, 10 - len(words) + rng.choice([-1, 0, 1]))
+    return " ".join(rng.sample(words, 7) + rng.sample(others, added))
+
+
+def best_scores(mappings, query):
+    """The best score over the learned questions, and how many questions share it"""
+    query = query.lower()
+    scores = {}
+    for mapping in mappings:
+        stored = mapping["question"].lower()
+        words1, words2 = set(stored.split()), set(query.split())
+        score = len(words1 & words2) / len(words1 | words2)
+        for term in KEY_TERMS:
+            if term in stored and term in query:
+                score += 0.1
+        scores[stored] = score
+    best_score = max(scores.values())
+    return best_score, sum(1 for score in scores.values() if score == best_score)
+
+
+def make_queries(rng, mappings, count):
+    queries = []
+    for _ in range(count):
+        kind = rng.random()
+        stored = rng.choice(mappings)["question"]
+        if kind < 0.2:
+            queries.append(random_case(rng, stored))
+        elif kind < 0.5:
+            queries.append(near_threshold(rng, stored))
+        else:
+            queries.append(random_question(rng))
+    return queries
+
+
+def matched_question(mapping):
+    return normalize_question(mapping["question"]) if mapping is not None else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mappings", type=int, default=300)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--thresholds",
+        type=lambda value: [float(threshold) for threshold in value.split(",")],
+        default=[0.5, 0.7, 0.9],
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mappings = []
+    for i in range(args.mappings):
+        # Some questions are learned again later with another value
+        if mappings and rng.random() < 0.1:
+            question = rng.choice(mappings)["question"]
+        else:
+            question = random_question(rng, max_words=10)
+        mappings.append({"question": question, "value": f"answer {i}"})
+    queries = make_queries(rng, mappings, args.queries)
+
+    index = LearnedQuestionIndex(mappings)
+    mismatches = 0
+    matched = 0
+    ties = 0
+    on_threshold = 0
+    for threshold in args.thresholds:
+        linear_time = index_time = 0.0
+        for query in queries:
+            start_time = time.perf_counter()
+            expected = linear_find(mappings, query, threshold)
+            linear_time += time.perf_counter() - start_time
+            start_time = time.perf_counter()
+            found = index.find(query, threshold)
+            index_time += time.perf_counter() - start_time
+
+            matched += expected is not None
+            best_score, sharing = best_scores(mappings, query)
+            ties += best_score >= threshold and sharing > 1
+            on_threshold += best_score == threshold
+            if matched_question(expected) != matched_question(found):
+                mismatches += 1
+                print(
+                    f"MISMATCH | threshold {threshold} | Q: '{query}' | linear: "
+                    f"{matched_question(expected)!r} | index: {matched_question(found)!r}"
+                )
+        print(
+            f"threshold {threshold}: linear scan {linear_time / len(queries) * 1e6:.1f} "
+            f"us/lookup, index {index_time / len(queries) * 1e6:.1f} us/lookup"
+        )
+
+    lookups = len(queries) * len(args.thresholds)
+    print(
+        f"\n{len(mappings)} mappings ({len(index)} distinct questions), {lookups} "
+        f"lookups, {matched} matched, {ties} with tied best scores, {on_threshold} "
+        f"scoring exactly the threshold, {mismatches} mismatches"
+    )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
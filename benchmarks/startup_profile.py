@@ -0,0 +1,118 @@
+"""
+Startup profile: what importing workday.py costs and how long it takes
+until the first driver.get.
+
+Each measurement runs in a fresh interpreter so nothing is already imported.
+Exits non-zero if a heavy dependency is imported at startup or the import
+misses TARGET_IMPORT_SECONDS.
+
+Usage (from the repository root):
+    python -m benchmarks.startup_profile [--top 15] [--browser]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Must only be imported once a question actually needs them
+HEAVY_MODULES = ("torch", "sentence_transformers", "transformers", "nltk", "numpy")
+TARGET_IMPORT_SECONDS = 1.0
+
+IMPORT_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+import workday
+print(time.perf_counter() - start)
+print(",".join(sorted(name for name in sys.modules if "." not in name)))
+"""
+
+# Time from interpreter start to the first driver.get, with a headless
+# browser standing in for the one Workday would start
+FIRST_GET_SCRIPT = """
+import time
+start = time.perf_counter()
+import workday
+from benchmarks.browser import fixture_url, headless_chrome
+from browser.session_pool import BrowserSession
+imported = time.perf_counter()
+session = BrowserSession(headless_chrome(), "benchmark", 0)
+browser_started = time.perf_counter()
+job = workday.Workday(fixture_url("element_types.html"), session=session)
+job.driver.get(job.url)
+first_get = time.perf_counter()
+session.quit()
+print(imported - start, browser_started - imported, first_get - browser_started)
+"""
+
+
+def run(script, *python_args):
+    result = subprocess.run(
+        [sys.executable, *python_args, "-c", script],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(result.stdout + result.stderr)
+        raise SystemExit(f"Startup script failed with exit code {result.returncode}")
+    return result
+
+
+def import_breakdown(top):
+    """Print the modules workday imports with the largest cumulative import time"""
+    stderr = run("import workday", "-X", "importtime").stderr
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time: <self us> | <cumulative us> | <indented module name>"
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        # Names are indented two spaces per nesting level; keep what workday
+        # imports directly; deeper imports are part of their parent's time
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if depth == 1:
+            timings.append((int(cumulative_us), int(self_us), name.strip()))
+
+    print(f"{'module':<40}{'cumulative':>12}{'self':>10}")
+    for cumulative_us, self_us, name in sorted(timings, reverse=True)[:top]:
+        print(f"{name:<40}{cumulative_us / 1000:>10.1f}ms{self_us / 1000:>8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--browser",
+        action="store_true",
+        help="Also measure time to the first driver.get (needs Chrome)",
+    )
+    args = parser.parse_args()
+
+    print("===== Import time breakdown (python -X importtime) =====")
+    import_breakdown(args.top)
+
+    lines = run(IMPORT_SCRIPT).stdout.strip().splitlines()
+    import_seconds = float(lines[0])
+    loaded = set(lines[1].split(",")) if len(lines) > 1 else set()
+    heavy = [module for module in HEAVY_MODULES if module in loaded]
+
+    print(
+        f"\nimport workday: {import_seconds:.2f}s "
+        f"(target {TARGET_IMPORT_SECONDS:.1f}s)"
+    )
+    print(f"Heavy modules imported at startup: {', '.join(heavy) or 'none'}")
+
+    if args.browser:
+        imported, browser_started, first_get = [
+            float(value) for value in run(FIRST_GET_SCRIPT).stdout.split()[-3:]
+        ]
+        print(
+            f"Time to first driver.get: {imported + browser_started + first_get:.2f}s "
+            f"(imports {imported:.2f}s, Chrome {browser_started:.2f}s, "
+            f"Workday setup and get {first_get:.2f}s)"
+        )
+
+    return 1 if heavy or import_seconds > TARGET_IMPORT_SECONDS else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,155 @@
+"""
+Check that --log-level and --log-file cover what a run prints.
+
+At each level, a record of every level is logged with a lazy field. Records
+below the level must not be printed, must not reach the JSON lines file and
+must never call their field; enabled records call it exactly once. Then
+every module workday.py imports, directly or through other modules of this
+repository, is scanned for print() calls that would bypass the level.
+
+Usage (from the repository root):
+    python -m benchmarks.structured_log_check
+"""
+
+import ast
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+
+from processing import structured_log
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_POINT = "workday.py"
+
+# print() calls that are meant to bypass the level: the logger's own output
+# and the retention command-line report
+ALLOWED_PRINTS = {
+    ("processing/structured_log.py", "Logger.log"),
+    ("processing/retention.py", "main"),
+}
+
+
+def check_level(level):
+    """Returns a list of problems with logging one record per level at level"""
+    problems = []
+    calls = {}
+
+    def lazy(name):
+        def field():
+            calls[name] = calls.get(name, 0) + 1
+            return f"{name} value"
+
+        return field
+
+    log = structured_log.get_logger("check")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_file = os.path.join(tmp_dir, "run.jsonl")
+        structured_log.configure(level=level, jsonl_file=log_file)
+        output = io.StringIO()
+        try:
+            with contextlib.redirect_stdout(output):
+                for name in structured_log.LEVELS:
+                    getattr(log, name)(f"{name} record", detail=lazy(name))
+        finally:
+            structured_log.close()
+            structured_log.set_level("info")
+        with open(log_file, "r") as f:
+            written = [json.loads(line)["level"] for line in f]
+
+    printed = output.getvalue()
+    for name, number in structured_log.LEVELS.items():
+        enabled = number >= structured_log.LEVELS[level]
+        if (f"{name} record" in printed) != enabled:
+            problems.append(f"{name} record {'not ' if enabled else ''}printed")
+        if (name in written) != enabled:
+            problems.append(f"{name} record {'not ' if enabled else ''}written")
+        if calls.get(name, 0) != (1 if enabled else 0):
+            problems.append(f"{name} field called {calls.get(name, 0)} times")
+    return problems
+
+
+def module_path(module):
+    """The repository file for a dotted module name, or None if it isn't one"""
+    base = os.path.join(*module.split("."))
+    for path in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.exists(os.path.join(REPO_ROOT, path)):
+            return path.replace(os.sep, "/")
+    return None
+
+
+def imported_modules(tree):
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                yield alias.name
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            yield node.module
+            for alias in node.names:
+                yield f"{node.module}.{alias.name}"
+
+
+def print_calls(tree):
+    """Yields (qualified name of the enclosing function, line) per print() call"""
+
+    def visit(node, scope):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                yield from visit(child, scope + [child.name])
+                continue
+            if (
+                isinstance(child, ast.Call)
+                and isinstance(child.func, ast.Name)
+                and child.func.id == "print"
+            ):
+                yield ".".join(scope), child.lineno
+            yield from visit(child, scope)
+
+    yield from visit(tree, [])
+
+
+def audit_prints():
+    """Returns (modules scanned, print() calls outside ALLOWED_PRINTS)"""
+    pending = [ENTRY_POINT]
+    scanned = set()
+    stray = []
+    while pending:
+        path = pending.pop()
+        if path in scanned:
+            continue
+        scanned.add(path)
+        with open(os.path.join(REPO_ROOT, path), "r") as f:
+            tree = ast.parse(f.read(), path)
+        for scope, line in print_calls(tree):
+            if (path, scope) not in ALLOWED_PRINTS:
+                stray.append(f"{path}:{line} in {scope or '<module>'}")
+        for module in imported_modules(tree):
+            imported = module_path(module)
+            if imported and imported not in scanned:
+                pending.append(imported)
+    return sorted(scanned), stray
+
+
+def main():
+    failures = 0
+    for level in structured_log.LEVELS:
+        problems = check_level(level)
+        failures += len(problems)
+        print(f"{'OK ' if not problems else 'FAIL'} | level {level}: {problems or ''}")
+
+    scanned, stray = audit_prints()
+    for call in stray:
+        print(f"FAIL | print() bypasses the log level: {call}")
+    failures += len(stray)
+
+    print(
+        f"\n{len(structured_log.LEVELS)} levels, {len(scanned)} modules scanned, "
+        f"{failures} failures"
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+Accounting of every WebDriver command a job sends to chromedriver.
+
+All commands, including WebElement ones like .text, get_attribute and
+is_displayed, go through driver.execute, so wrapping that one method sees
+every round trip. Each command is timed and attributed to the current
+phase of the job (auth, resume upload, page N extraction, ...) and to the
+line of this repository that sent it, and apply() prints the most expensive
+phases and call sites when the job ends.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+THIS_FILE = os.path.abspath(__file__)
+REPO_ROOT = os.path.dirname(os.path.dirname(THIS_FILE))
+ENTRY_MODULE = os.path.join(REPO_ROOT, "workday.py")
+
+
+def _call_site(frame):
+    """
+    The innermost line of this repository on the stack, plus the workday.py
+    line that led to it when the innermost one is in a helper module
+    """
+    site = None
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(REPO_ROOT) and filename != THIS_FILE:
+            location = (
+                f"{os.path.relpath(filename, REPO_ROOT)}:{frame.f_lineno} "
+                f"{frame.f_code.co_name}"
+            )
+            if site is None:
+                site = location
+                if filename == ENTRY_MODULE:
+                    return site
+            elif filename == ENTRY_MODULE:
+                return f"{site} <- {location}"
+        frame = frame.f_back
+    return site or "<outside repository>"
+
+
+class CommandAccountant:
+    """Counts and times one driver's commands per phase and call site"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.stats = {}  # (phase, command, call site) -> [count, seconds]
+        self._phases = ["setup"]
+        self._lock = threading.Lock()
+        self._execute = None
+        self.install()
+
+    def install(self):
+        # Wrap the driver's own execute, not an earlier job's accountant
+        original = getattr(self.driver, "_unaccounted_execute", None)
+        if original is None:
+            original = self.driver.execute
+            self.driver._unaccounted_execute = original
+        self._execute = original
+        self.driver.execute = self._accounted_execute
+        self.driver._command_accountant = self
+
+    def uninstall(self):
+        if getattr(self.driver, "_command_accountant", None) is self:
+            self.driver.execute = self._execute
+            del self.driver._command_accountant
+            del self.driver._unaccounted_execute
+
+    def _accounted_execute(self, driver_command, params=None):
+        start_time = time.perf_counter()
+        try:
+            return self._execute(driver_command, params)
+        finally:
+            elapsed = time.perf_counter() - start_time
+            key = (
+                " > ".join(self._phases),
+                driver_command,
+                _call_site(sys._getframe(1)),
+            )
+            with self._lock:
+                entry = self.stats.setdefault(key, [0, 0.0])
+                entry[0] += 1
+                entry[1] += elapsed
+
+    def set_phase(self, name):
+        """Start a new top-level phase of the job (e.g. "auth", "page 3")"""
+        self._phases = [name]
+
+    def set_step(self, name):
+        """Start a new step within the current phase (e.g. "extraction")"""
+        self._phases = self._phases[:1] + [name]
+
+    @contextmanager
+    def phase(self, name):
+        """Attribute the commands sent inside the block to a sub-phase"""
+        phases = self._phases
+        self._phases = phases + [name]
+        try:
+            yield
+        finally:
+            self._phases = phases
+
+    def _totals(self, key_index):
+        totals = {}
+        for key, (count, seconds) in self.stats.items():
+            total = totals.setdefault(key[key_index], [0, 0.0])
+            total[0] += count
+            total[1] += seconds
+        return sorted(totals.items(), key=lambda item: item[1][1], reverse=True)
+
+    def report(self, top=10):
+        """Print commands and time per phase, per command and per call site"""
+        if not self.stats:
+            return
+        commands = sum(count for count, _ in self.stats.values())
+        seconds = sum(elapsed for _, elapsed in self.stats.values())
+        log.info("\n===== WebDriver Command Report =====")
+        log.info(f"Total: {commands} commands, {seconds:.1f}s")
+
+        for title, key_index, limit in (
+            ("phase", 0, None),
+            ("command", 1, top),
+            ("call site", 2, top),
+        ):
+            log.info(f"\n{'commands':>10}{'seconds':>10}  {title}")
+            for name, (count, elapsed) in self._totals(key_index)[:limit]:
+                log.info(f"{count:>10}{elapsed:>10.2f}  {name}")
+
+
+def command_phase(driver, name):
+    """
+    Sub-phase of the accountant installed on driver, if any, for code that
+    only has the driver (e.g. WaitPolicy)
+    """
+    accountant = getattr(driver, "_command_accountant", None)
+    return accountant.phase(name) if accountant is not None else nullcontext()
@@ -0,0 +1,260 @@
+"""
+JavaScript run inside the page so that scanning a form costs a single
+WebDriver round trip instead of several per field.
+"""
+
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+# Helpers shared by the injected scripts. Kept as plain function declarations
+# so they can be prepended to any script passed to execute_script.
+XPATH_HELPERS_JS = """
+function xpathAll(expression, context) {
+    const result = document.evaluate(
+        expression, context || document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+    );
+    const nodes = [];
+    for (let i = 0; i < result.snapshotLength; i++) {
+        nodes.push(result.snapshotItem(i));
+    }
+    return nodes;
+}
+
+function visibleText(el) {
+    return (el.innerText !== undefined ? el.innerText : el.textContent) || '';
+}
+"""
+
+# Port of Workday._detect_element_type. The rules (and their order) are kept
+# identical to the Python version, so both always agree on the element type.
+CLASSIFY_ELEMENT_JS = """
+function classifyElement(el) {
+    try {
+        const tagName = el.tagName.toLowerCase();
+        let elementType = 'unknown';
+
+        if (tagName === 'input') {
+            const inputType = el.type;
+            if (['text', 'email', 'tel', 'number', 'password'].includes(inputType)) {
+                elementType = 'text_input';
+            } else if (inputType === 'radio') {
+                elementType = 'radio';
+            } else if (inputType === 'checkbox') {
+                elementType = 'checkbox';
+            }
+        } else if (tagName === 'select' || tagName === 'button') {
+            elementType = 'dropdown';
+        } else if (tagName === 'div') {
+            const automationId = (el.getAttribute('data-automation-id') || '').toLowerCase();
+            const role = el.getAttribute('role') || '';
+            const ariaControls = el.getAttribute('aria-controls') || '';
+
+            if (automationId.includes('dropdown') || role === 'combobox') {
+                elementType = 'dropdown';
+            } else if (automationId.includes('multiselect')) {
+                elementType = 'multiselect';
+            } else if (automationId.includes('date')) {
+                elementType = 'date';
+            } else if (automationId.includes('radio') || role === 'radiogroup') {
+                elementType = 'radio';
+            } else if (automationId.includes('checkbox')) {
+                elementType = 'checkbox';
+            } else if (role === 'button' && ariaControls.includes('listbox')) {
+                elementType = 'dropdown';
+            }
+
+            const textInputs = xpathAll(
+                ".//input[@type='text' or @type='email' or @type='tel' or @type='number']", el
+            );
+            if (textInputs.length && elementType === 'unknown') {
+                elementType = 'text_input';
+            }
+        }
+
+        if (xpathAll(".//input[@type='radio']", el).length) {
+            elementType = 'radio';
+        }
+        if (xpathAll(".//input[@type='checkbox']", el).length) {
+            elementType = 'checkbox';
+        }
+        const dropdownMarkers = xpathAll(
+            ".//div[contains(@class, 'dropdown') or contains(@class, 'select')]", el
+        );
+        if (dropdownMarkers.length && elementType === 'unknown') {
+            elementType = 'dropdown';
+        }
+        const multiselectMarkers = xpathAll(
+            ".//div[contains(@class, 'pill') or contains(@class, 'token') or contains(@class, 'chip')]", el
+        );
+        if (multiselectMarkers.length) {
+            elementType = 'multiselect';
+        }
+        const dateInputs = xpathAll(
+            ".//input[@type='date'] | .//input[contains(@placeholder, 'MM')] | " +
+            ".//input[contains(@placeholder, 'DD')] | .//input[contains(@placeholder, 'YYYY')]", el
+        );
+        if (dateInputs.length >= 2) {
+            elementType = 'date';
+        }
+        const questionText = visibleText(el).toLowerCase();
+        if ((questionText.includes('date') || questionText.includes('birthday') ||
+             questionText.includes('dob')) && elementType === 'unknown') {
+            elementType = 'date';
+        }
+        return elementType;
+    } catch (e) {
+        return 'unknown';
+    }
+}
+"""
+
+EXTRACT_QUESTIONS_JS = (
+    XPATH_HELPERS_JS
+    + CLASSIFY_ELEMENT_JS
+    + """
+function optionLabels(container) {
+    const scope = container.closest('fieldset, [role="radiogroup"], [role="group"]') || container;
+    const labels = [];
+    for (const option of scope.querySelectorAll('label, option, [role="option"]')) {
+        const label = visibleText(option).trim();
+        if (label && !labels.includes(label)) {
+            labels.push(label);
+        }
+    }
+    return labels;
+}
+
+// Same walk as Workday.find_next_sibling_safely: look for the first element
+// with an automation id (then any id) in the following sibling divs, going
+// up one level at a time.
+function findInputContainer(question, maxLevels) {
+    let current = question;
+    for (let level = 0; level < maxLevels && current; level++) {
+        let siblings = xpathAll(
+            "./following-sibling::div//*[@data-automation-id][position()=1]", current
+        );
+        if (siblings.length) {
+            return [siblings[0], false];
+        }
+        siblings = xpathAll("./following-sibling::div//*[@id][position()=1]", current);
+        if (siblings.length) {
+            return [siblings[0], true];
+        }
+        current = current.parentElement;
+    }
+    return [null, false];
+}
+
+const maxLevels = arguments[0];
+const questions = [];
+// The first asterisk is the legend explaining required fields, not a question
+const requiredFields = xpathAll("//abbr[text()='*']").slice(1);
+for (const field of requiredFields) {
+    const question = field.parentElement;
+    if (!question) {
+        continue;
+    }
+    const questionText = visibleText(question).replace(/\\*/g, '').trim();
+    if (questionText.length < 3) {
+        continue;
+    }
+    if (!xpathAll("./ancestor::div[@data-automation-id][position()=1]", question).length) {
+        continue;
+    }
+    const [container, isId] = findInputContainer(question, maxLevels);
+    if (!container) {
+        continue;
+    }
+    const automationId = isId
+        ? container.getAttribute('id')
+        : container.getAttribute('data-automation-id');
+    if (!automationId) {
+        continue;
+    }
+    questions.push({
+        question: questionText,
+        container: container,
+        automation_id: automationId,
+        element_type: classifyElement(container),
+        options: optionLabels(container),
+    });
+}
+return questions;
+"""
+)
+
+
+def extract_questions(driver, max_levels=5):
+    """
+    Extract every required question on the current page in one execute_script call
+
+    Args:
+        driver: WebDriver - The browser session
+        max_levels: int - How far up the DOM to look for a question's input container
+
+    Returns:
+        list[dict]: One dict per question with keys question, container
+        (WebElement), automation_id, element_type and options
+    """
+    return driver.execute_script(EXTRACT_QUESTIONS_JS, max_levels) or []
+
+
+CLASSIFY_ELEMENTS_JS = (
+    XPATH_HELPERS_JS
+    + CLASSIFY_ELEMENT_JS
+    + """
+return arguments[0].map(classifyElement);
+"""
+)
+
+
+class ElementTypeCache:
+    """
+    Element types for the current page, memoized per WebElement.
+
+    Types are computed in the browser, in one call for a whole batch of
+    elements, and are kept until clear() is called when the page changes.
+    """
+
+    def __init__(self, driver, fallback=None):
+        self.driver = driver
+        # Python classifier to use if the script can't run
+        self.fallback = fallback
+        self._types = {}
+
+    def clear(self):
+        self._types = {}
+
+    def record(self, element, element_type):
+        """Remember a type that was already detected (e.g. during extraction)"""
+        self._types[element.id] = element_type
+
+    def classify(self, elements):
+        """
+        Get the types of several elements, classifying uncached ones in one round trip
+
+        Returns:
+            list[str]: The element types, in the same order as elements
+        """
+        pending = []
+        for element in elements:
+            if element.id not in self._types and element not in pending:
+                pending.append(element)
+
+        if pending:
+            try:
+                types = self.driver.execute_script(CLASSIFY_ELEMENTS_JS, pending)
+            except Exception as e:
+                log.warning(f"Error classifying elements in page: {e}")
+                if self.fallback is None:
+                    raise
+                types = [self.fallback(element) for element in pending]
+            for element, element_type in zip(pending, types):
+                self._types[element.id] = element_type
+
+        return [self._types[element.id] for element in elements]
+
+    def get(self, element):
+        return self.classify([element])[0]
@@ -0,0 +1,246 @@
+"""
+Dropdown option handling in a fixed number of round trips.
+
+The open listbox is captured with one script call that returns every option
+label, the options are matched locally, and the winner is clicked by index
+with a second call. Before, every option's .text was a separate WebDriver
+call, once per candidate value, which made country and state dropdowns with
+hundreds of options very slow.
+
+Large lists (countries, schools, phone codes) are searched instead of
+scanned: a discriminating prefix is typed into the prompt's search box and
+the option is picked from the short filtered result set.
+"""
+
+from difflib import SequenceMatcher
+
+# Tried in order; the first selector that finds any options is used
+OPTION_SELECTORS = (
+    "ul[role='listbox'] li[role='option'] div",
+    "ul[role='listbox'] li[role='option']",
+    "div[role='option']",
+    # Last resort, any items that appeared after clicking
+    "xpath://div[contains(@class, 'dropdown') or contains(@class, 'select')]//li",
+)
+
+# Workday prompt results; the search box filters these
+PROMPT_OPTION_SELECTORS = ("[data-automation-id='promptOption']",) + OPTION_SELECTORS
+
+SEARCH_BOX_SELECTORS = (
+    "input[data-automation-id='searchBox']",
+    "[role='combobox'] input[type='text']",
+)
+
+# Lists with more options than this are searched instead of scanned
+SEARCH_THRESHOLD = 50
+# A search prefix is discriminating once this few options contain it
+SEARCH_RESULT_TARGET = 10
+# Shortest text typed into a search box
+MIN_SEARCH_PREFIX = 3
+
+# Matches scoring below the contains tier; only close spellings qualify
+FUZZY_MIN_RATIO = 0.8
+FUZZY_WEIGHT = 0.6
+
+FIND_OPTIONS_JS = """
+function findOptions(selector) {
+    if (selector.startsWith('xpath:')) {
+        const result = document.evaluate(
+            selector.slice(6), document, null,
+            XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        const nodes = [];
+        for (let i = 0; i < result.snapshotLength; i++) {
+            nodes.push(result.snapshotItem(i));
+        }
+        return nodes;
+    }
+    return Array.from(document.querySelectorAll(selector));
+}
+"""
+
+SNAPSHOT_OPTIONS_JS = (
+    FIND_OPTIONS_JS
+    + """
+const selectors = arguments[0];
+const searchBoxSelectors = arguments[1];
+const field = arguments[2];
+
+// Only a search box of the list being answered counts: one in the popup the
+// field controls, in the open list container or in the field's own prompt.
+// Other prompts on the page have always-visible search boxes too.
+const containers = [];
+const controls = field && field.getAttribute('aria-controls');
+if (controls && document.getElementById(controls)) {
+    containers.push(document.getElementById(controls));
+}
+containers.push(...document.querySelectorAll("[data-automation-id='activeListContainer']"));
+if (field) {
+    containers.push(field);
+}
+
+let searchBox = null;
+for (const container of containers) {
+    for (const selector of searchBoxSelectors) {
+        searchBox = Array.from(container.querySelectorAll(selector)).find(
+            (input) => input.offsetParent !== null
+        );
+        if (searchBox) {
+            break;
+        }
+    }
+    if (searchBox) {
+        break;
+    }
+}
+
+for (let i = 0; i < selectors.length; i++) {
+    const options = findOptions(selectors[i]);
+    if (options.length) {
+        return {
+            selector: selectors[i],
+            labels: options.map(
+                (option) => (option.innerText || option.textContent || '').trim()
+            ),
+            search_box: searchBox,
+        };
+    }
+}
+return {selector: null, labels: [], search_box: searchBox};
+"""
+)
+
+# Clicks the option at index, unless the list changed since the snapshot
+CLICK_OPTION_JS = (
+    FIND_OPTIONS_JS
+    + """
+const selector = arguments[0];
+const index = arguments[1];
+const expectedLabel = arguments[2];
+const option = findOptions(selector)[index];
+if (!option) {
+    return null;
+}
+const label = (option.innerText || option.textContent || '').trim();
+if (label !== expectedLabel) {
+    return null;
+}
+option.scrollIntoView({block: 'nearest'});
+option.click();
+return label;
+"""
+)
+
+
+def snapshot_options(driver, selectors=OPTION_SELECTORS, field=None):
+    """
+    Capture the labels of the open dropdown's options in one round trip
+
+    Args:
+        driver: WebDriver - The browser session
+        selectors: tuple - Option selectors to try, in order
+        field: WebElement - The dropdown or prompt being answered; its popup
+            and its own container are where its search box is looked for
+
+    Returns:
+        dict: selector (the one that found the options, or None), labels and
+        search_box (the visible search input of this list, or None)
+    """
+    return driver.execute_script(
+        SNAPSHOT_OPTIONS_JS, list(selectors), list(SEARCH_BOX_SELECTORS), field
+    )
+
+
+def click_option(driver, snapshot, index):
+    """
+    Click an option from a snapshot by index
+
+    Returns:
+        bool: False if the option is gone or the list changed since the snapshot
+    """
+    label = snapshot["labels"][index]
+    return (
+        driver.execute_script(CLICK_OPTION_JS, snapshot["selector"], index, label)
+        is not None
+    )
+
+
+def match_option(labels, values):
+    """
+    Pick the option that best matches any of the values
+
+    Scores are 1.0 for an exact match, 0.9 when the option starts with the
+    value and 0.7 when it contains it (all case insensitive). Options that
+    only look alike score up to FUZZY_WEIGHT. An exact match wins
+    immediately; otherwise the first option with the highest score wins.
+
+    Args:
+        labels: list[str] - Option labels, in page order
+        values: str | list - Acceptable answers
+
+    Returns:
+        tuple: (index, score, method), or (None, 0, None) if nothing matched
+    """
+    value_list = values if isinstance(values, list) else [values]
+    value_list = [str(value).strip().lower() for value in value_list]
+    value_list = [value for value in value_list if value]
+
+    best_index, best_score, best_method = None, 0, None
+    for index, label in enumerate(labels):
+        option_text = label.strip().lower()
+        if not option_text:
+            continue
+        for value in value_list:
+            if option_text == value:
+                return index, 1.0, "exact"
+            if option_text.startswith(value) and 0.9 > best_score:
+                best_index, best_score, best_method = index, 0.9, "startswith"
+            if value in option_text and 0.7 > best_score:
+                best_index, best_score, best_method = index, 0.7, "contains"
+            if best_score < FUZZY_WEIGHT:
+                matcher = SequenceMatcher(None, value, option_text)
+                # real_quick_ratio is a cheap upper bound on ratio
+                if matcher.real_quick_ratio() < FUZZY_MIN_RATIO:
+                    continue
+                ratio = matcher.ratio()
+                if ratio >= FUZZY_MIN_RATIO and ratio * FUZZY_WEIGHT > best_score:
+                    best_index, best_score, best_method = (
+                        index,
+                        ratio * FUZZY_WEIGHT,
+                        "fuzzy",
+                    )
+    return best_index, best_score, best_method
+
+
+def search_prefix(value, labels=()):
+    """
+    Shortest leading words of value that narrow the options down to a few
+
+    Typing less than the whole answer tolerates differences after the first
+    words (e.g. "United States" finds "United States of America") and typos.
+
+    Args:
+        value: str - The answer to search for
+        labels: list[str] - Option labels already on screen, if any
+
+    Returns:
+        str: The text to type into the search box. Without labels to narrow
+        down, the whole value.
+    """
+    value = str(value).strip()
+    lowered = [label.lower() for label in labels]
+    if not lowered:
+        return value
+    words = value.split()
+    candidates = [" ".join(words[:count]) for count in range(1, len(words) + 1)]
+    # Shorter starts of the first word, for answers with a typo in it
+    if words:
+        candidates += [
+            words[0][:length]
+            for length in range(len(words[0]) - 1, MIN_SEARCH_PREFIX - 1, -1)
+        ]
+    for prefix in candidates:
+        matches = sum(1 for label in lowered if prefix.lower() in label)
+        if 0 < matches <= SEARCH_RESULT_TARGET:
+            return prefix
+    return value
@@ -0,0 +1,111 @@
+"""
+In-page check for "this job posting is closed" pages.
+
+All closed/error markers are checked in one execute_script call: a single
+XPath union for the known message elements, then the page text for the known
+phrases. Only a small verdict dict crosses the wire instead of the results of
+several find_elements calls plus the whole body text.
+"""
+
+from browser.dom_extraction import XPATH_HELPERS_JS
+
+# (tag, text) of elements whose own text says the posting is closed. Matched
+# like the XPath contains(text(), ...) checks they replace (case sensitive).
+CLOSED_MESSAGES = (
+    ("div", "no longer accepting applications"),
+    ("div", "position has been filled"),
+    ("div", "This job is closed"),
+    ("div", "job posting has closed"),
+    ("div", "job posting has been removed"),
+    ("div", "position is no longer available"),
+    ("div", "job requisition has been closed"),
+    ("div", "has been removed"),
+    ("p", "no longer accepting"),
+)
+
+# Phrases anywhere in the (lowercased) page text
+CLOSED_PHRASES = (
+    "no longer accepting",
+    "position filled",
+    "job closed",
+    "posting closed",
+    "position unavailable",
+    "job has been removed",
+    "requisition closed",
+)
+
+
+def _xpath_literal(text):
+    if "'" not in text:
+        return f"'{text}'"
+    if '"' not in text:
+        return f'"{text}"'
+    parts = text.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+def closed_messages_xpath(messages=CLOSED_MESSAGES):
+    """One XPath union matching every (tag, text) message element"""
+    tags = {}
+    for tag, text in messages:
+        tags.setdefault(tag, []).append(text)
+    return " | ".join(
+        f"//{tag}["
+        + " or ".join(f"contains(text(), {_xpath_literal(text)})" for text in texts)
+        + "]"
+        for tag, texts in tags.items()
+    )
+
+
+CLOSED_MESSAGES_XPATH = closed_messages_xpath()
+
+DETECT_JOB_CLOSED_JS = (
+    XPATH_HELPERS_JS
+    + """
+const messagesXpath = arguments[0];
+const messageTexts = arguments[1];
+const phrases = arguments[2];
+
+const messages = xpathAll(messagesXpath);
+if (messages.length) {
+    const text = visibleText(messages[0]).trim();
+    const match = messageTexts.find((message) => text.includes(message)) || text;
+    return {closed: true, reason: 'message', match: match, text: text};
+}
+
+const pageText = document.body ? visibleText(document.body).toLowerCase() : '';
+for (const phrase of phrases) {
+    const index = pageText.indexOf(phrase);
+    if (index !== -1) {
+        const start = Math.max(0, index - 60);
+        return {
+            closed: true,
+            reason: 'phrase',
+            match: phrase,
+            text: pageText.slice(start, index + phrase.length + 60).trim(),
+        };
+    }
+}
+return {closed: false, reason: null, match: null, text: null};
+"""
+)
+
+
+def detect_job_closed(driver, extra_phrases=()):
+    """
+    Check whether the current page says the job posting is closed
+
+    Args:
+        driver: WebDriver - The browser session
+        extra_phrases: tuple - Additional lowercase phrases to look for in the page text
+
+    Returns:
+        dict: closed (bool), reason ("message", "phrase" or None), match (the
+        phrase or message that matched) and text (the surrounding page text)
+    """
+    return driver.execute_script(
+        DETECT_JOB_CLOSED_JS,
+        CLOSED_MESSAGES_XPATH,
+        [text for _, text in CLOSED_MESSAGES],
+        list(CLOSED_PHRASES) + list(extra_phrases),
+    )
@@ -0,0 +1,133 @@
+"""
+Event-driven "page is idle" detection.
+
+A MutationObserver and a counter of in-flight XHR/fetch requests run inside
+the page, and a single execute_async_script call resolves once the watched
+subtree has had no mutations and no network activity for quiet_ms. Nothing
+but a small status dict crosses the wire, and the wait ends as soon as the
+page is actually idle instead of after a fixed sleep.
+"""
+
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+# Installs the network counter once per document. Requests that started
+# before it was installed are not counted, but the mutation observer still
+# sees the DOM updates they cause.
+INSTALL_NETWORK_TRACKER_JS = """
+function installNetworkTracker() {
+    if (window.__workdayNetwork) {
+        return window.__workdayNetwork;
+    }
+    const state = {inflight: 0, lastActivity: Date.now()};
+    const finished = () => {
+        state.inflight = Math.max(0, state.inflight - 1);
+        state.lastActivity = Date.now();
+    };
+
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        state.inflight++;
+        state.lastActivity = Date.now();
+        this.addEventListener('loadend', finished, {once: true});
+        try {
+            return originalSend.apply(this, arguments);
+        } catch (e) {
+            finished();
+            throw e;
+        }
+    };
+
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function() {
+            state.inflight++;
+            state.lastActivity = Date.now();
+            return originalFetch.apply(this, arguments).finally(finished);
+        };
+    }
+
+    window.__workdayNetwork = state;
+    return state;
+}
+"""
+
+WAIT_FOR_QUIESCENCE_JS = (
+    INSTALL_NETWORK_TRACKER_JS
+    + """
+const element = arguments[0];
+const quietMs = arguments[1];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+
+const network = installNetworkTracker();
+// Watch a wider section around the element so re-renders of neighbouring
+// fields (and the element being replaced) are noticed too
+const root = element
+    ? (element.closest('div[class*="container"], div[class*="section"], div[class*="page"]')
+        || element.parentElement || element)
+    : document.documentElement;
+
+const start = Date.now();
+let lastMutation = start;
+let mutations = 0;
+const observer = new MutationObserver((records) => {
+    mutations += records.length;
+    lastMutation = Date.now();
+});
+observer.observe(root, {subtree: true, childList: true, attributes: true, characterData: true});
+
+function check() {
+    const now = Date.now();
+    const detached = !root.isConnected;
+    const quiet = document.readyState === 'complete'
+        && network.inflight === 0
+        && now - lastMutation >= quietMs
+        && now - network.lastActivity >= quietMs;
+    if (quiet || detached || now - start >= timeoutMs) {
+        observer.disconnect();
+        done({
+            quiet: quiet,
+            detached: detached,
+            waited_ms: now - start,
+            mutations: mutations,
+            inflight: network.inflight,
+        });
+        return;
+    }
+    setTimeout(check, Math.min(50, quietMs));
+}
+check();
+"""
+)
+
+
+def wait_for_quiescence(driver, element=None, quiet_ms=500, timeout=10):
+    """
+    Block until the page (or the section around element) is idle
+
+    The driver's script timeout must be longer than timeout; Workday sets it
+    when the session is created.
+
+    Args:
+        driver: WebDriver - The browser session
+        element: WebElement - Element whose surrounding section to watch, or None for the whole page
+        quiet_ms: int - How long the DOM and network must be idle
+        timeout: float - Maximum time to wait in seconds
+
+    Returns:
+        dict: quiet (bool), detached (bool), waited_ms, mutations and inflight
+    """
+    deadline = time.time() + timeout
+    while True:
+        remaining_ms = max(0, int((deadline - time.time()) * 1000))
+        try:
+            return driver.execute_async_script(
+                WAIT_FOR_QUIESCENCE_JS, element, quiet_ms, remaining_ms
+            )
+        except WebDriverException as e:
+            # A navigation while waiting unloads the document the script ran
+            # in; wait again in the new document while there is time left
+            if time.time() >= deadline or "unload" not in str(e).lower():
+                raise
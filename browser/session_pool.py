@@ -0,0 +1,226 @@
+"""
+Browser sessions kept alive between postings of the same Workday tenant.
+
+Starting Chrome and signing in is the slowest part of a short application.
+A tenant's session is handed back to the pool when a job finishes, so the
+next posting at the same company reuses the warm, signed-in browser instead
+of starting over. Chrome processes are bounded by max_sessions; the least
+recently used idle session is closed to make room for a new tenant.
+"""
+
+import os
+import threading
+import time
+
+from selenium import webdriver
+
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+# Workday signs idle users out; after this long a pooled session is treated
+# as signed out and Workday.apply() goes through signin() again
+AUTH_TTL = 15 * 60
+
+
+def new_chrome(debugging_port=9222, user_data_dir=None):
+    """
+    Start a Chrome session configured the way Workday expects
+
+    Args:
+        debugging_port: int - Chrome remote debugging port, unique per concurrent browser
+        user_data_dir: str - Chrome profile directory, unique per concurrent browser
+            (None for a temporary profile)
+
+    Returns:
+        WebDriver: The new browser session
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument(f"--remote-debugging-port={debugging_port}")
+    if user_data_dir:
+        options.add_argument(f"--user-data-dir={os.path.abspath(user_data_dir)}")
+    # You need to have chromedriver installed
+    driver = webdriver.Chrome(options=options)
+    driver.maximize_window()
+    # Must outlast the longest in-page quiescence wait
+    driver.set_script_timeout(30)
+    return driver
+
+
+class BrowserSession:
+    """A pooled browser, dedicated to one tenant while it is checked out"""
+
+    def __init__(self, driver, tenant, slot):
+        self.driver = driver
+        self.tenant = tenant
+        self.slot = slot
+        # Set by Workday.apply() once signin/signup went through
+        self.authenticated = False
+        # Cleared when a job leaves the browser in a state that shouldn't be reused
+        self.healthy = True
+        self.jobs = 0
+        self.last_used = time.time()
+
+    def alive(self):
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def reset(self):
+        """
+        Drop the navigation state of the last posting, keeping cookies so the
+        tenant session stays signed in
+        """
+        handles = self.driver.window_handles
+        for handle in handles[1:]:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        self.driver.switch_to.window(handles[0])
+        self.driver.get("about:blank")
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class SessionPool:
+    """
+    Tenant -> idle BrowserSession, with at most max_sessions Chrome processes.
+
+    Thread-safe; a session is only ever used by the job that acquired it.
+    """
+
+    def __init__(
+        self,
+        max_sessions=1,
+        base_port=9222,
+        profiles_dir=None,
+        name="session",
+        auth_ttl=AUTH_TTL,
+    ):
+        """
+        Args:
+            max_sessions: int - Max Chrome processes open at once (checked out or idle)
+            base_port: int - Debugging port of the first session; others use the next ones
+            profiles_dir: str - Where each session keeps its Chrome user data dir,
+                or None for temporary profiles
+            name: str - Prefix of the user data dir names
+            auth_ttl: float - Seconds a session may sit idle and still count as signed in
+        """
+        self.max_sessions = max(1, max_sessions)
+        self.base_port = base_port
+        self.profiles_dir = profiles_dir
+        self.name = name
+        self.auth_ttl = auth_ttl
+
+        self._idle = {}  # tenant -> BrowserSession
+        self._free_slots = list(range(self.max_sessions))
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self.started = 0
+        self.reused = 0
+
+    def _start(self, tenant, slot):
+        user_data_dir = None
+        if self.profiles_dir:
+            user_data_dir = os.path.join(self.profiles_dir, f"{self.name}-{slot}")
+            os.makedirs(user_data_dir, exist_ok=True)
+        driver = new_chrome(self.base_port + slot, user_data_dir)
+        return BrowserSession(driver, tenant, slot)
+
+    def acquire(self, tenant):
+        """
+        Check out a browser for tenant, reusing its idle session when there is one
+
+        Blocks while every slot is held by a running job.
+        """
+        evicted = None
+        with self._lock:
+            session = self._idle.pop(tenant, None)
+            if session is None:
+                while not self._free_slots and not self._idle:
+                    self._slot_freed.wait()
+                if not self._free_slots:
+                    # Make room by closing the least recently used idle session
+                    evicted = min(self._idle.values(), key=lambda s: s.last_used)
+                    del self._idle[evicted.tenant]
+                    self._free_slots.append(evicted.slot)
+                slot = self._free_slots.pop(0)
+
+        if evicted is not None:
+            log.info(f"Closing idle session for {evicted.tenant} to make room for {tenant}")
+            evicted.quit()
+
+        if session is not None and session.alive():
+            if time.time() - session.last_used > self.auth_ttl:
+                session.authenticated = False
+            session.healthy = True
+            with self._lock:
+                self.reused += 1
+            log.info(
+                f"Reusing browser session for {tenant} "
+                f"({session.jobs} previous jobs, signed in: {session.authenticated})"
+            )
+            return session
+
+        if session is not None:
+            # The browser died while idle; start a new one in its slot
+            session.quit()
+            slot = session.slot
+        try:
+            session = self._start(tenant, slot)
+        except Exception:
+            self._free(slot)
+            raise
+        with self._lock:
+            self.started += 1
+        return session
+
+    def _free(self, slot):
+        with self._lock:
+            self._free_slots.append(slot)
+            self._slot_freed.notify()
+
+    def release(self, session):
+        """Return a session after a job; broken sessions are closed instead"""
+        session.jobs += 1
+        session.last_used = time.time()
+        if session.healthy and session.alive():
+            try:
+                session.reset()
+            except Exception as e:
+                log.warning(f"Error resetting session for {session.tenant}: {e}")
+                session.healthy = False
+
+        if not session.healthy or not session.alive():
+            session.quit()
+            self._free(session.slot)
+            return
+
+        evicted = None
+        with self._lock:
+            # Another job for the same tenant may have returned its session first
+            evicted = self._idle.get(session.tenant)
+            self._idle[session.tenant] = session
+            self._slot_freed.notify()
+        if evicted is not None:
+            evicted.quit()
+            self._free(evicted.slot)
+
+    def close_all(self):
+        with self._lock:
+            sessions = list(self._idle.values())
+            self._idle = {}
+            for session in sessions:
+                self._free_slots.append(session.slot)
+        for session in sessions:
+            session.quit()
+        if self.started or self.reused:
+            log.info(
+                f"Browser sessions: {self.started} started, "
+                f"{self.reused} reused for another posting"
+            )
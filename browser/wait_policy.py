@@ -0,0 +1,239 @@
+"""
+Condition-based replacement for the fixed time.sleep calls in workday.py.
+
+Every wait has a call-site name, a named readiness predicate and the fixed
+sleep it replaces. The wait ends as soon as the predicate is satisfied; its
+timeout starts at the old fixed sleep (so it is never slower than before)
+and tightens per tenant as timings are learned and persisted across runs.
+"""
+
+import json
+import os
+import threading
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from browser.command_accounting import command_phase
+from browser.quiescence import wait_for_quiescence
+from processing import tracing
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+# Number of recent successful waits kept per tenant and call site
+MAX_SAMPLES = 50
+# Samples needed before a call site's timeout is tightened
+MIN_SAMPLES = 5
+# Learned timeout = p95 of recent waits * TIMEOUT_MARGIN
+TIMEOUT_MARGIN = 1.5
+MIN_TIMEOUT = 0.5
+
+
+# Readiness predicates. Each returns a callable (driver, timeout) -> bool
+# that blocks until the condition holds or the timeout expires.
+
+
+def dom_idle(element=None, quiet_ms=300):
+    """The page (or the section around element) had no DOM or network activity for quiet_ms"""
+
+    def predicate(driver, timeout):
+        result = wait_for_quiescence(
+            driver, element=element, quiet_ms=quiet_ms, timeout=timeout
+        )
+        return result["quiet"] or result["detached"]
+
+    predicate.readiness = "dom_idle"
+    return predicate
+
+
+def element_present(*locators):
+    """Any of the (By, value) locators matches at least one element"""
+
+    def predicate(driver, timeout):
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: any(d.find_elements(*locator) for locator in locators)
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    predicate.readiness = "element_present"
+    return predicate
+
+
+def element_absent(*locators):
+    """None of the (By, value) locators match anymore"""
+
+    def predicate(driver, timeout):
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=0.5).until(
+                lambda d: not any(d.find_elements(*locator) for locator in locators)
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    predicate.readiness = "element_absent"
+    return predicate
+
+
+class WaitStats:
+    """
+    Per-tenant timings of every call site, persisted between runs, plus the
+    wall-clock time saved this run compared to the old fixed sleeps.
+    """
+
+    def __init__(self, stats_file="./config/wait_stats.json"):
+        self.stats_file = stats_file
+        self.tenants = self._load()
+        self.session = {}  # site -> {"calls", "timeouts", "waited", "legacy"}
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if os.path.exists(self.stats_file):
+            try:
+                with open(self.stats_file, "r") as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, OSError):
+                log.warning("Error loading wait stats, starting fresh")
+        return {}
+
+    def timeout_for(self, tenant, site, default):
+        """Timeout to use for a call site, tightened from learned timings"""
+        with self._lock:
+            site_stats = self.tenants.get(tenant, {}).get(site)
+            if not site_stats or len(site_stats["durations"]) < MIN_SAMPLES:
+                return default
+            # Recent timeouts mean the learned timings no longer hold
+            if site_stats["recent_timeouts"] > 0:
+                return default
+            durations = sorted(site_stats["durations"])
+            p95 = durations[min(len(durations) - 1, int(len(durations) * 0.95))]
+        return min(default, max(MIN_TIMEOUT, p95 * TIMEOUT_MARGIN))
+
+    def record(self, tenant, site, readiness, waited, ready, legacy_seconds):
+        with self._lock:
+            site_stats = self.tenants.setdefault(tenant, {}).setdefault(
+                site, {"durations": [], "recent_timeouts": 0}
+            )
+            if ready:
+                durations = site_stats["durations"] + [round(waited, 3)]
+                site_stats["durations"] = durations[-MAX_SAMPLES:]
+                site_stats["recent_timeouts"] = max(0, site_stats["recent_timeouts"] - 1)
+            else:
+                site_stats["recent_timeouts"] = min(3, site_stats["recent_timeouts"] + 1)
+
+            session_stats = self.session.setdefault(
+                site,
+                {
+                    "readiness": readiness,
+                    "calls": 0,
+                    "timeouts": 0,
+                    "waited": 0.0,
+                    "legacy": 0.0,
+                },
+            )
+            session_stats["calls"] += 1
+            session_stats["timeouts"] += 0 if ready else 1
+            session_stats["waited"] += waited
+            session_stats["legacy"] += legacy_seconds
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.stats_file) or ".", exist_ok=True)
+        with self._lock:
+            data = json.dumps(self.tenants, indent=2)
+        tmp_file = self.stats_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write(data)
+        os.replace(tmp_file, self.stats_file)
+
+    def report(self):
+        """Print how long each call site waited compared to its old fixed sleep"""
+        if not self.session:
+            return
+        log.info("\n===== Wait Policy Report =====")
+        log.info(
+            f"{'call site':<26}{'readiness':<17}{'calls':>6}{'timeouts':>9}"
+            f"{'waited':>10}{'fixed':>10}{'saved':>10}"
+        )
+        total_waited = total_legacy = 0.0
+        for site, stats in sorted(
+            self.session.items(), key=lambda item: item[1]["waited"] - item[1]["legacy"]
+        ):
+            saved = stats["legacy"] - stats["waited"]
+            total_waited += stats["waited"]
+            total_legacy += stats["legacy"]
+            log.info(
+                f"{site:<26}{stats['readiness']:<17}{stats['calls']:>6}{stats['timeouts']:>9}"
+                f"{stats['waited']:>9.1f}s{stats['legacy']:>9.1f}s{saved:>9.1f}s"
+            )
+        log.info(
+            f"Total: waited {total_waited:.1f}s instead of {total_legacy:.1f}s, "
+            f"saved {total_legacy - total_waited:.1f}s"
+        )
+
+
+_shared_stats = None
+_stats_lock = threading.Lock()
+
+
+def get_wait_stats():
+    """Process-wide WaitStats, loaded from disk on first use"""
+    global _shared_stats
+    with _stats_lock:
+        if _shared_stats is None:
+            _shared_stats = WaitStats()
+        return _shared_stats
+
+
+class WaitPolicy:
+    """Runs condition-based waits for one browser session"""
+
+    def __init__(self, driver, stats=None, tenant="default"):
+        self.driver = driver
+        self.stats = stats if stats is not None else get_wait_stats()
+        self.tenant = tenant
+
+    def wait(self, site, predicate, legacy_seconds, timeout=None, adaptive=True):
+        """
+        Wait until predicate is satisfied instead of sleeping a fixed time
+
+        Args:
+            site: str - Name of the call site, used for stats and reporting
+            predicate: callable - A readiness predicate from this module
+            legacy_seconds: float - The fixed sleep this wait replaces
+            timeout: float - Upper bound on the wait, defaults to legacy_seconds
+            adaptive: bool - Whether the timeout may be tightened from learned timings
+
+        Returns:
+            bool: True if the condition was met, False if the wait timed out
+        """
+        timeout = timeout if timeout is not None else legacy_seconds
+        if adaptive:
+            timeout = self.stats.timeout_for(self.tenant, site, timeout)
+
+        start_time = time.time()
+        with tracing.span(site, category="wait", timeout=round(timeout, 2)) as span:
+            try:
+                with command_phase(self.driver, "waiting"):
+                    ready = bool(predicate(self.driver, timeout))
+            except Exception as e:
+                log.warning(f"Error waiting for {site}: {e}")
+                # Can't tell when the page is ready, so fall back to a fixed wait
+                time.sleep(max(0, timeout - (time.time() - start_time)))
+                ready = False
+            span.outcome = "ready" if ready else "timeout"
+        waited = time.time() - start_time
+
+        self.stats.record(
+            self.tenant,
+            site,
+            getattr(predicate, "readiness", "custom"),
+            waited,
+            ready,
+            legacy_seconds,
+        )
+        return ready
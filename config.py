@@ -1,27 +1,173 @@
+import os
+import threading
+from datetime import datetime, timedelta
+
 import yaml
 
+try:
+  import fcntl
+except ImportError:
+  # No advisory locking on Windows; appends are still one write per line
+  fcntl = None
+
+# A company's last_signin is only appended again once the recorded one is
+# this old, so signing in for every application doesn't grow the file
+SIGNIN_RECORD_INTERVAL = timedelta(hours=24)
+
+
+class CompanyRegistry:
+  """
+  Company subdomains we have a Workday account with, loaded once into a set.
+
+  Each line of companies.txt is a subdomain, optionally followed by
+  tab-separated key=value metadata (last_signin, account_state, ...). Updates
+  are appended as new lines under a file lock, and a later line for the same
+  company overrides the metadata of earlier ones, so the file never has to be
+  rewritten. Lines appended by other processes are picked up on the next
+  lookup.
+  """
+
+  def __init__(self, companies_file="./config/companies.txt"):
+    self.companies_file = companies_file
+    self._companies = {}  # subdomain -> metadata dict
+    self._offset = 0
+    self._lock = threading.Lock()
+    with self._lock:
+      self._refresh()
+
+  def _parse(self, line):
+    fields = line.rstrip("\n").split("\t")
+    company = fields[0].strip()
+    metadata = {}
+    for field in fields[1:]:
+      key, _, value = field.partition("=")
+      if key:
+        metadata[key.strip()] = value.strip()
+    return company, metadata
+
+  def _refresh(self, locked=False):
+    # Read only what was appended since the last refresh
+    try:
+      if os.path.getsize(self.companies_file) <= self._offset:
+        return
+    except OSError:
+      return
+    with open(self.companies_file, 'rb') as companies_file:
+      # Writers hold an exclusive lock, so this never sees half a line
+      if fcntl is not None and not locked:
+        fcntl.flock(companies_file.fileno(), fcntl.LOCK_SH)
+      companies_file.seek(self._offset)
+      data = companies_file.read()
+    self._offset += len(data)
+    for line in data.decode("utf-8").splitlines():
+      company, metadata = self._parse(line)
+      if company:
+        self._companies.setdefault(company, {}).update(metadata)
+
+  def __contains__(self, company):
+    with self._lock:
+      self._refresh()
+      return company in self._companies
+
+  def __iter__(self):
+    with self._lock:
+      self._refresh()
+      return iter(list(self._companies))
+
+  def __len__(self):
+    with self._lock:
+      self._refresh()
+      return len(self._companies)
+
+  def metadata(self, company):
+    with self._lock:
+      self._refresh()
+      return dict(self._companies.get(company, {}))
+
+  def _is_redundant(self, company, metadata):
+    """Whether a line with this metadata would change nothing worth keeping"""
+    if company not in self._companies:
+      return False
+    current = self._companies[company]
+    for key, value in metadata.items():
+      if key == "last_signin" and current.get(key):
+        try:
+          elapsed = datetime.fromisoformat(str(value)) - datetime.fromisoformat(
+            current[key]
+          )
+        except ValueError:
+          return False
+        if elapsed >= SIGNIN_RECORD_INTERVAL:
+          return False
+      elif current.get(key) != str(value):
+        return False
+    return True
+
+  def update(self, company, **metadata):
+    """
+    Add a company, or record new metadata for it, with one appended line.
+    Nothing is appended if the metadata is already recorded, or only moves
+    last_signin forward by less than SIGNIN_RECORD_INTERVAL.
+    """
+    fields = [company] + [f"{key}={value}" for key, value in metadata.items()]
+    with self._lock:
+      os.makedirs(os.path.dirname(self.companies_file) or ".", exist_ok=True)
+      with open(self.companies_file, 'a+') as companies_file:
+        if fcntl is not None:
+          fcntl.flock(companies_file.fileno(), fcntl.LOCK_EX)
+        try:
+          self._refresh(locked=True)
+          if self._is_redundant(company, metadata):
+            return
+          # Older files don't end with a newline
+          prefix = ""
+          if companies_file.tell() > 0:
+            companies_file.seek(companies_file.tell() - 1)
+            if companies_file.read(1) != "\n":
+              prefix = "\n"
+          companies_file.write(prefix + "\t".join(fields) + "\n")
+          companies_file.flush()
+          self._refresh(locked=True)
+        finally:
+          if fcntl is not None:
+            fcntl.flock(companies_file.fileno(), fcntl.LOCK_UN)
+
+
+_company_registries = {}
+_company_registries_lock = threading.Lock()
+
+
+def get_company_registry(companies_file="./config/companies.txt"):
+  """Process-wide CompanyRegistry, so parallel workers share one set"""
+  with _company_registries_lock:
+    key = os.path.abspath(companies_file)
+    if key not in _company_registries:
+      _company_registries[key] = CompanyRegistry(companies_file)
+    return _company_registries[key]
+
+
 class Config:
   def __init__(self, file):
     self.file = file
     self.profile = {}  # Example, this should be populated from file
     self.load_config()
+    self.companies = get_company_registry()
 
   def read_companies(self):
-    companies_file = open("./config/companies.txt", 'r')
-    company_subdomains = []
-    for company_subdomain in companies_file:
-      company_subdomains.append(company_subdomain.strip())
-    companies_file.close()
-    print("company_subdomains:", company_subdomains)
-    return company_subdomains
-
-  def write_company(self, company_subdomain):
-    company_subdomains = self.read_companies()
-    if company_subdomain in company_subdomains:
-      return
-    companies_file = open("./config/companies.txt", 'a+')
-    companies_file.writelines("\n"+company_subdomain)
-    companies_file.close()
+    return list(self.companies)
+
+  def has_company(self, company_subdomain):
+    return company_subdomain in self.companies
+
+  def write_company(self, company_subdomain, **metadata):
+    self.companies.update(company_subdomain, **metadata)
+
+  def record_signin(self, company_subdomain, account_state="active"):
+    self.companies.update(
+      company_subdomain,
+      last_signin=datetime.now().isoformat(timespec="seconds"),
+      account_state=account_state,
+    )
 
   def load_config(self):
       with open(self.file, 'r') as f:
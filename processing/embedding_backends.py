@@ -0,0 +1,164 @@
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+
+class SentenceTransformerBackend:
+    """Float sentence-transformers (torch) model, shared through the model registry"""
+
+    def __init__(self, model_name):
+        self.model_name = model_name
+        self.name = model_name
+
+    def encode(self, texts):
+        from processing.model_registry import get_model
+
+        return get_model(self.model_name).encode(
+            list(texts), convert_to_numpy=True, normalize_embeddings=True
+        )
+
+
+class OnnxBackend:
+    """
+    The same model exported to ONNX with int8 dynamic quantization.
+
+    Inference only needs onnxruntime, tokenizers and numpy, so torch is never
+    imported once the model has been exported. Exporting (done automatically
+    the first time) needs torch and transformers.
+    """
+
+    def __init__(self, model_name, model_dir="./config/onnx", max_length=256):
+        # Fail early so the registry can fall back to the float backend
+        import onnxruntime  # noqa: F401
+        import tokenizers  # noqa: F401
+
+        self.model_name = model_name
+        self.name = f"{model_name}:onnx-int8"
+        self.model_dir = os.path.join(model_dir, model_name)
+        self.max_length = max_length
+        self._session = None
+        self._tokenizer = None
+        # The backend is shared by every worker thread, so only one of them loads it
+        self._lock = threading.Lock()
+
+    @property
+    def model_path(self):
+        return os.path.join(self.model_dir, "model-int8.onnx")
+
+    @property
+    def tokenizer_path(self):
+        return os.path.join(self.model_dir, "tokenizer.json")
+
+    def export(self):
+        """
+        Export the Hugging Face model to ONNX and quantize its weights to int8
+
+        The files are written to a temporary directory and then moved into
+        model_dir with os.replace, quantized model last, so a concurrent
+        export or load never sees a partly written model or tokenizer.
+        """
+        import torch
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+        from transformers import AutoModel, AutoTokenizer
+
+        hub_name = f"sentence-transformers/{self.model_name}"
+        log.info(f"Exporting {hub_name} to ONNX in {self.model_dir}...")
+        os.makedirs(self.model_dir, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".export-", dir=self.model_dir)
+        try:
+            tokenizer = AutoTokenizer.from_pretrained(hub_name)
+            tokenizer.save_pretrained(tmp_dir)
+            model = AutoModel.from_pretrained(hub_name).eval()
+
+            input_names = ["input_ids", "attention_mask", "token_type_ids"]
+            dummy = tokenizer(["How did you hear about us?"], return_tensors="pt")
+            float_path = os.path.join(tmp_dir, "model.onnx")
+            with torch.no_grad():
+                torch.onnx.export(
+                    model,
+                    tuple(dummy[name] for name in input_names),
+                    float_path,
+                    input_names=input_names,
+                    output_names=["last_hidden_state"],
+                    dynamic_axes={
+                        name: {0: "batch", 1: "sequence"}
+                        for name in input_names + ["last_hidden_state"]
+                    },
+                    opset_version=14,
+                )
+            quantized_name = os.path.basename(self.model_path)
+            quantize_dynamic(
+                float_path,
+                os.path.join(tmp_dir, quantized_name),
+                weight_type=QuantType.QInt8,
+            )
+
+            # _load only checks for model_path, so it must appear last
+            for name in sorted(os.listdir(tmp_dir), key=lambda n: n == quantized_name):
+                os.replace(
+                    os.path.join(tmp_dir, name), os.path.join(self.model_dir, name)
+                )
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        log.info(f"Saved quantized model to {self.model_path}")
+
+    def _load(self):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        with self._lock:
+            # Another thread may have loaded it while this one waited
+            if self._session is not None:
+                return
+            if not (
+                os.path.exists(self.model_path) and os.path.exists(self.tokenizer_path)
+            ):
+                self.export()
+
+            tokenizer = Tokenizer.from_file(self.tokenizer_path)
+            tokenizer.enable_truncation(max_length=self.max_length)
+            tokenizer.enable_padding(pad_id=0, pad_token="[PAD]")
+            self._tokenizer = tokenizer
+            # Set last: encode() only takes the lock while _session is None
+            self._session = onnxruntime.InferenceSession(
+                self.model_path, providers=["CPUExecutionProvider"]
+            )
+
+    def encode(self, texts):
+        if self._session is None:
+            self._load()
+
+        encodings = self._tokenizer.encode_batch(list(texts))
+        feeds = {
+            "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+            "attention_mask": np.array(
+                [e.attention_mask for e in encodings], dtype=np.int64
+            ),
+            "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64),
+        }
+        input_names = {model_input.name for model_input in self._session.get_inputs()}
+        token_embeddings = self._session.run(
+            None, {name: value for name, value in feeds.items() if name in input_names}
+        )[0]
+
+        # Mean pooling over real tokens followed by L2 normalization, as in the
+        # sentence-transformers pipeline for this model
+        mask = feeds["attention_mask"][..., None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.maximum(
+            mask.sum(axis=1), 1e-9
+        )
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return (pooled / np.maximum(norms, 1e-12)).astype(np.float32)
+
+
+BACKENDS = {
+    "sentence-transformers": SentenceTransformerBackend,
+    "onnx-int8": OnnxBackend,
+}
@@ -0,0 +1,124 @@
+import hashlib
+import os
+import re
+import threading
+
+import numpy as np
+
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed store of sentence embeddings persisted to disk.
+
+    Every entry is keyed by the model name plus the normalized text, so an
+    entry only has to be re-encoded when its text (or the model) changes.
+    The whole store is kept in memory as one contiguous float32 matrix.
+    """
+
+    def __init__(self, model_name, cache_file="./config/embedding_cache.npz"):
+        self.model_name = model_name
+        self.cache_file = cache_file
+        self._rows = {}  # key -> row in self._matrix
+        self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._used = set()
+        self._dirty = False
+        # Shared by every Workday in the process, possibly from several threads
+        self._lock = threading.RLock()
+        self._load()
+
+    @staticmethod
+    def normalize(text):
+        """Lowercase and collapse whitespace so trivial edits don't invalidate entries"""
+        return re.sub(r"\s+", " ", str(text)).strip().lower()
+
+    def _key(self, normalized_text):
+        return hashlib.sha1(
+            f"{self.model_name}\0{normalized_text}".encode("utf-8")
+        ).hexdigest()
+
+    def _load(self):
+        """Load the cached matrix from file if it exists"""
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with np.load(self.cache_file, allow_pickle=False) as data:
+                keys = [str(key) for key in data["keys"]]
+                matrix = np.ascontiguousarray(data["vectors"], dtype=np.float32)
+        except Exception as e:
+            log.warning(f"Error loading embedding cache, rebuilding: {e}")
+            return
+        if len(keys) != len(matrix):
+            log.warning("Embedding cache is inconsistent, rebuilding")
+            return
+        self._rows = {key: row for row, key in enumerate(keys)}
+        self._matrix = matrix
+        log.info(f"Loaded {len(keys)} cached embeddings from {self.cache_file}")
+
+    def __len__(self):
+        return len(self._rows)
+
+    def encode(self, texts, encoder):
+        """
+        Return embeddings for texts, encoding only the ones not cached yet
+
+        Args:
+            texts: list[str] - The texts to embed
+            encoder: callable - Takes a list of str and returns a 2D numpy array
+
+        Returns:
+            np.ndarray: One row per text, in the same order as texts
+        """
+        normalized = [self.normalize(text) for text in texts]
+        keys = [self._key(text) for text in normalized]
+
+        with self._lock:
+            missing = {}
+            for key, text in zip(keys, normalized):
+                if key not in self._rows and key not in missing:
+                    missing[key] = text
+
+            if missing:
+                log.info(f"Encoding {len(missing)} uncached texts")
+                vectors = np.asarray(
+                    encoder(list(missing.values())), dtype=np.float32
+                )
+                if len(self._rows) == 0:
+                    self._matrix = np.ascontiguousarray(vectors)
+                else:
+                    self._matrix = np.vstack([self._matrix, vectors])
+                for key in missing:
+                    self._rows[key] = len(self._rows)
+                self._dirty = True
+
+            self._used.update(keys)
+            return self._matrix[[self._rows[key] for key in keys]]
+
+    def save(self):
+        """
+        Persist the cache, dropping entries that were not used since it was loaded.
+
+        Stale entries belong to keyword text that has since been edited, so
+        keeping them would only grow the file.
+        """
+        with self._lock:
+            stale = len(self._rows) - len(self._used)
+            if not self._used or (not self._dirty and stale == 0):
+                return
+
+            keys = [key for key in self._rows if key in self._used]
+            matrix = self._matrix[[self._rows[key] for key in keys]]
+
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            tmp_file = self.cache_file + ".tmp"
+            with open(tmp_file, "wb") as f:
+                np.savez(f, keys=np.array(keys, dtype=str), vectors=matrix)
+            os.replace(tmp_file, self.cache_file)
+
+            self._rows = {key: row for row, key in enumerate(keys)}
+            self._matrix = np.ascontiguousarray(matrix)
+            self._dirty = False
+        log.info(f"Saved {len(keys)} embeddings to {self.cache_file}")
@@ -0,0 +1,206 @@
+import queue
+import threading
+from collections import deque
+from urllib.parse import urlparse
+
+from browser.session_pool import SessionPool
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+
+class ManualInputRequired(BaseException):
+    """
+    Raised by a non-interactive Workday when it would have to wait for a human.
+
+    Derives from BaseException so the broad `except Exception` handlers in the
+    application flow don't swallow it on its way back to the runner.
+    """
+
+
+def company_subdomain(url):
+    """The Workday tenant of a job URL, e.g. 'acme' for acme.wd5.myworkdayjobs.com"""
+    return urlparse(url).netloc.split(".")[0]
+
+
+class JobRunner:
+    """
+    Runs several applications concurrently, each in its own Chrome.
+
+    Automated workers never prompt: a job that needs a human is stopped and
+    re-queued to a single interactive lane, so it doesn't hold up the other
+    jobs. All workers run in one process and share the embedding model, and
+    browsers are pooled per company so later postings skip signin.
+    """
+
+    def __init__(
+        self,
+        workday_factory,
+        workers=2,
+        per_company_limit=1,
+        base_port=9222,
+        profiles_dir="./config/chrome_profiles",
+    ):
+        """
+        Args:
+            workday_factory: callable - Takes (url, interactive, session) and returns
+                an object with apply()
+            workers: int - Number of automated workers
+            per_company_limit: int - Max applications running at once per company subdomain
+            base_port: int - Debugging port of the interactive lane; workers use the next ones
+            profiles_dir: str - Where each worker keeps its Chrome user data dir
+        """
+        self.workday_factory = workday_factory
+        self.workers = max(1, workers)
+        self.per_company_limit = max(1, per_company_limit)
+        self.base_port = base_port
+        self.profiles_dir = profiles_dir
+
+        # One Chrome per worker; idle ones stay signed in to their company
+        self.automated_sessions = SessionPool(
+            max_sessions=self.workers,
+            base_port=base_port + 1,
+            profiles_dir=profiles_dir,
+            name="worker",
+        )
+        self.interactive_sessions = SessionPool(
+            max_sessions=1,
+            base_port=base_port,
+            profiles_dir=profiles_dir,
+            name="interactive",
+        )
+
+        self.interactive_queue = queue.Queue()
+        self.results = {}
+        self.last_workday = None
+        # Jobs waiting for an automated worker, per company in arrival order,
+        # and how many applications each company has running in either lane
+        self._pending = {}
+        self._running = {}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+
+    def _take_automated_job(self):
+        """
+        Block until a pending job's company is below its limit and claim it
+
+        Returns:
+            str - The job URL, or None once no automated jobs are left
+        """
+        with self._changed:
+            while self._pending:
+                for company, urls in self._pending.items():
+                    if self._running.get(company, 0) < self.per_company_limit:
+                        url = urls.popleft()
+                        if not urls:
+                            del self._pending[company]
+                            # Workers waiting on this company may now be done
+                            self._changed.notify_all()
+                        self._running[company] = self._running.get(company, 0) + 1
+                        return url
+                # Every company with pending jobs is at its limit
+                self._changed.wait()
+            return None
+
+    def _claim_company(self, company):
+        """Block until company is below its limit, then count one more running job"""
+        with self._changed:
+            while self._running.get(company, 0) >= self.per_company_limit:
+                self._changed.wait()
+            self._running[company] = self._running.get(company, 0) + 1
+
+    def _release_company(self, company):
+        with self._changed:
+            self._running[company] -= 1
+            self._changed.notify_all()
+
+    def _record(self, url, status):
+        with self._lock:
+            self.results[url] = status
+        if status == "applied":
+            log.info(f"[{status.upper()}] {url}")
+        else:
+            log.warning(f"[{status.upper()}] {url}")
+
+    def _apply(self, url, sessions, interactive):
+        session = sessions.acquire(company_subdomain(url))
+        try:
+            workday = self.workday_factory(
+                url, interactive=interactive, session=session
+            )
+            with self._lock:
+                self.last_workday = workday
+            return workday.apply()
+        finally:
+            sessions.release(session)
+
+    def _automated_worker(self, worker_id):
+        worker_name = f"worker-{worker_id}"
+        while True:
+            url = self._take_automated_job()
+            if url is None:
+                return
+
+            try:
+                log.info(f"[{worker_name}] Processing {url}")
+                result = self._apply(url, self.automated_sessions, interactive=False)
+                self._record(url, "applied" if result else "failed")
+            except ManualInputRequired as e:
+                log.warning(
+                    f"[{worker_name}] Needs manual input ({e}), moving to interactive lane"
+                )
+                self.interactive_queue.put(url)
+            except Exception as e:
+                log.error(f"[{worker_name}] Error processing job {url}: {e}")
+                self._record(url, "error")
+            finally:
+                self._release_company(company_subdomain(url))
+
+    def _interactive_worker(self):
+        while True:
+            url = self.interactive_queue.get()
+            if url is None:
+                return
+            company = company_subdomain(url)
+            self._claim_company(company)
+            try:
+                log.info(f"[interactive] Processing {url}")
+                result = self._apply(url, self.interactive_sessions, interactive=True)
+                self._record(url, "applied" if result else "failed")
+            except Exception as e:
+                log.error(f"[interactive] Error processing job {url}: {e}")
+                self._record(url, "error")
+            finally:
+                self._release_company(company)
+
+    def run(self, urls):
+        """
+        Apply to every URL and return {url: "applied" | "failed" | "error"}
+        """
+        with self._lock:
+            for url in urls:
+                self._pending.setdefault(company_subdomain(url), deque()).append(url)
+
+        interactive = threading.Thread(
+            target=self._interactive_worker, name="interactive", daemon=True
+        )
+        interactive.start()
+        workers = [
+            threading.Thread(
+                target=self._automated_worker,
+                args=(worker_id,),
+                name=f"worker-{worker_id}",
+            )
+            for worker_id in range(self.workers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        # Automated work is done; the interactive lane finishes what's left
+        self.automated_sessions.close_all()
+        self.interactive_queue.put(None)
+        interactive.join()
+        self.interactive_sessions.close_all()
+        return self.results
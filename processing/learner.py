@@ -1,10 +1,33 @@
-import json
-import os
+import difflib
 import time
 from datetime import datetime
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
+
+from processing.learning_store import get_learning_journal
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+# Browser-side capture limits: XHRs kept per observation and characters kept
+# of each response body (the full body is only represented by its hash)
+MAX_XHR_CAPTURES = 50
+MAX_RESPONSE_CHARS = 500
+# Changed lines kept from an element's outerHTML diff
+MAX_HTML_DIFF_LINES = 40
+
+
+def html_diff(before, after):
+    """Changed lines between two outerHTML snapshots, one tag per line"""
+    split = lambda html: (html or "").replace(">", ">\n").splitlines()
+    lines = [
+        line
+        for line in difflib.unified_diff(split(before), split(after), lineterm="", n=0)
+        if line[:1] in "+-" and not line.startswith(("+++", "---"))
+    ]
+    if len(lines) > MAX_HTML_DIFF_LINES:
+        lines = lines[:MAX_HTML_DIFF_LINES] + [
+            f"... {len(lines) - MAX_HTML_DIFF_LINES} more changed lines"
+        ]
+    return lines
 
 
 class InteractionLearner:
@@ -12,53 +35,32 @@ class InteractionLearner:
     A more sophisticated learning system that observes actual DOM changes and network 
     activity when automation fails and the user manually intervenes.
     """
-    def __init__(self, driver, learning_file="./config/learned_interactions.json"):
+    def __init__(self, driver, learning_file="./config/learned_interactions.jsonl"):
         self.driver = driver
         self.learning_file = learning_file
-        self.learning_data = self._load_learning_data()
+        # Shared by every learner in the process; events are appended to its
+        # journal as they happen instead of rewriting the whole file
+        self.store = get_learning_journal(learning_file)
+        self.learning_data = self.store.data
         self.snapshot_before = None
         self.network_logs = []
         self.observation_active = False
         self.current_element = None
         self.current_question = None
         
-    def _load_learning_data(self):
-        """Load existing learning data from file if it exists"""
-        if os.path.exists(self.learning_file):
-            try:
-                with open(self.learning_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                print("Error loading learning data, creating new file")
-                return self._create_empty_data()
-        else:
-            return self._create_empty_data()
-    
-    def _create_empty_data(self):
-        return {
-            "learned_questions": [],
-            "observed_interactions": [],
-            "network_logs": [],
-            "failed_attempts": []
-        }
-    
     def save_learning_data(self):
-        """Save learning data to file"""
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.learning_file), exist_ok=True)
-        
-        with open(self.learning_file, 'w') as f:
-            json.dump(self.learning_data, f, indent=2)
-        print(f"Saved learning data to {self.learning_file}")
+        """Flush the journal and fold it into the snapshot file"""
+        self.store.flush()
+        self.store.compact()
     
     def start_observation(self, element, question_text, element_type):
         """
         Start observing an element for changes when the user manually intervenes
         """
-        print("\n" + "="*80)
-        print(f"LEARNING MODE ACTIVATED for question: '{question_text}'")
-        print("Please manually fill out this field. The system will observe your interaction.")
-        print("="*80 + "\n")
+        log.warning("\n" + "="*80)
+        log.warning(f"LEARNING MODE ACTIVATED for question: '{question_text}'")
+        log.warning("Please manually fill out this field. The system will observe your interaction.")
+        log.warning("="*80 + "\n")
         
         self.observation_active = True
         self.current_element = element
@@ -76,61 +78,90 @@ class InteractionLearner:
     def _setup_mutation_observer(self, element):
         """Set up a JavaScript mutation observer to track DOM changes"""
         observer_script = """
-        // Store the original XHR open and send methods
-        const originalOpen = XMLHttpRequest.prototype.open;
-        const originalSend = XMLHttpRequest.prototype.send;
+        const maxCaptures = arguments[0];
+        const maxResponseChars = arguments[1];
+        window.__xhrCaptureLimits = {captures: maxCaptures, responseChars: maxResponseChars};
         
         // Global array to store XHR information
         window.xhrCaptures = [];
         
-        // Override the open method
-        XMLHttpRequest.prototype.open = function() {
-            this._method = arguments[0];
-            this._url = arguments[1];
-            return originalOpen.apply(this, arguments);
-        };
-        
-        // Override the send method
-        XMLHttpRequest.prototype.send = function() {
-            const xhr = this;
-            const startTime = new Date().getTime();
+        // Wrap XHR only once per page, or every observation would add another
+        // layer and record each request again
+        if (!window.__xhrCaptureInstalled) {
+            window.__xhrCaptureInstalled = true;
             
-            // Add event listener for when the request completes
-            this.addEventListener('load', function() {
-                const endTime = new Date().getTime();
-                const captureObj = {
-                    method: xhr._method,
-                    url: xhr._url,
-                    status: xhr.status,
-                    duration: endTime - startTime,
-                    responseType: xhr.responseType,
-                    timestamp: new Date().toISOString()
-                };
-                
-                // Try to capture response data if it's not binary
-                if (xhr.responseType === '' || xhr.responseType === 'text') {
-                    captureObj.response = xhr.responseText;
-                } else {
-                    captureObj.response = "[" + xhr.responseType + " data]";
+            // Store the original XHR open and send methods
+            const originalOpen = XMLHttpRequest.prototype.open;
+            const originalSend = XMLHttpRequest.prototype.send;
+            
+            // FNV-1a, enough to tell response bodies apart without keeping them
+            const hashText = function(text) {
+                let hash = 0x811c9dc5;
+                for (let i = 0; i < text.length; i++) {
+                    hash ^= text.charCodeAt(i);
+                    hash = Math.imul(hash, 0x01000193);
                 }
-                
-                // Store the capture
-                window.xhrCaptures.push(captureObj);
-            });
+                return (hash >>> 0).toString(16);
+            };
+            
+            // Override the open method
+            XMLHttpRequest.prototype.open = function() {
+                this._method = arguments[0];
+                this._url = arguments[1];
+                return originalOpen.apply(this, arguments);
+            };
             
-            return originalSend.apply(this, arguments);
-        };
+            // Override the send method
+            XMLHttpRequest.prototype.send = function() {
+                const xhr = this;
+                const startTime = new Date().getTime();
+                
+                // Add event listener for when the request completes
+                this.addEventListener('load', function() {
+                    const limits = window.__xhrCaptureLimits;
+                    const endTime = new Date().getTime();
+                    const captureObj = {
+                        method: xhr._method,
+                        url: xhr._url,
+                        status: xhr.status,
+                        duration: endTime - startTime,
+                        responseType: xhr.responseType,
+                        timestamp: new Date().toISOString()
+                    };
+                    
+                    // Keep the start of text responses plus their length and hash
+                    if (xhr.responseType === '' || xhr.responseType === 'text') {
+                        const text = xhr.responseText || '';
+                        captureObj.response = text.slice(0, limits.responseChars);
+                        captureObj.responseLength = text.length;
+                        captureObj.responseHash = hashText(text);
+                    } else {
+                        captureObj.response = "[" + xhr.responseType + " data]";
+                    }
+                    
+                    // Store the capture, dropping the oldest beyond the cap
+                    window.xhrCaptures.push(captureObj);
+                    if (window.xhrCaptures.length > limits.captures) {
+                        window.xhrCaptures.shift();
+                    }
+                });
+                
+                return originalSend.apply(this, arguments);
+            };
+        }
         
         // Return true to indicate script was executed
-        true;
+        return true;
         """
         
         try:
             # Execute the XHR capture setup
-            self.driver.execute_script(observer_script)
-            print("Network monitoring activated")
+            self.driver.execute_script(
+                observer_script, MAX_XHR_CAPTURES, MAX_RESPONSE_CHARS
+            )
+            log.info("Network monitoring activated")
         except Exception as e:
-            print(f"Error setting up network monitoring: {e}")
+            log.warning(f"Error setting up network monitoring: {e}")
     
     def _capture_element_state(self, element):
         """Capture the current state of an element"""
@@ -153,16 +184,9 @@ class InteractionLearner:
             
             state["attributes"] = attributes
             
-            # Capture parent context for better understanding
-            try:
-                parent = element.find_element(By.XPATH, "./..")
-                state["parent_html"] = parent.get_attribute("outerHTML")
-            except:
-                state["parent_html"] = None
-                
             return state
         except Exception as e:
-            print(f"Error capturing element state: {e}")
+            log.warning(f"Error capturing element state: {e}")
             return {"error": str(e)}
     
     def _capture_network_state(self):
@@ -172,7 +196,7 @@ class InteractionLearner:
             self.driver.execute_script("window.xhrCaptures = [];")
             self.network_logs = []
         except Exception as e:
-            print(f"Error resetting network capture: {e}")
+            log.warning(f"Error resetting network capture: {e}")
     
     def _get_network_activity(self):
         """Get all captured XHR activity"""
@@ -180,7 +204,7 @@ class InteractionLearner:
             xhrs = self.driver.execute_script("return window.xhrCaptures;")
             return xhrs if xhrs else []
         except Exception as e:
-            print(f"Error getting network activity: {e}")
+            log.warning(f"Error getting network activity: {e}")
             return []
     
     def end_observation(self):
@@ -188,8 +212,8 @@ class InteractionLearner:
         if not self.observation_active:
             return
             
-        print("\n" + "="*80)
-        print("ANALYZING USER INTERACTION...")
+        log.info("\n" + "="*80)
+        log.info("ANALYZING USER INTERACTION...")
         
         # Wait a moment for any async operations to complete
         time.sleep(2)
@@ -206,17 +230,14 @@ class InteractionLearner:
         # Record the learned interaction
         self._record_interaction(changes, network_logs)
         
-        print("LEARNING COMPLETE!")
-        print("="*80 + "\n")
+        log.info("LEARNING COMPLETE!")
+        log.info("="*80 + "\n")
         
         # Reset observation state
         self.observation_active = False
         self.current_element = None
         self.current_question = None
         self.snapshot_before = None
-        
-        # Save the updated data
-        self.save_learning_data()
     
     def _analyze_changes(self, before, after):
         """Analyze the changes between before and after states"""
@@ -244,9 +265,12 @@ class InteractionLearner:
                 "after": after.get("classes")
             }
         
-        # Check HTML changes
+        # Check HTML changes, keeping a bounded diff rather than both snapshots
         if before.get("html") != after.get("html"):
             changes["html_changed"] = True
+            changes["details"]["html_diff"] = html_diff(
+                before.get("html"), after.get("html")
+            )
         
         # Check attribute changes
         before_attrs = before.get("attributes", {})
@@ -279,15 +303,15 @@ class InteractionLearner:
             "changes": changes,
             "network_requests": [
                 {
-                    "url": log.get("url"),
-                    "method": log.get("method"),
-                    "status": log.get("status")
-                } for log in network_logs[:5]  # Store only essential info for the first 5 logs
+                    "url": entry.get("url"),
+                    "method": entry.get("method"),
+                    "status": entry.get("status")
+                } for entry in network_logs[:5]  # Store only essential info for the first 5 logs
             ] if network_logs else []
         }
         
         # Add to learning data
-        self.learning_data["observed_interactions"].append(observation)
+        self.store.append("observed_interactions", observation)
         
         # Also add a more structured question mapping for easy retrieval
         question_mapping = {
@@ -298,12 +322,12 @@ class InteractionLearner:
             "value": user_input
         }
         
-        self.learning_data["learned_questions"].append(question_mapping)
+        self.store.append("learned_questions", question_mapping)
         
-        print(f"Learned interaction for question: '{self.current_question}'")
-        print(f"  Element type: {element_type}")
-        print(f"  Action type: {action_type}")
-        print(f"  User input: {user_input}")
+        log.info(f"Learned interaction for question: '{self.current_question}'")
+        log.info(f"  Element type: {element_type}")
+        log.info(f"  Action type: {action_type}")
+        log.info(f"  User input: {user_input}")
     
     def _extract_user_input(self, changes):
         """Extract what the user actually entered or selected"""
@@ -351,8 +375,8 @@ class InteractionLearner:
                 return input_type
         
         # Look at network requests for clues
-        for log in network_logs:
-            url = log.get("url", "").lower()
+        for entry in network_logs:
+            url = entry.get("url", "").lower()
             if "dropdown" in url or "select" in url:
                 return "dropdown"
             if "checkbox" in url:
@@ -405,45 +429,7 @@ class InteractionLearner:
     
     def find_similar_question(self, question_text, threshold=0.7):
         """Find if a similar question has been learned before"""
-        # First try exact match
-        for mapping in self.learning_data["learned_questions"]:
-            if mapping["question"].lower() == question_text.lower():
-                return mapping
-        
-        # Then try partial matches
-        best_match = None
-        best_score = 0
-        
-        for mapping in self.learning_data["learned_questions"]:
-            # Basic word overlap scoring
-            stored_q = mapping["question"].lower()
-            current_q = question_text.lower()
-            
-            words1 = set(stored_q.split())
-            words2 = set(current_q.split())
-            
-            if not words1 or not words2:
-                continue
-                
-            # Calculate Jaccard similarity
-            intersection = words1.intersection(words2)
-            union = words1.union(words2)
-            
-            score = len(intersection) / len(union)
-            
-            # Boost score if key terms match exactly
-            key_terms = ["name", "email", "address", "phone", "experience", "education", 
-                        "skills", "salary", "sponsor", "eligible", "authorized"]
-                        
-            for term in key_terms:
-                if term in stored_q and term in current_q:
-                    score += 0.1  # Boost for matching important terms
-            
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = mapping
-        
-        return best_match
+        return self.store.question_index.find(question_text, threshold)
 
     def record_failed_attempt(self, question_text, attempted_action, error):
         """Record a failed automation attempt"""
@@ -454,5 +440,4 @@ class InteractionLearner:
             "error": str(error)
         }
         
-        self.learning_data["failed_attempts"].append(failure)
-        self.save_learning_data()
\ No newline at end of file
+        self.store.append("failed_attempts", failure)
\ No newline at end of file
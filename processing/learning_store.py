@@ -0,0 +1,250 @@
+"""
+Append-only storage for InteractionLearner data.
+
+Every learned event is appended as one JSON line to a journal, so recording
+an event costs the same however much history exists, and a crash can at
+worst lose the line being written. The journal is periodically folded into
+a snapshot, written to a temporary file and swapped in with os.replace, so
+the snapshot on disk is always complete. Both files are JSON lines and are
+read back one record at a time.
+
+Each line is {"seq": n, "kind": <learning_data key>, "record": {...}}. The
+snapshot's first line holds the last seq it contains; journal lines at or
+below it were already compacted (e.g. the process died before the journal
+was truncated) and are skipped on load.
+"""
+
+import json
+import os
+import threading
+
+from processing.question_index import LearnedQuestionIndex
+from processing.retention import RetentionPolicy
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+# learning_data keys, in the order they are written to the snapshot
+KINDS = (
+    "learned_questions",
+    "observed_interactions",
+    "network_logs",
+    "failed_attempts",
+)
+# Journal lines appended before it is folded into the snapshot
+COMPACT_EVERY = 500
+
+
+def empty_learning_data():
+    return {kind: [] for kind in KINDS}
+
+
+class LearningJournal:
+    """
+    learning_data kept in memory, persisted as a snapshot plus a journal of
+    events appended since.
+    """
+
+    def __init__(
+        self,
+        learning_file="./config/learned_interactions.jsonl",
+        legacy_file=None,
+        compact_every=COMPACT_EVERY,
+        retention=None,
+    ):
+        """
+        Args:
+            learning_file: str - The snapshot; the journal sits next to it
+            legacy_file: str - Single-document JSON file written by older versions,
+                migrated into the snapshot the first time it is found. Defaults
+                to learning_file with a .json extension.
+            compact_every: int - Journal lines appended before compacting
+            retention: RetentionPolicy - Applied on every compaction
+        """
+        self.learning_file = learning_file
+        base_name = os.path.splitext(learning_file)[0]
+        self.journal_file = base_name + ".journal.jsonl"
+        self.legacy_file = legacy_file if legacy_file is not None else base_name + ".json"
+        self.compact_every = compact_every
+        self.retention = retention if retention is not None else RetentionPolicy()
+
+        self._lock = threading.RLock()
+        self._journal = None
+        self._journal_lines = 0
+        self._seq = 0
+        self.data = self._load()
+        # Kept up to date by append(), so lookups never rescan the history
+        self.question_index = LearnedQuestionIndex(self.data["learned_questions"])
+
+    def _read_lines(self, path, header=False):
+        """
+        Yield the records of a JSON lines file, skipping torn writes and lines
+        that aren't {"seq": n, "kind": ..., "record": {...}} objects, such as
+        hand-edited ones
+
+        Args:
+            path: str - The snapshot or the journal
+            header: bool - Yield the first readable line as is; the snapshot
+                keeps its seq there
+        """
+        with open(path, "r") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    value = json.loads(line)
+                except json.JSONDecodeError:
+                    log.warning(f"Skipping unreadable line {line_number} of {path}")
+                    continue
+                if header:
+                    header = False
+                    yield value if isinstance(value, dict) else {}
+                elif (
+                    isinstance(value, dict)
+                    and isinstance(value.get("kind"), str)
+                    and isinstance(value.get("record"), dict)
+                    and isinstance(value.get("seq", 0), int)
+                ):
+                    yield value
+                else:
+                    log.warning(f"Skipping malformed line {line_number} of {path}")
+
+    def _load(self):
+        data = empty_learning_data()
+
+        if not os.path.exists(self.learning_file) and os.path.exists(
+            self.legacy_file
+        ):
+            try:
+                with open(self.legacy_file, "r") as f:
+                    legacy = json.load(f)
+                for kind in KINDS:
+                    data[kind] = legacy.get(kind, [])
+                log.info(f"Migrating learning data from {self.legacy_file}")
+                self.data = data
+                self._write_snapshot()
+            except (json.JSONDecodeError, OSError) as e:
+                log.warning(f"Error loading learning data, creating new file: {e}")
+                data = empty_learning_data()
+
+        snapshot_seq = 0
+        if os.path.exists(self.learning_file):
+            try:
+                lines = self._read_lines(self.learning_file, header=True)
+                header = next(lines, None) or {}
+                snapshot_seq = header.get("seq", 0)
+                if not isinstance(snapshot_seq, int):
+                    snapshot_seq = 0
+                data = empty_learning_data()
+                for line in lines:
+                    data.setdefault(line["kind"], []).append(line["record"])
+            except OSError as e:
+                log.warning(f"Error loading learning data, creating new file: {e}")
+        self._seq = snapshot_seq
+
+        if os.path.exists(self.journal_file):
+            try:
+                for line in self._read_lines(self.journal_file):
+                    self._journal_lines += 1
+                    if line.get("seq", 0) <= snapshot_seq:
+                        continue
+                    data.setdefault(line["kind"], []).append(line["record"])
+                    self._seq = max(self._seq, line["seq"])
+            except OSError as e:
+                log.warning(f"Error reading learning journal: {e}")
+        return data
+
+    def append(self, kind, record):
+        """
+        Add a record to data[kind] and append it to the journal
+
+        Args:
+            kind: str - One of KINDS
+            record: dict - JSON-serializable record
+        """
+        with self._lock:
+            self.data.setdefault(kind, []).append(record)
+            if kind == "learned_questions":
+                self.question_index.add(record)
+            self._seq += 1
+            line = json.dumps({"seq": self._seq, "kind": kind, "record": record})
+            if self._journal is None:
+                os.makedirs(os.path.dirname(self.journal_file) or ".", exist_ok=True)
+                self._journal = open(self.journal_file, "a+")
+                # Terminate a line torn by a crash so it doesn't swallow this one
+                if self._journal.tell() > 0:
+                    self._journal.seek(self._journal.tell() - 1)
+                    if self._journal.read(1) != "\n":
+                        self._journal.write("\n")
+            # One write per line so concurrent appenders never interleave a record
+            self._journal.write(line + "\n")
+            self._journal.flush()
+            self._journal_lines += 1
+            if self._journal_lines >= self.compact_every:
+                self.compact()
+
+    def _write_snapshot(self):
+        os.makedirs(os.path.dirname(self.learning_file) or ".", exist_ok=True)
+        tmp_file = self.learning_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write(json.dumps({"seq": self._seq}) + "\n")
+            for kind in KINDS:
+                for record in self.data.get(kind, []):
+                    f.write(json.dumps({"kind": kind, "record": record}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.learning_file)
+
+    def compact(self, force=False):
+        """
+        Apply the retention policy, fold the journal into a new snapshot and
+        start an empty journal
+
+        Args:
+            force: bool - Rewrite the snapshot even if nothing was appended
+
+        Returns:
+            dict: kind -> number of records dropped by the retention policy
+        """
+        with self._lock:
+            if self._journal_lines == 0 and not force:
+                return {}
+            dropped = self.retention.apply(self.data)
+            if dropped.get("learned_questions"):
+                self.question_index = LearnedQuestionIndex(
+                    self.data["learned_questions"]
+                )
+            self._write_snapshot()
+            # The snapshot now covers every seq, so a crash before the
+            # truncation below only leaves lines that load will skip
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            if os.path.exists(self.journal_file):
+                open(self.journal_file, "w").close()
+            self._journal_lines = 0
+        log.info(f"Compacted learning data into {self.learning_file}")
+        return dropped
+
+    def flush(self):
+        with self._lock:
+            if self._journal is not None:
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+
+
+_journals = {}
+_journals_lock = threading.Lock()
+
+
+def get_learning_journal(learning_file="./config/learned_interactions.jsonl"):
+    """
+    Process-wide LearningJournal for learning_file, so every Workday (and
+    worker thread) shares one in-memory copy and one append handle
+    """
+    with _journals_lock:
+        key = os.path.abspath(learning_file)
+        if key not in _journals:
+            _journals[key] = LearningJournal(learning_file)
+        return _journals[key]
@@ -0,0 +1,111 @@
+import re
+import sys
+import threading
+import time
+
+from processing.embedding_backends import BACKENDS
+from processing.embedding_cache import EmbeddingCache
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+MODEL_NAME = "all-MiniLM-L6-v2"
+DEFAULT_BACKEND = "sentence-transformers"
+
+# Process-wide registry so every Workday instance and matcher shares one model
+_models = {}
+_backends = {}
+_embedding_caches = {}
+_lock = threading.Lock()
+
+
+def _resident_memory_mb():
+    """Current resident set size of this process in MB, or None if unavailable"""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    try:
+        import resource
+
+        # Peak rather than current RSS, reported in KB on Linux and bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            return max_rss / (1024 * 1024)
+        return max_rss / 1024
+    except Exception:
+        return None
+
+
+def _format_memory(memory_mb):
+    return f"{memory_mb:.0f} MB" if memory_mb is not None else "unknown"
+
+
+def get_model(model_name=MODEL_NAME):
+    """
+    Get the shared SentenceTransformer for model_name, loading it on first use
+
+    Loading happens at most once per process; the load time and the resident
+    memory before/after are printed so the cost shows up in the run output.
+    """
+    with _lock:
+        if model_name not in _models:
+            memory_before = _resident_memory_mb()
+            start_time = time.time()
+
+            from sentence_transformers import SentenceTransformer
+
+            _models[model_name] = SentenceTransformer(model_name)
+            memory_after = _resident_memory_mb()
+            log.info(
+                f"Loaded embedding model '{model_name}' in {time.time() - start_time:.2f}s "
+                f"(resident memory: {_format_memory(memory_before)} -> {_format_memory(memory_after)})"
+            )
+        return _models[model_name]
+
+
+def get_backend(backend_name=None, model_name=MODEL_NAME):
+    """
+    Get the shared embedding backend selected by backend_name
+
+    Args:
+        backend_name: str - A key of BACKENDS (e.g. "onnx-int8"), or None for the default
+        model_name: str - The sentence-transformers model to run
+
+    Returns:
+        An object with a `name` and an `encode(texts)` returning normalized vectors
+    """
+    backend_name = backend_name or DEFAULT_BACKEND
+    if backend_name not in BACKENDS:
+        log.warning(
+            f"Unknown embedding backend '{backend_name}', using {DEFAULT_BACKEND}"
+        )
+        backend_name = DEFAULT_BACKEND
+
+    with _lock:
+        key = (backend_name, model_name)
+        if key not in _backends:
+            try:
+                _backends[key] = BACKENDS[backend_name](model_name)
+            except ImportError as e:
+                log.warning(
+                    f"Unable to use embedding backend '{backend_name}': {e}. "
+                    f"Falling back to {DEFAULT_BACKEND}"
+                )
+                _backends[key] = BACKENDS[DEFAULT_BACKEND](model_name)
+        return _backends[key]
+
+
+def get_embedding_cache(name=MODEL_NAME):
+    """Get the shared EmbeddingCache for a backend name, loading it from disk on first use"""
+    with _lock:
+        if name not in _embedding_caches:
+            # One file per backend so their entries never evict each other
+            slug = re.sub(r"[^A-Za-z0-9.-]+", "-", name)
+            _embedding_caches[name] = EmbeddingCache(
+                name, cache_file=f"./config/embedding_cache-{slug}.npz"
+            )
+        return _embedding_caches[name]
@@ -0,0 +1,80 @@
+"""
+Negative-answer detection for option texts (e.g. picking "No" or "I don't
+wish to answer" in a dropdown when the answer is unknown).
+
+All negative words and phrases are compiled into one regex, matched as
+whole words, and results are memoized per option text for the life of the
+process, since the same options come back on every page and posting.
+"""
+
+import re
+from functools import lru_cache
+
+NEGATIVE_WORDS = (
+    "no",
+    "not",
+    "none",
+    "never",
+    "neither",
+    "nowhere",
+    "nothing",
+    "cannot",
+    "can't",
+    "deny",
+    "refuse",
+    "decline",
+    "reject",
+    "disagree",
+    "don't",
+    "doesn't",
+    "didn't",
+    "won't",
+    "wouldn't",
+    "haven't",
+    "hasn't",
+    "hadn't",
+    "without",
+)
+
+NEGATIVE_PHRASES = (
+    "do not",
+    "does not",
+    "did not",
+    "will not",
+    "would not",
+    "have not",
+    "has not",
+    "had not",
+    "prefer not",
+    "rather not",
+    "n/a",
+    "not applicable",
+    "none of the above",
+)
+
+# Longest alternatives first so e.g. "none of the above" isn't cut short.
+# A term only matches when it isn't part of a longer word or contraction.
+NEGATION_PATTERN = re.compile(
+    r"(?<![\w'])(?:"
+    + "|".join(
+        re.escape(term)
+        for term in sorted(NEGATIVE_WORDS + NEGATIVE_PHRASES, key=len, reverse=True)
+    )
+    + r")(?![\w'])",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=4096)
+def is_negative(text):
+    """
+    Check if text has negative meaning
+
+    Args:
+        text: str - An option or answer text
+
+    Returns:
+        bool: True if it contains a negative word or phrase
+    """
+    # Typographic apostrophes, as in "I don’t wish to answer"
+    return NEGATION_PATTERN.search(text.replace("’", "'")) is not None
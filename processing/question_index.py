@@ -0,0 +1,136 @@
+"""
+Index over InteractionLearner's learned question mappings.
+
+find_similar_question used to scan every stored mapping twice per lookup,
+re-splitting each stored question on every call. The index keeps one entry
+per normalized question (the latest mapping wins), with its token set
+precomputed, an exact-match map and inverted indexes from tokens and key
+terms to entries. A lookup only scores the entries that can reach the
+threshold, with the same scoring as before: Jaccard overlap of the words
+plus a boost for each key term found in both questions.
+"""
+
+import re
+import threading
+
+# Terms that make two questions likely to ask for the same thing
+KEY_TERMS = (
+    "name",
+    "email",
+    "address",
+    "phone",
+    "experience",
+    "education",
+    "skills",
+    "salary",
+    "sponsor",
+    "eligible",
+    "authorized",
+)
+KEY_TERM_BOOST = 0.1
+
+
+def normalize_question(text):
+    return re.sub(r"\s+", " ", text.lower()).strip()
+
+
+class LearnedQuestionIndex:
+    """
+    Latest mapping per normalized question, indexed for similarity lookups.
+
+    Entries are added incrementally as mappings are learned; ties between
+    equally similar questions go to the one learned first.
+    """
+
+    def __init__(self, mappings=()):
+        self._entries = {}  # normalized question -> (order, mapping, tokens, key terms)
+        self._by_token = {}  # token -> set of normalized questions
+        self._by_key_term = {}  # key term -> set of normalized questions
+        self._lock = threading.RLock()
+        for mapping in mappings:
+            self.add(mapping)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, mapping):
+        """Index a learned mapping, replacing any older mapping for the same question"""
+        question = mapping.get("question")
+        if not question:
+            return
+        normalized = normalize_question(question)
+        with self._lock:
+            if normalized in self._entries:
+                order, _, tokens, key_terms = self._entries[normalized]
+                self._entries[normalized] = (order, mapping, tokens, key_terms)
+                return
+
+            tokens = frozenset(normalized.split())
+            key_terms = frozenset(term for term in KEY_TERMS if term in normalized)
+            self._entries[normalized] = (len(self._entries), mapping, tokens, key_terms)
+            for token in tokens:
+                self._by_token.setdefault(token, set()).add(normalized)
+            for term in key_terms:
+                self._by_key_term.setdefault(term, set()).add(normalized)
+
+    def find(self, question_text, threshold=0.7):
+        """
+        Find the learned mapping for question_text, or the most similar one
+
+        Args:
+            question_text: str - The question on the form
+            threshold: float - Minimum similarity score for a non-exact match
+
+        Returns:
+            dict: The learned mapping, or None if nothing is similar enough
+        """
+        normalized = normalize_question(question_text)
+        with self._lock:
+            entry = self._entries.get(normalized)
+            if entry is not None:
+                return entry[1]
+
+            tokens = frozenset(normalized.split())
+            if not tokens:
+                return None
+            key_terms = frozenset(term for term in KEY_TERMS if term in normalized)
+
+            # Only questions sharing a word or a key term can score above zero
+            candidates = set()
+            for token in tokens:
+                candidates.update(self._by_token.get(token, ()))
+            for term in key_terms:
+                candidates.update(self._by_key_term.get(term, ()))
+
+            best_match = None
+            best_score = 0
+            best_order = None
+            for candidate in candidates:
+                order, mapping, candidate_tokens, candidate_terms = self._entries[
+                    candidate
+                ]
+                if not candidate_tokens:
+                    continue
+                boost = KEY_TERM_BOOST * len(key_terms & candidate_terms)
+                # Jaccard can't exceed the ratio of the set sizes
+                upper_bound = min(len(tokens), len(candidate_tokens)) / max(
+                    len(tokens), len(candidate_tokens)
+                )
+                if upper_bound + boost < max(threshold, best_score) - 1e-9:
+                    continue
+
+                score = len(tokens & candidate_tokens) / len(tokens | candidate_tokens)
+                # Added one term at a time, like the linear scan did
+                for _ in key_terms & candidate_terms:
+                    score += KEY_TERM_BOOST
+                if score < threshold:
+                    continue
+                if (
+                    best_match is None
+                    or score > best_score
+                    or (score == best_score and order < best_order)
+                ):
+                    best_match = mapping
+                    best_score = score
+                    best_order = order
+            return best_match
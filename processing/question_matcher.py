@@ -1,24 +1,126 @@
-from sentence_transformers import SentenceTransformer, util
-from operator import itemgetter
+import numpy as np
+
+from processing.model_registry import get_backend, get_embedding_cache
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
 
 
 class QuestionMatcher:
-    def __init__(self, questions_config):
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
-        self.question_bank = questions_config.default_questions
+    """
+    Matches form questions against a bank of (keywords, value) entries.
+
+    The keyword bank is kept as one matrix with a row per entry, where each
+    row is the mean of that entry's normalized keyword embeddings. Since the
+    questions are normalized too, a single matmul yields, for every question
+    and entry, the mean cosine similarity between the question and the
+    entry's keywords.
+    """
+
+    def __init__(self, questions_config=None, backend=None, embedding_cache=None):
+        # backend is either a backend object or the name of one in the registry.
+        # The model behind it is only loaded on first encode, so a warm embedding
+        # cache lets the keyword bank load without running inference at all.
+        self.backend = (
+            backend
+            if backend is not None and not isinstance(backend, str)
+            else get_backend(backend)
+        )
+        self.embedding_cache = (
+            embedding_cache
+            if embedding_cache is not None
+            else get_embedding_cache(self.backend.name)
+        )
+        self.question_bank = []
+        self._entry_matrix = np.zeros((0, 0), dtype=np.float32)
+        if questions_config is not None:
+            self.load_questions(questions_config.default_questions)
+
+    def _encode(self, texts):
+        return self.backend.encode(texts)
 
     def load_questions(self, questions):
-        self.question_bank = [
-            (self.model.encode(q, convert_to_tensor=True), a) for q, a in questions
+        """
+        Build the keyword matrix for a list of (keywords, value) entries
+
+        Keyword embeddings come from the embedding cache, so this only runs
+        the model for keywords that were never encoded before.
+        """
+        self.question_bank = list(questions)
+        all_keywords = [
+            keyword for keywords, _ in self.question_bank for keyword in keywords
         ]
+        keyword_matrix = self.embedding_cache.encode(all_keywords, self._encode)
+        try:
+            self.embedding_cache.save()
+        except Exception as e:
+            log.warning(f"Error saving embedding cache: {e}")
+
+        # Normalize here as well so cached vectors from older runs are unit length
+        norms = np.linalg.norm(keyword_matrix, axis=1, keepdims=True)
+        keyword_matrix = keyword_matrix / np.maximum(norms, 1e-12)
+
+        entry_rows = []
+        start = 0
+        for keywords, _ in self.question_bank:
+            entry_rows.append(keyword_matrix[start : start + len(keywords)].mean(axis=0))
+            start += len(keywords)
+        self._entry_matrix = np.ascontiguousarray(entry_rows, dtype=np.float32)
+
+    def score_matrix(self, question_texts):
+        """
+        Score every question against every bank entry
 
-    def find_best_match(self, keyword_embeddings, question_text, threshold=0.7):
-        question_embedding = self.model.encode(question_text, convert_to_tensor=True)
-        similarities = [
-            (
-                float(util.pytorch_cos_sim(question_embedding, q).mean()),
-                keyword_embeddings,
-            )
+        Args:
+            question_texts: list[str] - Questions to score, encoded in one batch
+
+        Returns:
+            np.ndarray: Matrix of shape (len(question_texts), len(question_bank))
+        """
+        if not question_texts or not self.question_bank:
+            return np.zeros((len(question_texts), len(self.question_bank)))
+        question_matrix = np.asarray(self._encode(list(question_texts)), np.float32)
+        return question_matrix @ self._entry_matrix.T
+
+    def match(self, question_texts, top_k=1):
+        """
+        Find the best bank entries for a batch of questions
+
+        Args:
+            question_texts: list[str] - Questions extracted from a page
+            top_k: int - Number of candidate entries to return per question
+
+        Returns:
+            list: For each question, a list of (score, entry_index) sorted by score
+        """
+        scores = self.score_matrix(question_texts)
+        if scores.size == 0:
+            return [[] for _ in question_texts]
+
+        k = min(top_k, scores.shape[1])
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        return [
+            [(float(score), int(index)) for score, index in zip(row_scores, row)]
+            for row_scores, row in zip(top_scores, top)
         ]
-        max_score, matching_embedding = max(similarities, key=itemgetter(0))
-        return matching_embedding if max_score > threshold else None
+
+    def find_best_match(self, question_text, threshold=0.7):
+        """
+        Find the bank entry that best matches a single question
+
+        Returns:
+            tuple: (score, keywords, value) or None if nothing beats the threshold
+        """
+        matches = self.match([question_text])[0]
+        if not matches:
+            return None
+        max_score, entry_index = matches[0]
+        if max_score <= threshold:
+            return None
+        keywords, value = self.question_bank[entry_index]
+        return max_score, keywords, value
@@ -0,0 +1,121 @@
+"""
+Tiered answer lookup for form questions.
+
+Each question is resolved by the cheapest tier that knows it:
+
+    exact    - the question text is one of the bank's keywords
+    learned  - the user answered it (or a similar question) by hand before,
+               looked up in InteractionLearner's question index
+    semantic - embedding similarity against the bank, in one batch for the
+               questions no earlier tier resolved
+
+Semantic results are memoized per normalized question text for the life of
+the process, so a question seen in an earlier posting resolves without
+running the model again.
+"""
+
+import threading
+from collections import namedtuple
+
+from processing.question_index import normalize_question
+from processing.structured_log import get_logger
+
+log = get_logger(__name__)
+
+# tier: which tier answered; score: its confidence (1.0 for exact and learned);
+# value: the answer; cached: whether a semantic result came from the memo
+Resolution = namedtuple("Resolution", ["tier", "score", "value", "cached"])
+
+# Learned values that don't tell us what to fill in
+UNUSABLE_LEARNED_VALUES = (None, "", "unknown")
+
+_semantic_memo = {}  # (backend, bank key, normalized question) -> (score, entry_index)
+_memo_lock = threading.Lock()
+
+
+class QuestionResolver:
+    """Resolves a page's questions against the bank, learned mappings and the model"""
+
+    def __init__(self, question_bank, matcher, learner=None):
+        """
+        Args:
+            question_bank: list - (keywords, value) entries, as in questions_to_actions
+            matcher: QuestionMatcher - Matcher loaded with question_bank
+            learner: InteractionLearner - Source of learned mappings, or None
+        """
+        self.question_bank = question_bank
+        self.matcher = matcher
+        self.learner = learner
+        # Normalized keyword text -> index into question_bank, first entry wins
+        self.exact_keywords = {}
+        for entry_index, (keywords, _) in enumerate(question_bank):
+            for keyword in keywords:
+                self.exact_keywords.setdefault(normalize_question(keyword), entry_index)
+        self._bank_key = (
+            getattr(matcher.backend, "name", ""),
+            hash(repr(question_bank)),
+        )
+
+    def _learned(self, question_text):
+        if self.learner is None:
+            return None
+        try:
+            mapping = self.learner.find_similar_question(question_text)
+        except Exception as e:
+            log.warning(f"Error looking up learned mappings: {e}")
+            return None
+        if not mapping or mapping.get("value") in UNUSABLE_LEARNED_VALUES:
+            return None
+        return Resolution("learned", 1.0, mapping["value"], False)
+
+    def resolve(self, question_texts):
+        """
+        Resolve a batch of questions, running the model at most once
+
+        Args:
+            question_texts: list[str] - Questions extracted from a page
+
+        Returns:
+            list: A Resolution (or None if nothing matched) per question
+        """
+        resolutions = [None] * len(question_texts)
+        pending = []  # (question index, memo key) for the semantic tier
+        for question_index, question_text in enumerate(question_texts):
+            normalized = normalize_question(question_text)
+            entry_index = self.exact_keywords.get(normalized)
+            if entry_index is not None:
+                resolutions[question_index] = Resolution(
+                    "exact", 1.0, self.question_bank[entry_index][1], False
+                )
+                continue
+
+            learned = self._learned(question_text)
+            if learned is not None:
+                resolutions[question_index] = learned
+                continue
+
+            memo_key = self._bank_key + (normalized,)
+            with _memo_lock:
+                memoized = _semantic_memo.get(memo_key)
+            if memoized is not None:
+                score, entry_index = memoized
+                resolutions[question_index] = Resolution(
+                    "semantic", score, self.question_bank[entry_index][1], True
+                )
+                continue
+            pending.append((question_index, memo_key))
+
+        if pending:
+            batch_matches = self.matcher.match(
+                [question_texts[question_index] for question_index, _ in pending]
+            )
+            for (question_index, memo_key), matches in zip(pending, batch_matches):
+                if not matches:
+                    continue
+                score, entry_index = matches[0]
+                with _memo_lock:
+                    _semantic_memo[memo_key] = (score, entry_index)
+                resolutions[question_index] = Resolution(
+                    "semantic", score, self.question_bank[entry_index][1], False
+                )
+        return resolutions
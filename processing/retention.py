@@ -0,0 +1,143 @@
+"""
+Retention policy for InteractionLearner data.
+
+Learned question mappings are what the automation reuses, so they are only
+deduplicated. Observations, failed attempts and network logs are kept for
+debugging and suggestions; they are capped by age and count, and long
+strings inside them are truncated. The policy is applied whenever the
+learning journal is compacted.
+
+Compact the learning data now and report the bytes reclaimed
+(from the repository root):
+    python -m processing.retention [--learning-file FILE] [--dry-run]
+"""
+
+import argparse
+import hashlib
+import os
+from datetime import datetime, timedelta
+
+from processing.question_index import normalize_question
+
+# Longest string kept inside a retained record; longer ones are truncated
+# and tagged with a hash of the full text
+MAX_STRING_LENGTH = 2000
+
+
+class RetentionPolicy:
+    """Caps per learning_data kind: max record count and max age in days"""
+
+    def __init__(self, limits=None, max_string_length=MAX_STRING_LENGTH):
+        """
+        Args:
+            limits: dict - kind -> {"max_records": int, "max_age_days": int},
+                None for either means unbounded
+            max_string_length: int - Longest string kept in capped kinds
+        """
+        self.limits = (
+            limits
+            if limits is not None
+            else {
+                "observed_interactions": {"max_records": 1000, "max_age_days": 180},
+                "failed_attempts": {"max_records": 1000, "max_age_days": 90},
+                "network_logs": {"max_records": 200, "max_age_days": 30},
+            }
+        )
+        self.max_string_length = max_string_length
+
+    def _truncate(self, value):
+        if isinstance(value, str) and len(value) > self.max_string_length:
+            digest = hashlib.sha1(value.encode("utf-8", "replace")).hexdigest()[:12]
+            return (
+                value[: self.max_string_length]
+                + f"...[truncated {len(value)} chars, sha1 {digest}]"
+            )
+        if isinstance(value, dict):
+            return {key: self._truncate(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._truncate(item) for item in value]
+        return value
+
+    def _is_recent(self, record, cutoff):
+        timestamp = record.get("timestamp") if isinstance(record, dict) else None
+        if not timestamp:
+            return True
+        try:
+            return datetime.fromisoformat(timestamp) >= cutoff
+        except (TypeError, ValueError):
+            return True
+
+    def apply(self, data):
+        """
+        Apply the policy to learning_data in place
+
+        Returns:
+            dict: kind -> number of records dropped
+        """
+        dropped = {}
+
+        # Keep only the latest mapping per question, where the question was
+        # first learned (the order the question index breaks ties by)
+        latest = {}
+        for mapping in data.get("learned_questions", []):
+            key = normalize_question(mapping.get("question") or "")
+            latest[key] = mapping
+        learned_questions = list(latest.values())
+        dropped["learned_questions"] = len(data.get("learned_questions", [])) - len(
+            learned_questions
+        )
+        data["learned_questions"] = learned_questions
+
+        now = datetime.now()
+        for kind, limit in self.limits.items():
+            records = data.get(kind, [])
+            kept = records
+            if limit.get("max_age_days") is not None:
+                cutoff = now - timedelta(days=limit["max_age_days"])
+                kept = [record for record in kept if self._is_recent(record, cutoff)]
+            if limit.get("max_records") is not None:
+                kept = kept[-limit["max_records"] :] if limit["max_records"] else []
+            data[kind] = [self._truncate(record) for record in kept]
+            dropped[kind] = len(records) - len(kept)
+        return dropped
+
+
+def _file_sizes(paths):
+    return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+
+def main():
+    from processing.learning_store import LearningJournal
+
+    parser = argparse.ArgumentParser(description="Compact the learning data")
+    parser.add_argument(
+        "--learning-file", default="./config/learned_interactions.jsonl"
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be dropped without rewriting anything",
+    )
+    args = parser.parse_args()
+
+    journal = LearningJournal(args.learning_file)
+    paths = [journal.learning_file, journal.journal_file]
+    bytes_before = _file_sizes(paths)
+
+    if args.dry_run:
+        dropped = journal.retention.apply(journal.data)
+        print(f"Would drop: {dropped}")
+        return
+
+    dropped = journal.compact(force=True)
+    bytes_after = _file_sizes(paths)
+    for kind, count in dropped.items():
+        print(f"{kind}: dropped {count} records, kept {len(journal.data[kind])}")
+    print(
+        f"Learning data: {bytes_before / 1024:.1f} KB -> {bytes_after / 1024:.1f} KB, "
+        f"reclaimed {(bytes_before - bytes_after) / 1024:.1f} KB"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+Leveled, structured logging whose fields are evaluated lazily.
+
+Debug output in the handlers used to print element.text, tag_name and
+get_attribute(...) unconditionally, and each of those is a WebDriver round
+trip whether or not anyone reads stdout. Here a field can be a callable
+(usually a lambda around the element access); it is only called when the
+record's level is enabled, so quiet runs send no extra commands:
+
+    log = get_logger("workday")
+    log.debug("Container", tag=lambda: container.tag_name)
+
+Enabled records are printed and, when configured, also appended as JSON
+lines to a file by a background thread, so the file write never holds up
+the browser. Fields are always evaluated on the calling thread (WebDriver
+isn't thread-safe); the writer thread only sees plain values.
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVELS = {"debug": DEBUG, "info": INFO, "warning": WARNING, "error": ERROR}
+LEVEL_NAMES = {number: name for name, number in LEVELS.items()}
+
+# Longest field value kept in a record (option lists, page text, ...)
+MAX_FIELD_CHARS = 500
+
+_level = LEVELS.get(os.environ.get("WORKDAY_LOG_LEVEL", "info").lower(), INFO)
+_sink = None
+
+
+class JsonlSink:
+    """Appends records to a JSON lines file from a background thread"""
+
+    def __init__(self, log_file):
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        self.log_file = log_file
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._write, name="jsonl-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def emit(self, record):
+        self._queue.put(record)
+
+    def _write(self):
+        with open(self.log_file, "a") as f:
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    break
+                f.write(json.dumps(record, default=str) + "\n")
+                # Only flush once the queue is drained, not per record
+                if self._queue.empty():
+                    f.flush()
+
+    def close(self):
+        """Write out the queued records and stop the writer thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+
+def _evaluate(value):
+    if callable(value):
+        try:
+            value = value()
+        except Exception as e:
+            # e.g. a stale element; logging must never break the step
+            return f"<{type(e).__name__}>"
+    if isinstance(value, str) and len(value) > MAX_FIELD_CHARS:
+        return value[:MAX_FIELD_CHARS] + "..."
+    return value
+
+
+class Logger:
+    """Named logger; the level and sink are process-wide"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def is_enabled(self, level):
+        return level >= _level
+
+    def log(self, level, message, **fields):
+        if level < _level:
+            return
+        fields = {key: _evaluate(value) for key, value in fields.items()}
+        if fields:
+            print(
+                message,
+                " ".join(f"{key}={value!r}" for key, value in fields.items()),
+            )
+        else:
+            print(message)
+        sink = _sink
+        if sink is not None:
+            sink.emit(
+                {
+                    "time": time.time(),
+                    "level": LEVEL_NAMES.get(level, level),
+                    "logger": self.name,
+                    "thread": threading.current_thread().name,
+                    "message": message,
+                    "fields": fields,
+                }
+            )
+
+    def debug(self, message, **fields):
+        self.log(DEBUG, message, **fields)
+
+    def info(self, message, **fields):
+        self.log(INFO, message, **fields)
+
+    def warning(self, message, **fields):
+        self.log(WARNING, message, **fields)
+
+    def error(self, message, **fields):
+        self.log(ERROR, message, **fields)
+
+
+def get_logger(name):
+    return Logger(name)
+
+
+def set_level(level):
+    """Set the process-wide level, by name ("debug", ...) or number"""
+    global _level
+    _level = LEVELS[level.lower()] if isinstance(level, str) else level
+
+
+def configure(level=None, jsonl_file=None):
+    """
+    Configure logging for the run
+
+    Args:
+        level: str - Lowest level that is evaluated and written (default:
+            $WORKDAY_LOG_LEVEL or "info")
+        jsonl_file: str - Also append enabled records to this JSON lines file
+    """
+    global _sink
+    if level is not None:
+        set_level(level)
+    if jsonl_file:
+        close()
+        _sink = JsonlSink(jsonl_file)
+
+
+def close():
+    """Flush and stop the JSON lines sink, if any"""
+    global _sink
+    sink, _sink = _sink, None
+    if sink is not None:
+        sink.close()
+
+
+atexit.register(close)
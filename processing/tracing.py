@@ -0,0 +1,214 @@
+"""
+Span-based tracing of the apply pipeline, exported in Chrome's trace event
+format (load the file in chrome://tracing or https://ui.perfetto.dev).
+
+Each span records its duration, its outcome (ok, failed when the step
+returned False, or the exception it raised) and how much of it was spent
+blocked on a human, so a 12 minute posting can be told apart from a 2
+minute one at a glance. Jobs running in parallel show up as separate
+threads.
+
+Tracing is off unless enable() is called (workday.py --trace FILE). While
+off, a traced function costs one global lookup per call and span() returns
+a shared no-op.
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+
+_tracer = None
+
+
+class Span:
+    """An open span; set outcome or add args before it closes"""
+
+    __slots__ = ("name", "category", "args", "outcome", "human", "start")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self.outcome = "ok"
+        self.human = 0.0
+        self.start = time.perf_counter()
+
+
+class _NoSpan:
+    """What span() yields while tracing is off; attribute writes are dropped"""
+
+    def __setattr__(self, name, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    """Collects finished spans as Chrome trace events"""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.events = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._threads = {}  # thread id -> name, for the thread_name metadata
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+            thread = threading.current_thread()
+            with self._lock:
+                self._threads[thread.ident] = thread.name
+        return stack
+
+    def open(self, name, category, args):
+        span = Span(name, category, args)
+        self._stack().append(span)
+        return span
+
+    def close(self, span):
+        end = time.perf_counter()
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        elif span in stack:
+            stack.remove(span)
+        if span.category == "human":
+            # Everything still open was blocked on the human for this long
+            for parent in stack:
+                parent.human += end - span.start
+        args = dict(span.args, outcome=span.outcome)
+        if span.human:
+            args["human_seconds"] = round(span.human, 3)
+        event = {
+            "name": span.name,
+            "cat": span.category,
+            "ph": "X",
+            "ts": round((span.start - self.origin) * 1e6),
+            "dur": round((end - span.start) * 1e6),
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def save(self, trace_file):
+        """Write the spans so far as a Chrome trace JSON file"""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+        metadata = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": os.getpid(),
+                "tid": tid,
+                "args": {"name": name},
+            }
+            for tid, name in threads.items()
+        ]
+        os.makedirs(os.path.dirname(trace_file) or ".", exist_ok=True)
+        with open(trace_file, "w") as f:
+            json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+        return len(events)
+
+
+class _SpanContext:
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.span = None
+
+    def __enter__(self):
+        self.span = self.tracer.open(self.name, self.category, self.args)
+        return self.span
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is not None:
+            self.span.outcome = f"error: {exc_type.__name__}"
+        self.tracer.close(self.span)
+        return False
+
+
+def enable():
+    """Start collecting spans (process-wide)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable():
+    global _tracer
+    _tracer = None
+
+
+def save(trace_file):
+    """
+    Write the collected spans to trace_file, if tracing is on
+
+    Returns:
+        int: Number of spans written
+    """
+    return _tracer.save(trace_file) if _tracer is not None else 0
+
+
+def span(name, category="step", **args):
+    """
+    Context manager tracing a block; yields the Span so the block can set
+    its outcome (or NO_SPAN while tracing is off)
+    """
+    if _tracer is None:
+        return NO_SPAN
+    return _SpanContext(_tracer, name, category, args)
+
+
+def human_wait(reason=""):
+    """Span for time blocked on a human (e.g. input()), charged to every open span"""
+    return span("waiting for human", category="human", reason=reason[:200])
+
+
+def traced(name=None, category="step", detail=None):
+    """
+    Decorator tracing every call of a function
+
+    Args:
+        name: str - Span name, defaults to the function name
+        category: str - Span category (step, handler, wait, human)
+        detail: callable - (args, kwargs) -> dict of span args, only called
+            while tracing is on
+
+    A call that returns False is recorded with outcome "failed".
+    """
+
+    def decorator(func):
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            span_args = detail(args, kwargs) if detail is not None else {}
+            with _SpanContext(tracer, span_name, category, span_args) as current:
+                result = func(*args, **kwargs)
+                if result is False:
+                    current.outcome = "failed"
+                return result
+
+        return wrapper
+
+    return decorator
@@ -1,31 +1,52 @@
 import time
-from selenium import webdriver
+
+# Taken before anything else is imported, for the time-to-first-driver.get report
+STARTED_AT = time.perf_counter()
+
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from urllib.parse import urlparse
 from config import Config
 from datetime import datetime
+import argparse
 import os
 import re
 from StopWords import StopWords
-from sentence_transformers import SentenceTransformer, util
-from operator import itemgetter
 import sys
-
-# Add to imports at top
-import nltk
-from nltk.tokenize import word_tokenize
+import threading
 from selenium.webdriver.common.keys import Keys
 
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
-
 
 # Add the project root to the Python path to import from processing
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from browser.command_accounting import CommandAccountant
+from browser.dom_extraction import ElementTypeCache, extract_questions
+from browser.dropdown import (
+    PROMPT_OPTION_SELECTORS,
+    SEARCH_THRESHOLD,
+    click_option,
+    match_option,
+    search_prefix,
+    snapshot_options,
+)
+from browser.job_status import detect_job_closed
+from browser.session_pool import SessionPool, new_chrome
+from browser.wait_policy import (
+    WaitPolicy,
+    dom_idle,
+    element_absent,
+    element_present,
+    get_wait_stats,
+)
+from processing.job_runner import JobRunner, ManualInputRequired, company_subdomain
+from processing.negation import is_negative
+from processing.resolver import QuestionResolver
+from processing import structured_log
+from processing.structured_log import get_logger
+from processing.tracing import human_wait, traced
+from processing import tracing
+
 try:
     from processing.learner import InteractionLearner
 except ImportError:
@@ -52,75 +73,177 @@ except ImportError:
 
 stopwords = StopWords()
 
+_first_get_reported = False
+_first_get_lock = threading.Lock()
+
+
+def report_first_get():
+    """Print the time from startup to the first driver.get, once per process"""
+    global _first_get_reported
+    with _first_get_lock:
+        if _first_get_reported:
+            return
+        _first_get_reported = True
+    log.info(f"Time to first driver.get: {time.perf_counter() - STARTED_AT:.2f}s")
+
+
+FORM_LOCATOR = (By.XPATH, "//form")
+EMAIL_LOCATOR = (By.CSS_SELECTOR, "input[type='text'][data-automation-id='email']")
+RESUME_UPLOAD_LOCATOR = (
+    By.CSS_SELECTOR,
+    "input[data-automation-id='file-upload-input-ref']",
+)
+PASSWORD_LOCATOR = (By.CSS_SELECTOR, "input[type='password']")
+VERIFY_MESSAGE_LOCATOR = (By.XPATH, "//p[contains(text(), 'verify')]")
+ERROR_BANNER_LOCATOR = (By.CSS_SELECTOR, "button[data-automation-id='errorBanner']")
+
+# Whether a checkbox, or the checkbox inside a field, is checked; null if there is none
+CHECKBOX_STATE_JS = """
+const el = arguments[0];
+const box = el.matches("input[type='checkbox']")
+    ? el : el.querySelector("input[type='checkbox']");
+if (box) return box.checked;
+const ariaChecked = el.getAttribute('aria-checked');
+return ariaChecked === null ? null : ariaChecked === 'true';
+"""
+
+
+def questions_to_actions(profile):
+    """
+    Build the bank of (keywords, value) tuples used to answer form questions
+
+    The action is not part of the bank; it is determined at runtime based on
+    the type of element the question is attached to.
+    """
+    return [
+        (
+            ["how did you hear about us"],
+            "LinkedIn",
+        ),
+        (
+            ["Country Phone Code"],
+            "United States of America",
+        ),
+        (
+            ["Country"],
+            "United States of America",
+        ),
+        (["Are you legally eligible to work"], "Yes"),
+        (
+            [
+                "Do you now or will you in the future require sponsorship for a work visa"
+            ],
+            "No",
+        ),
+        (
+            ["have you previously been employed", "have you ever worked for"],
+            "No",
+        ),
+        (
+            ["first name"],
+            profile["first_name"],
+        ),
+        (["last name"], profile["family_name"]),
+        (["email"], profile["email"]),
+        (["address line 1"], profile["address_line_1"]),
+        (["city"], profile["address_city"]),
+        (["state"], ["NY", "New York"]),
+        (["postal Code"], profile["address_postal_code"]),
+        (["phone device type"], "Mobile"),
+        (["phone number"], profile["phone_number"]),
+        (["are you legally authorized"], "Yes"),
+        (["will you now or in the future"], "No"),
+        (["Are you at least 18 years of age?"], "Yes"),
+        (
+            [
+                "Do you have an agreement or contract such as a non-disclosure or non-competitive agreement with another employer that might restrict your employment at"
+            ],
+            "No",
+        ),
+        (["do you require sponsorship"], "No"),
+        (["disability status"], "I don't wish to answer"),
+        (["veteran status"], "I am not"),
+        (["gender"], "Male"),
+        (
+            ["ethnicity"],
+            "Black or African American (United States of America)",
+        ),
+        (
+            ["What is your race"],
+            "Black or African American (United States of America)",
+        ),
+        (["hispanic or latino"], "No"),
+        (["date"], None),
+        (
+            ["Please check one of the boxes below: "],
+            "No, I do not have a disability",
+        ),
+        (
+            ["I understand and acknowledge the terms of use"],
+            None,
+        ),
+        (
+            ["Yes, I have read and consent to the terms and conditions"],
+            None,
+        ),
+    ]
+
+
+log = get_logger("workday")
+
+
+def _field_detail(args, kwargs):
+    """Span args of a field handler call: the field and the answer it was given"""
+    values = args[3] if len(args) > 3 else kwargs.get("values", "")
+    return {
+        "automation_id": args[2] if len(args) > 2 else "",
+        "values": str(values)[:100],
+    }
+
 
 class Workday:
     def detect_negation(self, text):
         """Check if text has negative meaning"""
-        negative_words = {
-            "no",
-            "not",
-            "none",
-            "never",
-            "neither",
-            "nowhere",
-            "nothing",
-            "cannot",
-            "can't",
-            "deny",
-            "refuse",
-            "decline",
-            "reject",
-            "disagree",
-            "don't",
-            "doesn't",
-            "didn't",
-            "won't",
-            "wouldn't",
-            "haven't",
-            "hasn't",
-            "hadn't",
-            "without",
-        }
-
-        # Convert to lowercase and tokenize
-        tokens = word_tokenize(text.lower())
-
-        # Check for negative words
-        has_negative = any(word in negative_words for word in tokens)
-
-        # Check for specific phrases that indicate negation
-        negative_phrases = [
-            "do not",
-            "does not",
-            "did not",
-            "will not",
-            "would not",
-            "have not",
-            "has not",
-            "had not",
-            "prefer not",
-            "rather not",
-            "n/a",
-            "not applicable",
-            "none of the above",
-        ]
-
-        has_negative_phrase = any(phrase in text.lower() for phrase in negative_phrases)
-
-        return has_negative or has_negative_phrase
-
-    def __init__(self, url):
+        return is_negative(text)
+
+    def __init__(
+        self,
+        url,
+        debugging_port=9222,
+        user_data_dir=None,
+        interactive=True,
+        session=None,
+        profile_file="./config/profile.yaml",
+    ):
+        """
+        Args:
+            url: str - The job posting to apply to
+            debugging_port: int - Chrome remote debugging port, unique per concurrent browser
+            user_data_dir: str - Chrome profile directory, unique per concurrent browser
+            interactive: bool - Whether to prompt for manual input. When False,
+                anything needing a human raises ManualInputRequired instead.
+            session: BrowserSession - Pooled browser to use instead of starting a
+                new one. It is left open for the pool when apply() finishes.
+            profile_file: str - The applicant profile to fill forms from
+        """
         self.url = url
-        self.config = Config("./config/profile.yaml")
+        self.interactive = interactive
+        self.session = session
+        self.config = Config(profile_file)
         self.profile = self.config.profile
-        self.options = webdriver.ChromeOptions()
-        self.options.add_argument("--remote-debugging-port=9222")
-        self.driver = webdriver.Chrome(
-            options=self.options
-        )  # You need to have chromedriver installed
+        if session is not None:
+            self.driver = session.driver
+        else:
+            self.driver = new_chrome(debugging_port, user_data_dir)
+        # Every WebDriver command of this job, per phase and call site
+        self.commands = CommandAccountant(self.driver)
         self.wait = WebDriverWait(self.driver, 10)
-        self.driver.maximize_window()
-        self.model = SentenceTransformer("all-MiniLM-L6-v2")
+        # Condition-based waits; apply() switches the tenant once the URL is parsed
+        self.waits = WaitPolicy(self.driver)
+        # Element types are classified in the page and memoized until the page changes
+        self.element_types = ElementTypeCache(
+            self.driver, fallback=self._detect_element_type
+        )
 
         # Create a mapping from element types to handler functions
         self.element_type_handlers = {
@@ -140,9 +263,9 @@ class Workday:
             from processing.learner import InteractionLearner
 
             self.learner = InteractionLearner(self.driver)
-            print("Advanced learning system initialized")
+            log.info("Advanced learning system initialized")
         except ImportError as e:
-            print(f"Unable to initialize advanced learning: {e}")
+            log.warning(f"Unable to initialize advanced learning: {e}")
 
             # Fallback to dummy learner
             class DummyLearner:
@@ -165,83 +288,62 @@ class Workday:
 
         # Modified data structure: list of tuples (keywords, value)
         # The action will be determined at runtime based on the element type
-        self.questionsToActions = [
-            (
-                ["how did you hear about us"],
-                "LinkedIn",
-            ),
-            (
-                ["Country Phone Code"],
-                "United States of America",
-            ),
-            (
-                ["Country"],
-                "United States of America",
-            ),
-            (["Are you legally eligible to work"], "Yes"),
-            (
-                [
-                    "Do you now or will you in the future require sponsorship for a work visa"
-                ],
-                "No",
-            ),
-            (
-                ["have you previously been employed", "have you ever worked for"],
-                "No",
-            ),
-            (
-                ["first name"],
-                self.profile["first_name"],
-            ),
-            (["last name"], self.profile["family_name"]),
-            (["email"], self.profile["email"]),
-            (["address line 1"], self.profile["address_line_1"]),
-            (["city"], self.profile["address_city"]),
-            (["state"], ["NY", "New York"]),
-            (["postal Code"], self.profile["address_postal_code"]),
-            (["phone device type"], "Mobile"),
-            (["phone number"], self.profile["phone_number"]),
-            (["are you legally authorized"], "Yes"),
-            (["will you now or in the future"], "No"),
-            (["Are you at least 18 years of age?"], "Yes"),
-            (
-                [
-                    "Do you have an agreement or contract such as a non-disclosure or non-competitive agreement with another employer that might restrict your employment at"
-                ],
-                "No",
-            ),
-            (["do you require sponsorship"], "No"),
-            (["disability status"], "I don't wish to answer"),
-            (["veteran status"], "I am not"),
-            (["gender"], "Male"),
-            (
-                ["ethnicity"],
-                "Black or African American (United States of America)",
-            ),
-            (
-                ["What is your race"],
-                "Black or African American (United States of America)",
-            ),
-            (["hispanic or latino"], "No"),
-            (["date"], None),
-            (
-                ["Please check one of the boxes below: "],
-                "No, I do not have a disability",
-            ),
-            (
-                ["I understand and acknowledge the terms of use"],
-                None,
-            ),
-            (
-                ["Yes, I have read and consent to the terms and conditions"],
-                None,
-            ),
-        ]
+        self.questionsToActions = questions_to_actions(self.profile)
+
+        # The matcher and resolver are built on the first question page, so
+        # loading keyword embeddings (or the model) doesn't delay opening the job
+        self.matcher = None
+        self.resolver = None
+
+    def _question_resolver(self):
+        """
+        Answers come from the cheapest tier that knows the question: exact
+        keyword text, mappings learned from manual answers, then the model
+        """
+        if self.resolver is None:
+            # Imported here so numpy isn't loaded before the job page opens
+            from processing.question_matcher import QuestionMatcher
+
+            # Keyword embeddings only change when questionsToActions does, so
+            # the matcher resolves them once (from the on-disk cache when
+            # possible). The embedding model is shared by every Workday in the process.
+            self.matcher = QuestionMatcher(
+                backend=self.profile.get("embedding_backend")
+            )
+            self.matcher.load_questions(self.questionsToActions)
+            self.resolver = QuestionResolver(
+                self.questionsToActions, self.matcher, learner=self.learner
+            )
+        return self.resolver
 
+    def _prompt(self, message, required=True):
+        """
+        Wait for the user to press Enter
+
+        Args:
+            message: str - What the user should do before continuing
+            required: bool - False for prompts that only pause for review, which
+                are skipped when running non-interactively
+        """
+        if self.interactive:
+            with human_wait(message.strip()):
+                return input(message)
+        if required:
+            raise ManualInputRequired(message.strip())
+        log.warning(f"Skipping prompt (non-interactive): {message.strip()}")
+        return ""
+
+    @traced(category="handler", detail=_field_detail)
     def select_checkbox(self, element, data_automation_id):
         radio_button = element
         self.wait.until(EC.element_to_be_clickable(radio_button))
 
+        # A field holding a single checkbox (terms, consent) is answered by
+        # clicking that checkbox; clicking the middle of the field may miss it
+        checkboxes = element.find_elements(By.CSS_SELECTOR, "input[type='checkbox']")
+        if len(checkboxes) == 1:
+            radio_button = checkboxes[0]
+
         # Click the checkbox
         try:
             radio_button.click()
@@ -252,30 +354,36 @@ class Workday:
         # Wait for checkbox state to update
         self._wait_for_element_stability(element)
 
-        # Verify the checkbox was clicked successfully
+        # Verify the checkbox was clicked successfully. The element may be the
+        # field around the checkbox, where is_selected() is always False.
         try:
-            is_checked = radio_button.is_selected()
-            print(f"Checkbox is {'checked' if is_checked else 'not checked'}")
-        except:
-            # If we can't verify, continue anyway
-            pass
+            is_checked = bool(
+                self.driver.execute_script(CHECKBOX_STATE_JS, radio_button)
+            )
+        except Exception as e:
+            log.warning(f"Could not verify the checkbox state: {e}")
+            return False
+        log.info(f"Checkbox is {'checked' if is_checked else 'not checked'}")
+        return is_checked
 
+    @traced(category="handler", detail=_field_detail)
     def handle_date(self, element, _):
         try:
 
             month_input, day_input, year_input = element.find_elements(
                 By.CSS_SELECTOR, "input"
             )
-            print("here date", month_input.text, day_input)
+            log.debug("Date input", month=lambda: month_input.text)
             month_input.send_keys(datetime.now().strftime("%m"))
             day_input.send_keys(datetime.now().strftime("%d"))
             year_input.send_keys(datetime.now().strftime("%Y"))
         except Exception as e:
-            print("Exception: 'No date input'", e)
+            log.warning(f"Exception: 'No date input' {e}")
         return True
 
+    @traced()
     def signup(self):
-        print("Signup")
+        log.info("Signup")
         try:
             redirect = self.wait.until(
                 EC.element_to_be_clickable(
@@ -287,18 +395,18 @@ class Workday:
             )
             redirect.click()
         except Exception as e:
-            print("Exception: 'No button for Sigup'")
+            log.warning("Exception: 'No button for Sigup'")
         try:
-            time.sleep(5)
-            form = self.wait.until(EC.presence_of_element_located((By.XPATH, "//form")))
+            self.waits.wait("signup_form", element_present(FORM_LOCATOR), 5)
+            form = self.wait.until(EC.presence_of_element_located(FORM_LOCATOR))
             checkbox = form.find_element(By.XPATH, "//input[@type='checkbox']")
-            print("here")
+            log.debug("here")
             checkbox.click()
-            time.sleep(1)
+            self.waits.wait("signup_checkbox", dom_idle(), 1)
         except Exception as e:
-            print(f"Error: {str(e)}")
+            log.warning(f"Error: {str(e)}")
         try:
-            time.sleep(2)
+            self.waits.wait("signup_fields", element_present(EMAIL_LOCATOR), 2)
             self.driver.find_element(
                 By.CSS_SELECTOR, "input[type='text'][data-automation-id='email']"
             ).send_keys(self.profile["email"])
@@ -315,7 +423,7 @@ class Workday:
                     "div[role='button'][aria-label='Create Account'][data-automation-id='click_filter']",
                 )
                 button.click()
-                time.sleep(3)
+                self.waits.wait("create_account_submit", dom_idle(), 3)
 
                 # Check for error messages about existing account
                 try:
@@ -324,74 +432,78 @@ class Workday:
                         "//*[contains(text(), 'sign into this account') or contains(text(), 'already in use') or contains(text(), 'already exists')]",
                     )
                     if error_text:
-                        print("Account already exists, switching to sign in...")
+                        log.info("Account already exists, switching to sign in...")
                         # Look for sign in link/button
                         sign_in_btn = self.driver.find_element(
                             By.XPATH,
                             "//a[contains(text(), 'Sign In')] | //button[contains(text(), 'Sign In')]",
                         )
                         sign_in_btn.click()
-                        time.sleep(2)
+                        self.waits.wait("signin_redirect", dom_idle(), 2)
                         self.signin()
                         return
                 except Exception as error_check_e:
-                    print(
+                    log.info(
                         "No error message about existing account found, continuing with signup"
                     )
 
             except Exception as e:
-                print("Exception: 'No button for Create Account'", e)
+                log.warning(f"Exception: 'No button for Create Account' {e}")
                 button1 = self.wait.until(
                     EC.element_to_be_clickable((By.XPATH, "//button[@type='submit']"))
                 )
-                print(button1.is_displayed())  # Check if button is visible
-                print(button1.is_enabled())  # Check if button is clickable
+                log.debug(
+                    "Submit button",
+                    displayed=lambda: button1.is_displayed(),
+                    enabled=lambda: button1.is_enabled(),
+                )
                 self.driver.execute_script("arguments[0].click();", button1)
 
                 # Also check for error messages here
-                time.sleep(3)
+                self.waits.wait("create_account_submit", dom_idle(), 3)
                 try:
                     error_text = self.driver.find_element(
                         By.XPATH,
                         "//*[contains(text(), 'sign into this account') or contains(text(), 'already in use') or contains(text(), 'already exists')]",
                     )
                     if error_text:
-                        print("Account already exists, switching to sign in...")
+                        log.info("Account already exists, switching to sign in...")
                         # Look for sign in link/button
                         sign_in_btn = self.driver.find_element(
                             By.XPATH,
                             "//a[contains(text(), 'Sign In')] | //button[contains(text(), 'Sign In')]",
                         )
                         sign_in_btn.click()
-                        time.sleep(2)
+                        self.waits.wait("signin_redirect", dom_idle(), 2)
                         self.signin()
                         return
                 except Exception as error_check_e:
-                    print(
+                    log.info(
                         "No error message about existing account found, continuing with signup"
                     )
 
-            time.sleep(2)
+            self.waits.wait("signup_complete", dom_idle(), 2)
         except Exception as e:
-            print("Exception: 'Signup failed'", e)
+            log.warning(f"Exception: 'Signup failed' {e}")
             self.signin()
 
+    @traced()
     def signin(self):
-        print("Signin")
+        log.info("Signin")
         try:
             self.wait.until(
                 EC.element_to_be_clickable((By.XPATH, "//button[text()='Sign In']"))
             )
             self.driver.find_element(By.XPATH, "//button[text()='Sign In']").click()
         except Exception as e:
-            print("Exception: 'No button for Sigin'")
-        time.sleep(5)
+            log.warning("Exception: 'No button for Sigin'")
+        self.waits.wait("signin_form", element_present(FORM_LOCATOR), 5)
         try:
-            form = self.wait.until(EC.presence_of_element_located((By.XPATH, "//form")))
+            form = self.wait.until(EC.presence_of_element_located(FORM_LOCATOR))
         except Exception as e:
-            print(f"Error form error: {str(e)}")
+            log.warning(f"Error form error: {str(e)}")
         try:
-            time.sleep(2)
+            self.waits.wait("signin_fields", element_present(EMAIL_LOCATOR), 2)
             self.driver.find_element(
                 By.CSS_SELECTOR, "input[type='text'][data-automation-id='email']"
             ).send_keys(self.profile["email"])
@@ -406,99 +518,41 @@ class Workday:
                     )
                 )
             )
-            time.sleep(1)
+            self.waits.wait("signin_button", dom_idle(), 1)
             button.click()
         except Exception as e:
-            print("Exception: 'Signin failed'", e)
+            log.warning(f"Exception: 'Signin failed' {e}")
 
     def label_error_type(self):
 
         pass
 
-    def _wait_for_element_stability(self, element, timeout=8, poll_frequency=0.2):
+    @traced(category="wait")
+    def _wait_for_element_stability(self, element, timeout=8, quiet_ms=500):
         """
         Wait for an element to become stable (not changing) before proceeding
 
         Args:
             element: WebElement - The element to monitor
             timeout: int - Maximum time to wait in seconds
-            poll_frequency: float - How often to check for stability
+            quiet_ms: int - How long the DOM around the element and the network must be idle
 
         Returns:
             bool: True if element became stable, False if timed out
         """
-        try:
-            start_time = time.time()
-            last_html = ""
-            stable_count = 0
-            required_stable_checks = (
-                5  # Increased number of consecutive stable checks required
-            )
-
-            # Wait for page to finish any JavaScript executions first
-            self._wait_for_page_load(timeout=3)
-
-            # Get parent element to watch for changes in a wider context
-            try:
-                # Try to get a wider context by going up several levels
-                parent = element.find_element(
-                    By.XPATH,
-                    "./ancestor::div[contains(@class, 'container') or contains(@class, 'section') or contains(@class, 'page')][1]",
-                )
-            except:
-                try:
-                    # Fallback to just parent div
-                    parent = element.find_element(
-                        By.XPATH, "./ancestor::div[position()=3]"
-                    )
-                except:
-                    parent = element  # Final fallback to watching the element itself
-
-            print(f"Waiting for element stability (timeout: {timeout}s)...")
-            while time.time() - start_time < timeout:
-                try:
-                    # Check that element is still attached to DOM and visible
-                    if not element.is_displayed():
-                        print(
-                            "Element is no longer displayed, resetting stability count"
-                        )
-                        stable_count = 0
-
-                    # Get current state to compare
-                    current_html = parent.get_attribute("outerHTML")
-
-                    if current_html == last_html:
-                        stable_count += 1
-                        if stable_count >= required_stable_checks:
-                            print(
-                                "Element is stable after",
-                                round(time.time() - start_time, 2),
-                                "seconds",
-                            )
-                            return True
-                    else:
-                        stable_count = 0  # Reset if content changed
-
-                    last_html = current_html
-
-                except Exception as inner_e:
-                    print(f"Error during stability check: {inner_e}")
-                    stable_count = 0  # Reset on errors
-
-                time.sleep(poll_frequency)
-
-            print(
+        # The outerHTML polling this replaced took at least 3s (2s page load
+        # sleep plus 5 identical reads 0.2s apart)
+        stable = self.waits.wait(
+            "element_stability",
+            dom_idle(element, quiet_ms=quiet_ms),
+            3,
+            timeout=timeout,
+        )
+        if not stable:
+            log.warning(
                 f"Element did not fully stabilize within {timeout} seconds, proceeding anyway"
             )
-            # Even if we didn't reach full stability, give it a little more time
-            time.sleep(2)
-            return True  # Return true anyway to avoid blocking the process
-
-        except Exception as e:
-            print(f"Error monitoring element stability: {e}")
-            # If we can't monitor stability, better to wait a fixed time than to fail
-            time.sleep(3)  # Increased fixed wait time
-            return False
+        return stable
 
     def _detect_element_type(self, element):
         """
@@ -551,7 +605,7 @@ class Workday:
                         By.XPATH,
                         ".//input[@type='text' or @type='email' or @type='tel' or @type='number']",
                     )
-                    if text_inputs:
+                    if text_inputs and element_type == "unknown":
                         element_type = "text_input"
                 except:
                     pass
@@ -569,10 +623,8 @@ class Workday:
                 checkbox_inputs = element.find_elements(
                     By.XPATH, ".//input[@type='checkbox']"
                 )
-                if len(checkbox_inputs) > 1:
+                if checkbox_inputs:
                     element_type = "checkbox"
-                else:
-                    element_type = "radio"
                 # Check for dropdown indicators
                 dropdown_markers = element.find_elements(
                     By.XPATH,
@@ -615,7 +667,7 @@ class Workday:
 
             return element_type
         except Exception as e:
-            print(f"Error detecting element type: {e}")
+            log.warning(f"Error detecting element type: {e}")
             return "unknown"
 
     def find_next_sibling_safely(self, start_element, parent, max_levels=5):
@@ -633,67 +685,71 @@ class Workday:
         try:
             current = start_element
             for level in range(max_levels):
-                print(f"Current level: {current.tag_name, current.text}")
+                log.debug(
+                    "Current level",
+                    tag=lambda: current.tag_name,
+                    text=lambda: current.text,
+                )
                 # First check if there's a sibling at current level
                 siblings = current.find_elements(
                     By.XPATH,
                     "./following-sibling::div//*[@data-automation-id][position()=1]",
                 )
                 if siblings:
-                    print(f"Found sibling at level {level}")
+                    log.debug(f"Found sibling at level {level}")
                     return siblings[0], level, False
-                print("HEREE1")
+                log.debug("HEREE1")
                 if not siblings:
-                    print("HEREE")
+                    log.debug("HEREE")
                     siblings = current.find_elements(
                         By.XPATH, "./following-sibling::div//*[@id][position()=1]"
                     )
                     if siblings:
-                        print(
-                            f"Found sibling at level {level} sibling container: {siblings[0].tag_name, siblings[0].text}"
+                        log.debug(
+                            f"Found sibling at level {level} sibling container",
+                            tag=lambda: siblings[0].tag_name,
+                            text=lambda: siblings[0].text,
                         )
                         return siblings[0], level, True
                 # If no siblings, try to go up one level
                 try:
                     # Verify we actually moved up (parent should be different from current)
                     if parent.data_automation_id == current.data_automation_id:
-                        print(f"Reached same element at level {level}, stopping")
+                        log.debug(f"Reached same element at level {level}, stopping")
                         return None, level, False
                 except:
-                    print(f"didn't find parent at level: {level} Continue")
+                    log.debug(f"didn't find parent at level: {level} Continue")
                 current = current.find_element(By.XPATH, "./..")
             return None, max_levels, False
 
         except Exception as e:
-            print(f"Error in safe navigation: {e}")
+            log.warning(f"Error in safe navigation: {e}")
             return None, 0, False
 
+    @traced()
     def fillform_page_1(self):
         try:
-            self.driver.find_element(
-                By.CSS_SELECTOR, "input[data-automation-id='file-upload-input-ref']"
-            ).send_keys(self.profile["resume_path"])
-            time.sleep(1)
+            self.driver.find_element(*RESUME_UPLOAD_LOCATOR).send_keys(self.profile["resume_path"])
+            self.waits.wait("resume_upload", dom_idle(), 1)
         except Exception as e:
-            print("Exception: 'Missmatch in order'", e)
+            log.warning(f"Exception: 'Missmatch in order' {e}")
             return False
         return True
 
-    def handle_questions(self, step):
-        # Ensure page is fully loaded before searching for fields
-        time.sleep(2)
-        self._wait_for_page_load()
+    def _extract_questions_fallback(self):
+        """
+        Find required questions and their input containers one WebDriver call at a time
+
+        Only used when the in-page extractor can't run.
 
+        Returns:
+            list: (question_text, container, automation_id) tuples
+        """
         # Find required fields using the asterisk marker
         required_fields = self.driver.find_elements(By.XPATH, "//abbr[text()='*']")
-        print(f"\nFound {len(required_fields)} required fields")
-
-        # Additional wait to ensure all elements are stable
-        time.sleep(1)
+        log.info(f"\nFound {len(required_fields)} required fields")
 
         questions = []
-        handled_questions = []  # Keep track of questions that were successfully handled
-        unhandled_questions = []  # Keep track of questions that couldn't be handled
         # Process all required fields (including the first one, which was previously skipped)
         for field in required_fields[1:]:
             # Wrap entire field processing in try-except to continue if one field fails
@@ -716,8 +772,9 @@ class Workday:
                 parent = question.find_element(
                     By.XPATH, "./ancestor::div[@data-automation-id][position()=1]"
                 )
-                print(
-                    f"Parent automation-id: {parent.get_attribute('data-automation-id')}"
+                log.debug(
+                    "Parent",
+                    automation_id=lambda: parent.get_attribute("data-automation-id"),
                 )
                 # Before trying to find the input container, make sure the DOM has stabilized
                 self._wait_for_element_stability(parent)
@@ -729,19 +786,21 @@ class Workday:
 
                 # Skip if we couldn't find the input container
                 if not container:
-                    print(
+                    log.warning(
                         f"Could not find input container for question: {question_text}"
                     )
                     continue
 
-                print("Question tag name:", question.tag_name, "Text:", question.text)
-                print(
-                    "Container tag name:",
-                    container.tag_name,
-                    "Text:",
-                    container.text,
-                    "Type:",
-                    container.get_attribute("type"),
+                log.debug(
+                    "Question",
+                    tag=lambda: question.tag_name,
+                    text=lambda: question.text,
+                )
+                log.debug(
+                    "Container",
+                    tag=lambda: container.tag_name,
+                    text=lambda: container.text,
+                    type=lambda: container.get_attribute("type"),
                 )
 
                 # Get the automation ID to uniquely identify this element
@@ -753,109 +812,93 @@ class Workday:
 
                 # Skip if we couldn't find an automation ID or another identifier
                 if not automation_id:
-                    print(f"No automation ID found for question: {question_text}")
+                    log.info(f"No automation ID found for question: {question_text}")
                     continue
-                print(f"\nQuestion: {question_text}")
-                print(f"Element automation-id: {automation_id}")
+                log.info(f"\nQuestion: {question_text}")
+                log.info(f"Element automation-id: {automation_id}")
                 questions.append((question_text, container, automation_id))
             except Exception as e:
-                print(f"Error processing field: {e}")
+                log.warning(f"Error processing field: {e}")
                 continue
 
-        keyword_embeddings = []
-        similarity_scores = []
-        embeddingsToValues = {}
-        # Initialize embeddingsToValues, and get keyword embeddings
-        for keywords, value in self.questionsToActions:
-            keyword_embedding = self.model.encode(keywords, convert_to_tensor=True)
-            keyword_embeddings.append(keyword_embedding)
-            # Store the value to be used with the dynamically determined action
-            embeddingsToValues[keyword_embedding] = value
-
-        for question_text, input_element, automation_id in questions:
+        return questions
+
+    @traced()
+    def handle_questions(self, step):
+        # Ensure page is fully loaded before searching for fields
+        self._wait_for_page_load(site="questions_page", legacy_seconds=4)
+
+        questions = []
+        handled_questions = []  # Keep track of questions that were successfully handled
+        unhandled_questions = []  # Keep track of questions that couldn't be handled
+        # New page, so previously classified elements are gone
+        self.element_types.clear()
+        self.commands.set_step("extraction")
+        try:
+            # Scan the whole page in one round trip instead of several per field
+            extracted = extract_questions(self.driver)
+            log.info(f"\nFound {len(extracted)} required questions")
+            for item in extracted:
+                log.info(f"\nQuestion: {item['question']}")
+                log.info(
+                    f"Element automation-id: {item['automation_id']}, type: {item['element_type']}, options: {item['options']}"
+                )
+                questions.append(
+                    (item["question"], item["container"], item["automation_id"])
+                )
+                self.element_types.record(item["container"], item["element_type"])
+        except Exception as e:
+            log.warning(
+                f"Error extracting questions in page, falling back to DOM walk: {e}"
+            )
+            questions = self._extract_questions_fallback()
+
+        # Exact and learned answers need no model, so only the remaining
+        # questions go through it, all in a single batch
+        self.commands.set_step("matching")
+        resolutions = self._question_resolver().resolve(
+            [question_text for question_text, _, _ in questions]
+        )
+
+        self.commands.set_step("filling")
+
+        for question_index, (question_text, input_element, automation_id) in enumerate(
+            questions
+        ):
             try:
                 handled = False
                 best_match_score = 0
                 best_match_action = None
                 best_match_value = None
+                resolution = resolutions[question_index]
 
-                # First try exact text matching (case insensitive) as it's more reliable
-                question_lower = question_text.lower().strip()
-                exact_match_found = False
-                print("input element before detection attempt", input_element.tag_name)
-                # Try to find exact matches first
-                for keywords, value in self.questionsToActions:
-                    for keyword in keywords:
-                        if keyword.lower().strip() == question_lower:
-                            print(f"EXACT MATCH found for question: '{question_text}'")
-                            # Determine the action based on element type
-                            element_type = self._detect_element_type(input_element)
-                            print(f"Detected element type: {element_type}")
-                            best_match_action = self.element_type_handlers.get(
-                                element_type, self.element_type_handlers["unknown"]
-                            )
-                            best_match_value = value
-                            print(
-                                f"Matched to element type: {element_type}, action: {best_match_action.__name__}, value: {value}"
-                            )
-                            best_match_score = 1.0
-                            exact_match_found = True
-                            break
-                    if exact_match_found:
-                        break
-
-                # If exact match wasn't found, try embedding similarity
-                if not exact_match_found:
-                    print(
-                        f"No exact match for '{question_text}', trying semantic matching..."
-                    )
-
-                    # Encode the current question
-                    question_embedding = self.model.encode(
-                        question_text, convert_to_tensor=True
-                    )
-
-                    # Calculate similarity scores
-                    similarity_scores = [
-                        (
-                            float(
-                                util.pytorch_cos_sim(
-                                    question_embedding, keyword_embedding
-                                ).mean()
-                            ),
-                            keyword_embedding,
-                        )
-                        for keyword_embedding in keyword_embeddings
-                    ]
-
-                    # Get the best match
-                    max_score, keyword_embedding = max(
-                        similarity_scores, key=itemgetter(0)
-                    )
-                    print(
-                        f"Best semantic match score: {max_score:.4f} for '{question_text}'"
+                log.debug(
+                    "Input element before detection attempt",
+                    tag=lambda: input_element.tag_name,
+                )
+                if resolution is not None:
+                    source = " (memoized)" if resolution.cached else ""
+                    log.info(
+                        f"{resolution.tier.upper()} match{source} for question: '{question_text}', "
+                        f"score: {resolution.score:.4f}"
                     )
-
                     # Determine the action based on element type
-                    element_type = self._detect_element_type(input_element)
-                    print(f"Detected element type: {element_type}")
-
+                    element_type = self.element_types.get(input_element)
+                    log.info(f"Detected element type: {element_type}")
                     best_match_action = self.element_type_handlers.get(
                         element_type, self.element_type_handlers["unknown"]
                     )
-                    best_match_value = embeddingsToValues[keyword_embedding]
-
-                    print(
+                    best_match_value = resolution.value
+                    log.info(
                         f"Matched to element type: {element_type}, action: {best_match_action.__name__}, value: {best_match_value}"
                     )
-
-                    best_match_score = max_score
+                    best_match_score = resolution.score
 
                 # Lower the threshold slightly to handle more questions
                 if (
                     best_match_score > 0.55
                 ):  # Adjusted threshold for what counts as a "match"
-                    print(
+                    log.info(
                         f"Executing action for question: {question_text} with best match score of: {best_match_score}, value: {best_match_value}"
                     )
                     action_result = (
@@ -865,26 +908,29 @@ class Workday:
                         if best_match_value is not None
                         else best_match_action(input_element, automation_id)
                     )
-                    time.sleep(3)  # Reduced wait time for better performance
+                    self.waits.wait(
+                        "after_action", dom_idle(input_element), 3
+                    )  # Let the page react to the answer before the next question
                     if action_result:
-                        print(f"Action successful: {best_match_action.__name__}")
+                        log.info(f"Action successful: {best_match_action.__name__}")
                         # Track this question as handled
                         handled_questions.append(
                             (
                                 question_text,
                                 best_match_action.__name__,
                                 best_match_value,
+                                resolution.tier,
                             )
                         )
                     else:
-                        print(f"Action failed: {best_match_action.__name__}")
+                        log.warning(f"Action failed: {best_match_action.__name__}")
                     handled = True
                 # Secondary threshold for "likely" matches
                 elif best_match_score > 0.4 and step != 4:
-                    print(
+                    log.info(
                         f"Possible match for question: {question_text} with score: {best_match_score}, value: {best_match_value}"
                     )
-                    print("Trying best guess match...")
+                    log.info("Trying best guess match...")
                     action_result = (
                         best_match_action(
                             input_element, automation_id, values=best_match_value
@@ -893,28 +939,29 @@ class Workday:
                         else best_match_action(input_element, automation_id)
                     )
                     if action_result:
-                        print(f"Action successful: {best_match_action.__name__}")
+                        log.info(f"Action successful: {best_match_action.__name__}")
                         # Track this question as handled
                         handled_questions.append(
                             (
                                 question_text,
                                 best_match_action.__name__,
                                 best_match_value,
+                                resolution.tier,
                             )
                         )
                         handled = True
                     else:
-                        print(f"Action failed: {best_match_action.__name__}")
+                        log.warning(f"Action failed: {best_match_action.__name__}")
 
                 # Check if we have any learned mappings for this question
                 if not handled:
                     unhandled_questions.append(
                         (question_text, input_element, automation_id)
                     )
-                print("handled?", handled, question_text)
+                log.debug(f"handled? {handled} {question_text}")
                 if not handled:
 
-                    print(
+                    log.warning(
                         f"No matching action found for question: {question_text}. Please fill manually"
                     )
 
@@ -924,8 +971,8 @@ class Workday:
                     )
 
                     # Activate learning mode
-                    element_type = self._detect_element_type(input_element)
-                    print(f"Detected element type: {element_type}")
+                    element_type = self.element_types.get(input_element)
+                    log.info(f"Detected element type: {element_type}")
 
                     # Start real-time observation
                     self.learner.start_observation(
@@ -952,10 +999,10 @@ class Workday:
                     )
 
                     # Wait for user to interact with the element
-                    print(
+                    log.warning(
                         "\nPlease manually fill out this field. Press Enter AFTER you've completed your interaction."
                     )
-                    input("\n[Press Enter when you've completed the interaction]")
+                    self._prompt("\n[Press Enter when you've completed the interaction]")
 
                     # Restore original style
                     self.driver.execute_script(
@@ -968,118 +1015,105 @@ class Workday:
                     self.learner.end_observation()
 
                     # Verify the field was filled
-                    print("Checking if field was successfully filled...")
+                    log.info("Checking if field was successfully filled...")
 
                     # Basic verification (may need enhancement for specific element types)
                     try:
                         if element_type == "text_input":
                             value = input_element.get_attribute("value")
                             if value:
-                                print(f"Field filled with: '{value}'")
+                                log.info(f"Field filled with: '{value}'")
                             else:
-                                print(
+                                log.warning(
                                     "Field appears to be empty. Did you fill it correctly?"
                                 )
-                                input(
-                                    "Press Enter to continue anyway, or Ctrl+C to interrupt."
+                                self._prompt(
+                                    "Press Enter to continue anyway, or Ctrl+C to interrupt.",
+                                    required=False,
                                 )
                         elif element_type in ["checkbox", "radio"]:
                             checked = input_element.is_selected()
-                            print(f"Checkbox/Radio selected: {checked}")
+                            log.info(f"Checkbox/Radio selected: {checked}")
                     except:
-                        print("Unable to verify field completion, continuing anyway")
+                        log.warning(
+                            "Unable to verify field completion, continuing anyway"
+                        )
             except Exception as question_error:
-                print(f"Error processing question: {question_error}")
+                log.warning(f"Error processing question: {question_error}")
                 unhandled_questions.append(
                     (question_text, input_element, automation_id)
                 )
-                print("Continuing with next question...")
+                log.info("Continuing with next question...")
         # Summarize what happened with all questions
         try:
             # Simplify handling check to just count how many items are in handled_questions
             handled_count = len(handled_questions)
-            print(f"\n===== Question Processing Summary =====")
-            print(
+            log.info(f"\n===== Question Processing Summary =====")
+            log.info(
                 f"Found {len(questions)} questions, successfully handled {handled_count}"
             )
+            tier_counts = {}
+            for resolution in resolutions:
+                tier = resolution.tier if resolution is not None else "unresolved"
+                tier_counts[tier] = tier_counts.get(tier, 0) + 1
+            log.info(
+                "Resolved by tier: "
+                + ", ".join(f"{tier}={count}" for tier, count in tier_counts.items())
+            )
 
             # Display successfully handled questions
-            print("\n--- Successfully Handled Questions: ---")
-            for q_text, action_name, value in handled_questions:
-                print(
-                    f"✅ SUCCESS | Action: {action_name} | Q: '{q_text}' | Value: '{value}'"
+            log.info("\n--- Successfully Handled Questions: ---")
+            for q_text, action_name, value, tier in handled_questions:
+                log.info(
+                    f"✅ SUCCESS | Tier: {tier} | Action: {action_name} | Q: '{q_text}' | Value: '{value}'"
                 )
 
             # Display all questions with their status
-            print("\n--- All Questions Status: ---")
+            log.info("\n--- All Questions Status: ---")
             for q, i, aid in questions:
                 matched = False
-                for handled_q, _, _ in handled_questions:
+                for handled_q, _, _, _ in handled_questions:
                     if q == handled_q:
                         matched = True
                         break
                 status = "✅ HANDLED" if matched else "❌ FAILED/UNHANDLED"
-                print(f"{status} | Q: '{q}' -> automation-id: {aid}")
+                log.info(f"{status} | Q: '{q}' -> automation-id: {aid}")
 
             not_handled_count = len(questions) - handled_count
             if not_handled_count > 0:
-                print(
+                log.warning(
                     f"\n⚠️ WARNING: {not_handled_count} questions were not successfully handled"
                 )
-                print("These questions may need manual attention.")
+                log.warning("These questions may need manual attention.")
 
         except Exception as summary_error:
-            print(f"Error generating summary: {summary_error}")
+            log.warning(f"Error generating summary: {summary_error}")
 
-        input("\nPress Enter to continue after reviewing the questions...")
+        self._prompt(
+            "\nPress Enter to continue after reviewing the questions...",
+            required=False,
+        )
         return (True, unhandled_questions)
 
     def _check_if_job_closed_or_error(self):
         """Check if the current page indicates the job is closed or no longer available"""
         try:
-            # Common error messages suggesting the job is closed
-            job_closed_messages = [
-                "//div[contains(text(), 'no longer accepting applications')]",
-                "//div[contains(text(), 'position has been filled')]",
-                "//div[contains(text(), 'job posting has closed')]",
-                "//div[contains(text(), 'position is no longer available')]",
-                "//p[contains(text(), 'no longer accepting')]",
-                "//div[contains(text(), 'has been removed')]",
-            ]
-
-            # Check for any of these messages
-            for message_xpath in job_closed_messages:
-                elements = self.driver.find_elements(By.XPATH, message_xpath)
-                if elements:
-                    print(f"⚠️ JOB POSTING CLOSED: {elements[0].text}")
-                    print("The job is no longer accepting applications.")
-                    raise Exception("Job posting closed during application process")
-
-            # Also check the page text for indicators
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-            closed_phrases = [
-                "no longer accepting",
-                "position filled",
-                "job closed",
-                "posting closed",
-                "position unavailable",
-                "job has been removed",
-                "requisition closed",
-            ]
-
-            for phrase in closed_phrases:
-                if phrase in page_text:
-                    print(
-                        f"⚠️ JOB POSTING LIKELY CLOSED: Found phrase '{phrase}' on page after clicking Next"
-                    )
-                    print("This job appears to no longer be accepting applications.")
-                    raise Exception("Job posting closed during application process")
-
-        except Exception as e:
-            if "Job posting closed" in str(e):
-                raise e  # Re-raise the job closed exception
-            # Ignore other errors, let the application continue
+            verdict = detect_job_closed(self.driver)
+        except Exception:
+            # Ignore errors, let the application continue
+            return
+        if verdict["closed"]:
+            if verdict["reason"] == "message":
+                log.warning(f"⚠️ JOB POSTING CLOSED: {verdict['text']}")
+                log.warning("The job is no longer accepting applications.")
+            else:
+                log.warning(
+                    f"⚠️ JOB POSTING LIKELY CLOSED: Found phrase '{verdict['match']}' on page after clicking Next"
+                )
+                log.warning("This job appears to no longer be accepting applications.")
+            raise Exception("Job posting closed during application process")
 
+    @traced()
     def click_next(self):
         """Click the Next/Continue button to proceed to the next page"""
         try:
@@ -1092,7 +1126,7 @@ class Workday:
                     )
                 )
             )
-            print(f"Clicking navigation button: '{button.text}'")
+            log.info("Clicking navigation button", text=lambda: button.text)
             button.click()
 
             # Wait for page transition
@@ -1102,13 +1136,11 @@ class Workday:
             self._check_if_job_closed_or_error()
 
         except Exception as e:
-            print(f"Exception: 'No button for Next/Continue': {e}")
+            log.warning(f"Exception: 'No button for Next/Continue': {e}")
 
         # Check for errors after clicking
         try:
-            error_button = self.driver.find_element(
-                By.CSS_SELECTOR, "button[data-automation-id='errorBanner']"
-            )
+            error_button = self.driver.find_element(*ERROR_BANNER_LOCATOR)
 
             # Check specifically for job posting closed errors in the error banner
             error_text = error_button.text.lower()
@@ -1121,18 +1153,24 @@ class Workday:
                     "posting closed",
                 ]
             ):
-                print(
+                log.warning(
                     "⚠️ ERROR: The job posting appears to have closed during the application process."
                 )
-                print("This job is no longer accepting applications.")
+                log.warning("This job is no longer accepting applications.")
                 raise Exception("Job posting closed during application process")
 
-            print(
+            log.warning(
                 "Exception: 'Errors on page. Please resolve and submit manually. You have 60 seconds to do so!'"
             )
-            time.sleep(60)
+            # Waits on a human, so the timeout is never tightened
+            self.waits.wait(
+                "error_banner_resolved",
+                element_absent(ERROR_BANNER_LOCATOR),
+                60,
+                adaptive=False,
+            )
         except:
-            print("No errors detected on page")
+            log.info("No errors detected on page")
 
     def check_for_submit_button(self):
         """Check if there's a submit button on the page and return True if found"""
@@ -1156,7 +1194,7 @@ class Workday:
                     )
                 )
             )
-            print(f"Clicking submit button: '{submit_button.text}'")
+            log.info("Clicking submit button", text=lambda: submit_button.text)
             submit_button.click()
 
             # Wait for confirmation page
@@ -1168,90 +1206,66 @@ class Workday:
                     By.XPATH,
                     "//*[contains(text(), 'submitted') or contains(text(), 'thank you') or contains(text(), 'confirmation')]",
                 )
-                print("Application submitted successfully!")
-                print(f"Confirmation message: {confirmation.text}")
+                log.info("Application submitted successfully!")
+                log.info("Confirmation message", text=lambda: confirmation.text)
             except:
-                print("No confirmation message found, but submission appears complete")
+                log.info(
+                    "No confirmation message found, but submission appears complete"
+                )
 
             return True
         except Exception as e:
-            print(f"Error submitting application: {e}")
+            log.error(f"Error submitting application: {e}")
             return False
 
-    def _wait_for_page_load(self, timeout=10):
-        """Wait for page to load completely after navigation"""
+    @traced(category="wait")
+    def _wait_for_page_load(self, timeout=10, site="page_load", legacy_seconds=2):
+        """Wait for page to load completely (including AJAX updates) after navigation"""
+        ready = self.waits.wait(
+            site, dom_idle(quiet_ms=500), legacy_seconds, timeout=timeout
+        )
+        if not ready:
+            log.warning(f"Page did not become idle within {timeout} seconds")
+        return ready
+
+    @traced(detail=lambda args, kwargs: {"url": args[0].url})
+    def apply(self):
+        """
+        Apply to the posting, then report where the job's WebDriver round
+        trips went
+
+        Returns:
+            bool: False if the job was closed or the application failed
+        """
         try:
-            # Wait for document ready state
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                page_state = self.driver.execute_script("return document.readyState;")
-                if page_state == "complete":
-                    # Additional wait for any AJAX operations
-                    time.sleep(2)
-                    return True
-                time.sleep(0.5)
-            print("Page did not reach 'complete' state within timeout")
-            return False
-        except Exception as e:
-            print(f"Error waiting for page load: {e}")
-            # Fallback to fixed wait
-            time.sleep(5)
-            return False
+            return self._apply()
+        finally:
+            self.commands.report()
+            self.commands.uninstall()
 
-    def apply(self):
+    def _apply(self):
+        self.commands.set_phase("job page")
         try:
             parsed_url = urlparse(self.url)
-            print("parsed_url:", parsed_url)
+            log.info(f"parsed_url: {parsed_url}")
             company = parsed_url.netloc.split(".")[0]
-            existing_company = company in self.config.read_companies()
-            print("company subdomain:", company)
+            existing_company = self.config.has_company(company)
+            log.info(f"company subdomain: {company}")
+            self.waits.tenant = company
+            report_first_get()
             self.driver.get(self.url)  # Open a webpage
-            time.sleep(4)
+            self.waits.wait("job_page", dom_idle(), 4)
 
             # First check if job is no longer available
             try:
-                # Look for common messages indicating the job posting is closed
-                job_closed_messages = [
-                    "//div[contains(text(), 'no longer accepting applications')]",
-                    "//div[contains(text(), 'position has been filled')]",
-                    "//div[contains(text(), 'This job is closed')]",
-                    "//div[contains(text(), 'job posting has closed')]",
-                    "//div[contains(text(), 'job posting has been removed')]",
-                    "//div[contains(text(), 'position is no longer available')]",
-                    "//div[contains(text(), 'job requisition has been closed')]",
-                    "//p[contains(text(), 'no longer accepting applications')]",
-                ]
-
-                # Check for any of these messages
-                for message_xpath in job_closed_messages:
-                    elements = self.driver.find_elements(By.XPATH, message_xpath)
-                    if elements:
-                        print(f"⚠️ JOB POSTING CLOSED: {elements[0].text}")
-                        print("This job is no longer accepting applications.")
-                        return False
-
-                # Also check the page text for indicators
-                page_text = self.driver.find_element(By.TAG_NAME, "body").text.lower()
-                closed_phrases = [
-                    "no longer accepting",
-                    "position filled",
-                    "job closed",
-                    "posting closed",
-                    "position unavailable",
-                ]
-                for phrase in closed_phrases:
-                    if phrase in page_text:
-                        print(
-                            f"⚠️ JOB POSTING LIKELY CLOSED: Found phrase '{phrase}' on page"
-                        )
-                        print(
-                            "This job appears to no longer be accepting applications."
-                        )
-                        return False
-
+                verdict = detect_job_closed(self.driver)
+                if verdict["closed"]:
+                    log.warning(f"⚠️ JOB POSTING CLOSED: {verdict['text']}")
+                    log.warning("This job is no longer accepting applications.")
+                    return False
             except Exception as e:
                 # If error checking, continue with the application process
-                print(f"Error checking if job is closed: {e}")
+                log.warning(f"Error checking if job is closed: {e}")
 
             # Try to click the Apply button
             try:
@@ -1260,35 +1274,25 @@ class Workday:
                     "a[role='button'][data-uxi-element-id='Apply_adventureButton']",
                 )
                 apply_button.click()
-                time.sleep(2)
+                self.waits.wait("apply_clicked", dom_idle(), 2)
             except Exception as e:
-                print("No Apply button found, checking if job might be closed...", e)
+                log.info(
+                    f"No Apply button found, checking if job might be closed... {e}"
+                )
 
                 # Additional check - if no Apply button is found, do a more thorough check
                 try:
-                    # Check if any job-closed indicators are present
-                    page_text = self.driver.find_element(
-                        By.TAG_NAME, "body"
-                    ).text.lower()
-                    closed_phrases = [
-                        "no longer accepting",
-                        "position filled",
-                        "job closed",
-                        "posting closed",
-                        "position unavailable",
-                        "removed",
-                    ]
-                    for phrase in closed_phrases:
-                        if phrase in page_text:
-                            print(
-                                f"⚠️ JOB POSTING LIKELY CLOSED: Found phrase '{phrase}' on page and no Apply button"
-                            )
-                            print(
-                                "This job appears to no longer be accepting applications."
-                            )
-                            return False
+                    verdict = detect_job_closed(self.driver, extra_phrases=("removed",))
+                    if verdict["closed"]:
+                        log.warning(
+                            f"⚠️ JOB POSTING LIKELY CLOSED: Found '{verdict['match']}' on page and no Apply button"
+                        )
+                        log.warning(
+                            "This job appears to no longer be accepting applications."
+                        )
+                        return False
 
-                    print(
+                    log.info(
                         "No Apply button found, but job doesn't appear to be closed. Continuing..."
                     )
                 except:
@@ -1298,10 +1302,10 @@ class Workday:
                 already_applied = self.driver.find_element(
                     By.CSS_SELECTOR, "[data-automation-id='alreadyApplied']"
                 )
-                print("You have already applied to this job.")
+                log.info("You have already applied to this job.")
                 return True
             except Exception as e:
-                print("No already applied message found, continuing...", e)
+                log.info(f"No already applied message found, continuing... {e}")
             # Try autofill with resume
             try:
                 button = self.driver.find_element(
@@ -1309,33 +1313,45 @@ class Workday:
                     "a[role='button'][data-automation-id='autofillWithResume']",
                 )
                 button.click()
-                time.sleep(2)
+                self.waits.wait("autofill_clicked", dom_idle(), 2)
             except Exception as e:
-                print("No autofill resume button found", e)
-            print("existing_company:", existing_company)
+                log.info(f"No autofill resume button found {e}")
+            log.info(f"existing_company: {existing_company}")
+            self.commands.set_phase("auth")
             try:
-                time.sleep(2)
-                if existing_company:
+                self.waits.wait("auth_start", dom_idle(), 2)
+                if self._session_still_signed_in():
+                    log.info("Reusing signed-in session, skipping signin")
+                elif existing_company:
                     self.signin()
                 else:
                     self.signup()
-                    self.config.write_company(company)
+                    self.config.write_company(company, account_state="created")
             except Exception as e:
-                print(f"Error logging in or creating acct: {e}")
-                input("Press Enter when you're ready to continue...")
+                log.warning(f"Error logging in or creating acct: {e}")
+                self._prompt("Press Enter when you're ready to continue...")
 
-            time.sleep(6)
-            p_tags = self.driver.find_elements(
-                By.XPATH, "//p[contains(text(), 'verify')]"
+            self.waits.wait(
+                "after_auth",
+                element_present(RESUME_UPLOAD_LOCATOR, VERIFY_MESSAGE_LOCATOR),
+                6,
             )
+            p_tags = self.driver.find_elements(*VERIFY_MESSAGE_LOCATOR)
             if len(p_tags) > 0:
-                print("Verification needed")
-                input(
+                log.warning("Verification needed")
+                self._prompt(
                     "Please verify your account and press Enter when you're ready to continue..."
                 )
+            if self.session is not None:
+                self.session.authenticated = True
+            try:
+                self.config.record_signin(company)
+            except Exception as e:
+                log.warning(f"Error recording signin for {company}: {e}")
+            self.commands.set_phase("resume upload")
             step1 = self.fillform_page_1()
             if not step1:
-                input("Press Enter when you're ready to continue with page 1...")
+                self._prompt("Press Enter when you're ready to continue with page 1...")
             self.click_next()
             try:
                 current_page = 2
@@ -1343,24 +1359,27 @@ class Workday:
 
                 # Loop until we find a submit button or reach max pages
                 while current_page <= max_pages:
-                    print(f"\n--- Processing Page {current_page} ---")
+                    log.info(f"\n--- Processing Page {current_page} ---")
+                    self.commands.set_phase(f"page {current_page}")
 
                     # Check if we've reached the submission page
                     if self.check_for_submit_button():
-                        print("Found submit button - final page reached!")
-                        print(
+                        log.info("Found submit button - final page reached!")
+                        log.info(
                             "Immediately submitting without processing additional fields..."
                         )
 
                         # Submit the application immediately without processing questions
-                        print("Submitting application...")
+                        log.info("Submitting application...")
                         submit_result = self.submit_application()
 
                         if submit_result:
-                            print("🎉 Application submitted successfully! 🎉")
+                            log.info("🎉 Application submitted successfully! 🎉")
                         else:
-                            print("⚠️ There may have been an issue with submission")
-                            input(
+                            log.warning(
+                                "⚠️ There may have been an issue with submission"
+                            )
+                            self._prompt(
                                 "Please check the application status and press Enter to continue..."
                             )
 
@@ -1373,7 +1392,7 @@ class Workday:
 
                         if current_page == 3:
                             # Some workday forms have a page that just displays resume info
-                            print(
+                            log.info(
                                 "Resume information page detected, skipping processing"
                             )
                             success = True
@@ -1383,17 +1402,19 @@ class Workday:
                             )
 
                         if success:
-                            print(f"Successfully completed page {current_page}")
+                            log.info(f"Successfully completed page {current_page}")
                             self.click_next()  # This also checks for job closed status
                             # Wait additional time for page transition
                             self._wait_for_page_load()
                             current_page += 1
                         else:
-                            print("unsuccessful_questions", unsucessful_questions)
-                            print(
+                            log.warning(
+                                f"unsuccessful_questions {unsucessful_questions}"
+                            )
+                            log.warning(
                                 f"Issues on page {current_page}, waiting for manual intervention"
                             )
-                            input(
+                            self._prompt(
                                 "Press Enter when you've fixed the issues and are ready to continue..."
                             )
                             self.click_next()
@@ -1401,14 +1422,14 @@ class Workday:
                     except Exception as e:
                         # Check specifically for job closed exception
                         if "Job posting closed" in str(e):
-                            print(
+                            log.warning(
                                 "⚠️ Job posting is no longer available. Moving to next job in list."
                             )
                             # Exit the page processing loop and move to the next job
                             break
 
-                        print(f"Exception on page {current_page}: {e}")
-                        input(
+                        log.warning(f"Exception on page {current_page}: {e}")
+                        self._prompt(
                             "Press Enter when you've fixed the issues and are ready to continue..."
                         )
                         try:
@@ -1417,35 +1438,69 @@ class Workday:
                         except Exception as next_err:
                             # Check if this is a job closed error
                             if "Job posting closed" in str(next_err):
-                                print(
+                                log.warning(
                                     "⚠️ Job posting is no longer available. Moving to next job in list."
                                 )
                                 # Exit the page processing loop and move to the next job
                                 break
 
-                            print(
+                            log.warning(
                                 "Unable to continue automatically. Please navigate to the next page manually."
                             )
-                            input("Press Enter when you're on the next page...")
+                            self._prompt("Press Enter when you're on the next page...")
                             current_page += 1
 
                 if current_page > max_pages:
-                    print("Reached maximum page limit without finding a submit button.")
-                    print("Please complete the remaining steps manually.")
-                    input("Press Enter when you've finished the application...")
+                    log.warning(
+                        "Reached maximum page limit without finding a submit button."
+                    )
+                    log.warning("Please complete the remaining steps manually.")
+                    self._prompt("Press Enter when you've finished the application...")
 
-                print("Form completion finished")
-                self.driver.quit()
+                log.info("Form completion finished")
+                self._close_browser()
             except Exception as e:
-                print(f"Fatal error in form processing: {e}")
-                self.driver.quit()
+                log.error(f"Fatal error in form processing: {e}")
+                self._close_browser(healthy=False)
                 return False
         except Exception as e:
-            print(f"Error in early form processing: {e}")
-            self.driver.quit()
+            log.error(f"Error in early form processing: {e}")
+            self._close_browser(healthy=False)
             return False
         return True
 
+    def _session_still_signed_in(self):
+        """
+        Whether a pooled session is still signed in to this tenant, in which
+        case the Apply flow goes straight to the application form
+        """
+        if self.session is None or not self.session.authenticated:
+            return False
+        self.waits.wait(
+            "session_check",
+            element_present(RESUME_UPLOAD_LOCATOR, PASSWORD_LOCATOR),
+            4,
+        )
+        if self.driver.find_elements(*PASSWORD_LOCATOR):
+            # Workday is asking for credentials again, the session expired
+            self.session.authenticated = False
+            return False
+        return bool(self.driver.find_elements(*RESUME_UPLOAD_LOCATOR))
+
+    def _close_browser(self, healthy=True):
+        """
+        Quit the browser at the end of apply(), unless it belongs to a session
+        pool, which resets and keeps it for the tenant's next posting
+
+        Args:
+            healthy: bool - False if the browser may be in a state that shouldn't be reused
+        """
+        if self.session is None:
+            self.driver.quit()
+        elif not healthy:
+            self.session.healthy = False
+
+    @traced(category="handler", detail=_field_detail)
     def handle_multiselect(self, element, _, values):
         """Handle multi-select dropdowns that require multiple clicks"""
         try:
@@ -1472,71 +1527,50 @@ class Workday:
                         try:
                             input_element = element.find_element(By.XPATH, selector)
                             found = True
-                            print(f"Found input using selector: {selector}")
+                            log.debug(f"Found input using selector: {selector}")
                             break
                         except:
                             continue
 
                     if not found:
-                        print(
+                        log.warning(
                             "Could not find input element within multiselect container, using direct click"
                         )
                         # Fall back to clicking the element directly
                         element.click()
-                        time.sleep(1)
+                        self.waits.wait("multiselect_open", dom_idle(), 1)
                         # Try to find the input element that appeared after clicking
                         input_element = self.driver.find_element(
                             By.XPATH,
                             "//div[contains(@class, 'dropdown') or contains(@class, 'select')]//input[not(ancestor::div[contains(@style, 'display: none')])]",
                         )
 
-            # Clear any existing value first
-            try:
-                input_element.clear()
-            except:
-                pass
-
-            print(f"Entering text '{values}' into multiselect")
-
-            # Convert values to string if it's a list
-            if isinstance(values, list):
-                value_to_use = values[0]  # Use first value if it's a list
-            else:
-                value_to_use = values
-
-            # Send the text value
-            input_element.send_keys(value_to_use)
+            # A short list that is already open is scanned; otherwise search it
+            snapshot = snapshot_options(self.driver, PROMPT_OPTION_SELECTORS)
+            labels = snapshot["labels"]
+            selected = False
+            if 0 < len(labels) <= SEARCH_THRESHOLD:
+                index, score, method = match_option(labels, values)
+                if index is not None and click_option(self.driver, snapshot, index):
+                    log.info(
+                        f"Selected option: '{labels[index]}' ({method} match, score {score:.2f})"
+                    )
+                    self.waits.wait("multiselect_select", dom_idle(), 0.5)
+                    selected = True
 
-            # Short pause to let the dropdown options populate
-            time.sleep(1)
+            if not selected:
+                log.info(f"Searching multiselect for '{values}'")
+                selected = self._search_and_select(
+                    element, input_element, values, labels
+                )
 
-            # Try to find and click matching option
-            try:
-                # Look for option elements that match our text
-                option_xpath = f"//div[contains(@class, 'dropdown') or contains(@class, 'select')]//div[contains(text(), '{value_to_use}') or text()='{value_to_use}']"
-                options = self.driver.find_elements(By.XPATH, option_xpath)
-
-                if options:
-                    # Click the first matching option
-                    print(f"Found matching option: '{options[0].text}'")
-                    self.driver.execute_script("arguments[0].click();", options[0])
-                    time.sleep(0.5)
-                else:
-                    # If no options found, try pressing Enter twice
-                    input_element.send_keys(Keys.ENTER)
-                    time.sleep(0.5)
-                    try:
-                        input_element.send_keys(Keys.ENTER)
-                    except:
-                        # Element might have changed after first Enter
-                        pass
-            except:
-                # Fallback to Enter key if finding options fails
-                input_element.send_keys(Keys.ENTER)
-                time.sleep(0.5)
+            if not selected:
+                # If no option matched, accept whatever the search highlighted
                 try:
                     input_element.send_keys(Keys.ENTER)
+                    self.waits.wait("multiselect_select", dom_idle(), 0.5)
                 except:
+                    # Element might have changed after the search
                     pass
 
             # Wait for the selection to be confirmed
@@ -1559,31 +1593,74 @@ class Workday:
                     )
 
                 if selected_items:
-                    print(
+                    log.info(
                         f"Selection confirmed: Found {len(selected_items)} selected items"
                     )
                     for item in selected_items[:3]:  # Show first 3 items
-                        print(f"  - Selected: '{item.text}'")
+                        log.debug("Selected item", text=lambda: item.text)
             except Exception as verify_error:
-                print(f"Could not verify selection: {verify_error}")
+                log.warning(f"Could not verify selection: {verify_error}")
                 # If we can't verify, continue anyway
                 pass
 
-            print("Multiselect operation completed")
+            log.info("Multiselect operation completed")
             return True
         except Exception as e:
-            print(f"Error in handle_multiselect: {e}")
+            log.warning(f"Error in handle_multiselect: {e}")
             # Try fallback method
             try:
                 return self.answer_dropdown(element, _, values)
             except Exception as e:
-                print(f"Error in using answer_dropdown fallback: {e}")
+                log.warning(f"Error in using answer_dropdown fallback: {e}")
                 return False
 
+    def _search_and_select(self, element, search_input, values, labels=()):
+        """
+        Type a discriminating prefix into a prompt's search box and pick the
+        best match from the filtered results
+
+        Args:
+            element: WebElement - The question's container, watched until it settles
+            search_input: WebElement - The prompt's search box
+            values: str | list - Acceptable answers, the first is searched for
+            labels: list[str] - Options already on screen, used to pick the prefix
+
+        Returns:
+            bool: True if an option was selected
+        """
+        value_list = values if isinstance(values, list) else [values]
+        prefix = search_prefix(value_list[0], labels)
+        try:
+            search_input.clear()
+        except:
+            pass
+        search_input.send_keys(prefix)
+        # Results arrive over XHR; wait until the network and DOM are idle
+        self.waits.wait("dropdown_search", dom_idle(), 1)
+        snapshot = snapshot_options(self.driver, PROMPT_OPTION_SELECTORS)
+
+        if not snapshot["labels"]:
+            # Some prompts only search on Enter
+            search_input.send_keys(Keys.ENTER)
+            self.waits.wait("dropdown_search", dom_idle(), 1)
+            snapshot = snapshot_options(self.driver, PROMPT_OPTION_SELECTORS)
+
+        labels = snapshot["labels"]
+        log.info(f"Search for '{prefix}' returned {len(labels)} options")
+        index, score, method = match_option(labels, values)
+        if index is None or not click_option(self.driver, snapshot, index):
+            return False
+        log.info(
+            f"Selected option: '{labels[index]}' ({method} match, score {score:.2f})"
+        )
+        self._wait_for_element_stability(element)
+        return True
+
+    @traced(category="handler", detail=_field_detail)
     def answer_dropdown(self, element, _, values=""):
         """Handle single-select dropdowns"""
         try:
-            print("Value being selected:", values)
+            log.info(f"Value being selected: {values}")
 
             # Click to open the dropdown (try multiple methods)
             try:
@@ -1596,174 +1673,109 @@ class Workday:
             # Wait for dropdown to fully open and stabilize
             self._wait_for_element_stability(element)
 
-            # Find all options with multiple selectors to be more robust
+            # Capture every option label in one script call, trying multiple
+            # selectors to be more robust
             try:
-                options = self.driver.find_elements(
-                    By.CSS_SELECTOR, "ul[role='listbox'] li[role='option'] div"
-                )
-
-                if not options:
-                    options = self.driver.find_elements(
-                        By.CSS_SELECTOR, "ul[role='listbox'] li[role='option']"
-                    )
-
-                if not options:
-                    # Try another common pattern
-                    options = self.driver.find_elements(
-                        By.CSS_SELECTOR, "div[role='option']"
-                    )
-
-                if not options:
-                    # Last resort, look for any items that appeared after clicking
-                    options = self.driver.find_elements(
-                        By.XPATH,
-                        "//div[contains(@class, 'dropdown') or contains(@class, 'select')]//li",
-                    )
+                snapshot = snapshot_options(self.driver, field=element)
             except Exception as dropdown_error:
-                print(f"Error finding dropdown options: {dropdown_error}")
+                log.warning(f"Error finding dropdown options: {dropdown_error}")
                 return False
 
-            print(f"Found {len(options)} dropdown options")
+            labels = snapshot["labels"]
+            log.info(f"Found {len(labels)} dropdown options")
 
-            if len(options) == 0:
-                print("No dropdown options found")
+            if len(labels) == 0:
+                log.warning("No dropdown options found")
                 return False
 
-            if values == "unknown":
-                # Just pick the first or last option as a fallback
-                negative_options = []
-                for option in options:
-                    option_text = option.text.strip()
-                    if self.detect_negation(option_text):
-                        negative_options.append(option)
-                        if len(negative_options):
-                            # Pick the first negative option
-                            selected_option = negative_options[0]
-                            try:
-                                self.driver.execute_script(
-                                    "arguments[0].click();", selected_option
-                                )
-                                time.sleep(1)
-                                print(
-                                    f"Selected negative option: '{selected_option.text}'"
-                                )
-                                return True
-                            except Exception as click_error:
-                                print(f"Error clicking negative option: {click_error}")
-                    # If no negative options found, fallback to original behavior
-                    # print("No negative options found, using last option as fallback")
-
-                # For known values, try to find the best match
+            def select(index, description):
                 try:
-                    self.driver.execute_script("arguments[0].click();", options[-1])
-                    time.sleep(1)
+                    if not click_option(self.driver, snapshot, index):
+                        log.warning(
+                            f"Dropdown options changed before selecting {description}"
+                        )
+                        return False
+                    log.info(f"Selected {description}: '{labels[index]}'")
+                    # Wait for selection to take effect
+                    self._wait_for_element_stability(element)
                     return True
                 except Exception as click_error:
-                    print(f"Error clicking last option: {click_error}")
+                    log.warning(f"Error clicking {description}: {click_error}")
                     return False
 
-            best_match = None
-            best_score = 0
-
-            # Convert values to a list if it's not already
-            value_list = values if isinstance(values, list) else [values]
-
-            for option in options:
+            if values == "unknown":
+                # Pick the first negative option, else the last option
+                negative = next(
+                    (
+                        index
+                        for index, label in enumerate(labels)
+                        if self.detect_negation(label)
+                    ),
+                    None,
+                )
+                if negative is not None:
+                    return select(negative, "negative option")
+                return select(len(labels) - 1, "last option")
+
+            best_index, best_score, method = match_option(labels, values)
+
+            # Large lists are often only partly rendered, so the answer may not
+            # be among the options yet; search for it unless a rendered option
+            # already matches exactly or by prefix
+            if (
+                best_score < 0.9
+                and len(labels) > SEARCH_THRESHOLD
+                and snapshot["search_box"] is not None
+            ):
+                log.info(f"Searching {len(labels)} options for a better match")
                 try:
-                    option_text = option.text.strip()
-
-                    # Skip empty options
-                    if not option_text:
-                        continue
-
-                    # Try each possible value
-                    for value in value_list:
-                        value_str = str(value).strip()
-                        if not value_str:
-                            continue
-
-                        print(
-                            f"Comparing: '{value_str.lower()}' with '{option_text.lower()}'"
-                        )
-
-                        # Check for exact match
-                        if option_text.lower() == value_str.lower():
-                            best_match = option
-                            best_score = 1.0
-                            print(f"Exact match found for '{value_str}'")
-                            break  # Found exact match, no need to check other values
-
-                        # Check for starts with
-                        if option_text.lower().startswith(value_str.lower()):
-                            if 0.9 > best_score:  # prefer startswith over contains
-                                best_match = option
-                                best_score = 0.9
-                                print(f"Starts-with match found for '{value_str}'")
-
-                        # Check for contains
-                        if value_str.lower() in option_text.lower():
-                            if 0.7 > best_score:
-                                best_match = option
-                                best_score = 0.7
-                                print(f"Contains match found for '{value_str}'")
-
-                    # If we found an exact match for this option, break the outer loop too
-                    if best_score == 1.0:
-                        break
-                except Exception as option_error:
-                    print(f"Error processing option: {option_error}")
-                    continue
+                    if self._search_and_select(
+                        element, snapshot["search_box"], values, labels
+                    ):
+                        return True
+                    # Undo the filter and take the best rendered option instead
+                    snapshot["search_box"].clear()
+                    self.waits.wait("dropdown_search", dom_idle(), 1)
+                except Exception as search_error:
+                    log.warning(f"Error searching dropdown: {search_error}")
+                snapshot = snapshot_options(self.driver, field=element)
+                labels = snapshot["labels"]
+                best_index, best_score, method = match_option(labels, values)
 
             # If we found a good match, click it
-            if best_match and best_score > 0:
-                try:
-                    print(
-                        f"Selected option: '{best_match.text}' with score: {best_score}"
-                    )
-                    self.driver.execute_script("arguments[0].click();", best_match)
-                    # Wait for selection to take effect
-                    self._wait_for_element_stability(element)
-                    return True
-                except Exception as click_error:
-                    print(f"Error clicking best match: {click_error}")
+            if best_index is not None and select(
+                best_index, f"option ({method} match, score {best_score:.2f})"
+            ):
+                return True
 
             # If we get here, we couldn't find a good match
-            print(f"Could not find matching option for: {values}")
-            print(
-                "Available options:", [opt.text for opt in options if opt.text.strip()]
+            log.warning(f"Could not find matching option for: {values}")
+            non_empty = [i for i, label in enumerate(labels) if label]
+            log.debug(
+                "Available options", options=lambda: [labels[i] for i in non_empty]
             )
 
             # As a last resort, select the first non-empty option
-            for option in options:
-                if option.text.strip():
-                    try:
-                        print(
-                            f"Selecting first available option as fallback: {option.text}"
-                        )
-                        self.driver.execute_script("arguments[0].click();", option)
-                        # Wait for selection to take effect
-                        self._wait_for_element_stability(element)
-                        return True
-                    except:
-                        pass
-
+            if non_empty:
+                return select(non_empty[0], "first available option as fallback")
             return False
 
         except Exception as e:
-            print(f"Error in answer_dropdown: {e}")
+            log.warning(f"Error in answer_dropdown: {e}")
             return False
 
+    @traced(category="handler", detail=_field_detail)
     def fill_input(self, element, data_automation_id, values=[]):
         """Handle text input fields"""
         current_value = element.get_attribute("value")
         if current_value == str(values):
-            print(f"Field already has correct value: {values}")
+            log.info(f"Field already has correct value: {values}")
             return True
         try:
-            print(f"Input value: {values}")
+            log.info(f"Input value: {values}")
             # Clear the existing value
             element.clear()
-            time.sleep(1)
+            self.waits.wait("input_cleared", dom_idle(element), 1)
             element = None
             try:
                 element = self.driver.find_element(
@@ -1778,9 +1790,10 @@ class Workday:
             self._wait_for_element_stability(element)
             return True
         except Exception as e:
-            print(f"Error in fill_input: {e}")
+            log.warning(f"Error in fill_input: {e}")
             return False
 
+    @traced(category="handler", detail=_field_detail)
     def select_radio(self, element, data_automation_id, values=""):
         """
         Handle radio button selections with the specific Workday HTML structure
@@ -1792,10 +1805,12 @@ class Workday:
         except Exception as e:
             has_id = False
         try:
-            # Find all radio options within the group
-            radio_options = self.driver.find_elements(
+            # Find all radio options within the group; the whole page only if
+            # the element isn't the group itself, since every group on the
+            # page has the same Yes/No labels
+            radio_options = element.find_elements(
                 By.CSS_SELECTOR, 'div[class*="css-1utp272"]'
-            )
+            ) or self.driver.find_elements(By.CSS_SELECTOR, 'div[class*="css-1utp272"]')
 
             # Convert values to a list if it's not already
             value_list = values if isinstance(values, list) else [values]
@@ -1825,7 +1840,7 @@ class Workday:
                             if word.lower() not in stopwords.stopwords
                         ]
                     )
-                    print(f"Filtered label: {filtered_label}")
+                    log.debug(f"Filtered label: {filtered_label}")
                     # Calculate match score based on token overlap
                     matching_tokens = 0
                     for token in all_value_tokens:
@@ -1840,14 +1855,16 @@ class Workday:
                             if str(value).lower() == label.lower():
                                 score = 1.0
                                 break
-                        print("Score:", score)
+                        log.debug(f"Score: {score}")
 
                         # Keep track of best match
                         if score > best_match_score:
                             best_match_score = score
                             best_match_option = option
 
-                    print(f"Option: '{original_label}', Score: {best_match_score:.2f}")
+                    log.debug(
+                        f"Option: '{original_label}', Score: {best_match_score:.2f}"
+                    )
 
                     # Check for direct match with any of the provided values
                     direct_match = False
@@ -1873,7 +1890,7 @@ class Workday:
                         return True
 
                 except Exception as e:
-                    print(f"Error with option: {e}")
+                    log.warning(f"Error with option: {e}")
                     continue
 
             # If we found a good match but not direct match, use it
@@ -1882,8 +1899,9 @@ class Workday:
                     label_element = best_match_option.find_element(
                         By.CSS_SELECTOR, "label"
                     )
-                    print(
-                        f"Using best match: {label_element.text} with score: {best_match_score:.2f}"
+                    log.info(
+                        f"Using best match with score: {best_match_score:.2f}",
+                        label=lambda: label_element.text,
                     )
                     try:
                         label_element.click()
@@ -1896,13 +1914,13 @@ class Workday:
                     self._wait_for_element_stability(element)
                     return True
                 except Exception as e:
-                    print(f"Error clicking best match option: {e}")
+                    log.warning(f"Error clicking best match option: {e}")
 
             # If no match found
-            print(f"No matching radio option found for value: {values}")
-            print(
-                "Available options:",
-                [
+            log.warning(f"No matching radio option found for value: {values}")
+            log.debug(
+                "Available options",
+                options=lambda: [
                     opt.find_element(By.CSS_SELECTOR, "label").text
                     for opt in radio_options
                 ],
@@ -1910,7 +1928,7 @@ class Workday:
             return False
 
         except Exception as e:
-            print(f"Error in select_radio: {e}")
+            log.warning(f"Error in select_radio: {e}")
             # Fallback - try answer_dropdown as a last resort
             try:
                 return self.answer_dropdown(element, data_automation_id, values)
@@ -1923,26 +1941,63 @@ def show_learning_suggestions(workday):
     try:
         suggestions = workday.learner.generate_suggestions()
         if suggestions:
-            print("\n" + "=" * 80)
-            print("LEARNING SUGGESTIONS")
-            print("=" * 80)
+            log.info("\n" + "=" * 80)
+            log.info("LEARNING SUGGESTIONS")
+            log.info("=" * 80)
             for suggestion in suggestions:
-                print(suggestion)
-            print("\nThese suggestions can help improve the automation in future runs.")
-            print(
+                log.info(suggestion)
+            log.info(
+                "\nThese suggestions can help improve the automation in future runs."
+            )
+            log.info(
                 "Consider adding these mappings to the questionsToActions list in workday.py."
             )
-            print("=" * 80)
+            log.info("=" * 80)
     except Exception as e:
-        print(f"Error generating learning suggestions: {e}")
+        log.warning(f"Error generating learning suggestions: {e}")
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Apply to the jobs in config/jobs.txt")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of applications to run concurrently (default: 1, serial)",
+    )
+    parser.add_argument(
+        "--per-company",
+        type=int,
+        default=1,
+        help="Max concurrent applications per company subdomain (default: 1)",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=("debug", "info", "warning", "error"),
+        help="Lowest log level shown; element details are only read from the "
+        "browser at debug (default: $WORKDAY_LOG_LEVEL or info)",
+    )
+    parser.add_argument(
+        "--log-file",
+        metavar="FILE",
+        help="Also append log records to FILE as JSON lines",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Save a trace of every step, handler and wait as Chrome trace JSON "
+        "(open it in chrome://tracing or ui.perfetto.dev)",
+    )
+    args = parser.parse_args()
+    structured_log.configure(level=args.log_level, jsonl_file=args.log_file)
+    if args.trace:
+        tracing.enable()
+
     # Path to jobs.txt file
     jobs_file = os.path.join(os.path.dirname(__file__), "config", "jobs.txt")
 
     if not os.path.exists(jobs_file):
-        print(f"Error: {jobs_file} not found!")
+        log.error(f"Error: {jobs_file} not found!")
         return
 
     # Read and process URLs from jobs.txt
@@ -1950,35 +2005,71 @@ def main():
         urls = [line.strip() for line in f if line.strip() and not line.startswith("#")]
 
     if not urls:
-        print("No URLs found in jobs.txt. Please add some job URLs to the file.")
+        log.warning("No URLs found in jobs.txt. Please add some job URLs to the file.")
         return
 
-    print(f"Found {len(urls)} jobs to apply for:")
+    log.info(f"Found {len(urls)} jobs to apply for:")
     for i, url in enumerate(urls, 1):
-        print(f"{i}. {url}")
+        log.info(f"{i}. {url}")
 
-    print("\nStarting application process...")
+    log.info("\nStarting application process...")
 
     # Keep a reference to the last workday instance for showing suggestions
     last_workday = None
 
-    for i, url in enumerate(urls, 1):
-        print(f"\nProcessing job {i}/{len(urls)}: {url}")
+    if args.workers > 1:
+        runner = JobRunner(
+            Workday, workers=args.workers, per_company_limit=args.per_company
+        )
+        results = runner.run(urls)
+        last_workday = runner.last_workday
+        log.info("\n===== Job Results =====")
+        for url in urls:
+            log.info(f"{results.get(url, 'not run'):<8} | {url}")
+    else:
+        # Back-to-back postings at the same company reuse the signed-in browser
+        sessions = SessionPool(max_sessions=1)
+        for i, url in enumerate(urls, 1):
+            log.info(f"\nProcessing job {i}/{len(urls)}: {url}")
+            session = None
+            try:
+                session = sessions.acquire(company_subdomain(url))
+                workday = Workday(url, session=session)
+                last_workday = workday
+                workday.apply()
+                log.info(f"Completed job {i}/{len(urls)}")
+            except Exception as e:
+                log.error(f"Error processing job {url}: {e}")
+            finally:
+                if session is not None:
+                    sessions.release(session)
+            try:
+                get_wait_stats().save()
+            except Exception as e:
+                log.warning(f"Error saving wait stats: {e}")
+        sessions.close_all()
+
+    log.info("\nAll jobs processed!")
+    get_wait_stats().report()
+    if args.trace:
         try:
-            workday = Workday(url)
-            last_workday = workday
-            workday.apply()
-            print(f"Completed job {i}/{len(urls)}")
+            spans = tracing.save(args.trace)
+            log.info(f"Saved {spans} trace spans to {args.trace}")
         except Exception as e:
-            print(f"Error processing job {url}: {e}")
-        print("\nWaiting 30 seconds before next application...")
-        time.sleep(30)
-
-    print("\nAll jobs processed!")
+            log.warning(f"Error saving trace: {e}")
+    try:
+        get_wait_stats().save()
+    except Exception as e:
+        log.warning(f"Error saving wait stats: {e}")
 
     # Show learning suggestions after all jobs are processed
     if last_workday:
         show_learning_suggestions(last_workday)
+        try:
+            last_workday.learner.save_learning_data()
+        except Exception as e:
+            log.warning(f"Error saving learning data: {e}")
+    structured_log.close()
 
 
 if __name__ == "__main__":